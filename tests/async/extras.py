@@ -8,6 +8,8 @@ async def main():
     print(videoInfo)
     videoFormats = await Video.getFormats('z0GKGpObgPY')
     print(videoFormats)
+    async for video in Video.getMany(['z0GKGpObgPY', 'E07s5ZYygMg', 'https://youtu.be/K4DyBUG242c'], concurrency = 3):
+        print(video['id'], video['error'])
 
 
     suggestions = await Suggestions.get('NoCopyrightSounds', language = 'en', region = 'US')
@@ -36,6 +38,23 @@ async def main():
         await comments.getNextComments()
     print("Found all comments")
 
+    count = 0
+    async for comment in Comments.iter("_ZdsmLgCVdU"):
+        count += 1
+        if count == 100:
+            break
+    print(f"Comments Streamed: {count}")
+
+    count = 0
+    async for comment in Comments.iter("_ZdsmLgCVdU", replies = True):
+        count += len(comment["replies"])
+        if count >= 100:
+            break
+    print(f"Replies Streamed: {count}")
+
+    newestComments = [comment async for comment in Comments.iter("_ZdsmLgCVdU", sortBy = CommentsSortOrder.newest, maxComments = 50)]
+    print(f"Newest Comments: {len(newestComments)}")
+
     
     print(await Transcript.get("https://www.youtube.com/watch?v=L7kF4MXXCoA"))
 
@@ -57,5 +76,14 @@ async def main():
         await channel.next()
         print(len(channel.result["playlists"]))
 
+    async for page in Channel.iter_playlists("UC_aEa8K-EOJ3D6gOs7HcyNg"):
+        print(page["info"]["title"] if page["info"] else None, len(page["playlists"]), page["hasMorePlaylists"])
+
+    async for channel in Channel.get_many(["UC_aEa8K-EOJ3D6gOs7HcyNg", "UCZFWPqqPkFlNwIxcpsLOwew"], rate = 5):
+        print(channel["id"], channel["channel"]["subscribers"] if channel["channel"] else channel["error"])
+
+    uploads = [video async for video in Channel.iter_uploads("UC_aEa8K-EOJ3D6gOs7HcyNg", since = "K4DyBUG242c")]
+    print(f"New Uploads: {len(uploads)}")
+
 
 asyncio.run(main())
@@ -15,5 +15,10 @@ async def main():
     playlist = await Playlist.get('https://www.youtube.com/watch?v=bplUXwTTgbI&list=PL6edxAMqu2xfxgbf7Q09hSg1qCMfDI7IZ')
     print(playlist)
 
+    count = 0
+    async for video in Playlist.iter_videos('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK'):
+        count += 1
+    print(f'Videos Streamed: {count}')
+
 
 asyncio.run(main())
@@ -27,6 +27,25 @@ async def main():
     print(customResult)
 
 
+    filteredSearch = CustomSearch('NoCopyrightSounds', SearchFilter(type = 'video', duration = 'short', sortBy = 'uploadDate'), language = 'en', region = 'US')
+    filteredResult = await filteredSearch.next()
+    print(filteredResult)
+
+
+    cache = SearchCache()
+    cachedSearch = VideosSearch('NoCopyrightSounds', limit = 5, cache = cache)
+    cachedResult = await cachedSearch.next()
+    print(cachedResult)
+    cachedSearch = VideosSearch('nocopyrightsounds ', limit = 10, cache = cache)
+    cachedResult = await cachedSearch.next()
+    print(cachedResult)
+
+
+    multiSearch = MultiSearch('NoCopyrightSounds', [('en', 'US'), ('en', 'GB'), ('de', 'DE'), ('ja', 'JP')], limit = 5)
+    multiResult = await multiSearch.next()
+    print(multiResult)
+
+
     search = ChannelSearch('Watermelon Sugar', "UCZFWPqqPkFlNwIxcpsLOwew")
     result = await search.next()
     print(result)
@@ -35,6 +54,9 @@ async def main():
     result = await channel.next()
     print(result)
 
+    results = [result async for result in ChannelSearch.iter('The Beatles - Topic', 'UC2XdaAVUannpujzv32jcouQ')]
+    print(f"Channel Search Results: {len(results)}")
+
     """
     channel = ChannelPlaylistSearch('PewDiePie', 'UC-lHJZR3Gqxm24_Vd_AJ5Yw')
     result = await channel.next()
@@ -0,0 +1,157 @@
+'''Measures request latency of the video APIs against a local stand-in for YouTube, which answers every request after a fixed delay.
+
+    python tests/benchmark/latency.py --delay 0.2 --runs 10
+'''
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from youtubesearchpython.core.constants import ResultMode
+from youtubesearchpython.core.video import VideoCore
+
+
+delay = 0.2
+
+
+def playerResponse(videoId: str, clientName: str) -> dict:
+    return {
+        'videoDetails': {
+            'videoId': videoId,
+            'title': 'Stand-in video',
+            'lengthSeconds': '200',
+            'viewCount': '1000',
+            'author': 'Stand-in channel',
+            'channelId': 'UC_aEa8K-EOJ3D6gOs7HcyNg',
+            'isLiveContent': False,
+        },
+        'microformat': {
+            'playerMicroformatRenderer': {
+                'publishDate': '2021-01-01',
+                'uploadDate': '2021-01-01',
+            },
+        },
+        'streamingData': {'formats': [], 'adaptiveFormats': []} if clientName != 'MWEB' else None,
+    }
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        videoId = parse_qs(urlparse(self.path).query)['videoId'][0]
+        time.sleep(delay)
+        content = json.dumps(playerResponse(videoId, body['context']['client']['clientName'])).encode('utf_8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def redirect(request: httpx.Request, port: int) -> None:
+    request.url = request.url.copy_with(scheme='http', host='127.0.0.1', port=port)
+
+
+class StandInTransport(httpx.HTTPTransport):
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        redirect(request, self.port)
+        return super().handle_request(request)
+
+
+class AsyncStandInTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        redirect(request, self.port)
+        return await super().handle_async_request(request)
+
+
+def timeSync(run, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def timeAsync(run, runs: int) -> float:
+    async def measure():
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            await run()
+            timings.append(time.perf_counter() - start)
+        return timings
+    return statistics.median(asyncio.run(measure())) * 1000
+
+
+def main() -> int:
+    global delay
+    parser = argparse.ArgumentParser(description='Measures video API latency against a local stand-in server.')
+    parser.add_argument('--delay', type=float, default=0.2, help='Seconds the stand-in waits before answering. Defaults to 0.2.')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    delay = args.delay
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    client = httpx.Client(transport=StandInTransport(port))
+
+    def newVideo() -> VideoCore:
+        video = VideoCore('E07s5ZYygMg', None, ResultMode.dict, 5, True)
+        video.client = client
+        return video
+
+    def sequential():
+        video = newVideo()
+        video.sync_html_create()
+        video.sync_create()
+
+    def concurrent():
+        newVideo().sync_create_with_html()
+
+    async def asyncSequential():
+        async with httpx.AsyncClient(transport=AsyncStandInTransport(port)) as asyncClient:
+            video = newVideo()
+            video.asyncClient = asyncClient
+            await video.async_html_create()
+            await video.async_create()
+
+    async def asyncConcurrent():
+        async with httpx.AsyncClient(transport=AsyncStandInTransport(port)) as asyncClient:
+            video = newVideo()
+            video.asyncClient = asyncClient
+            await video.async_create_with_html()
+
+    print(f'Stand-in delay: {delay * 1000:.0f} ms, median of {args.runs} runs.')
+    print(f"{'Video.get(get_upload_date=True)':<40}{'sequential':>14}{'concurrent':>14}")
+    print(f"{'sync':<40}{timeSync(sequential, args.runs):>11.0f} ms{timeSync(concurrent, args.runs):>11.0f} ms")
+    print(f"{'async':<40}{timeAsync(asyncSequential, args.runs):>11.0f} ms{timeAsync(asyncConcurrent, args.runs):>11.0f} ms")
+    client.close()
+    server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
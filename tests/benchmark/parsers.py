@@ -0,0 +1,94 @@
+'''Feeds a recorded response to a parser without making any network request.
+
+Every function takes the raw response text & returns the number of items parsed from it.
+'''
+import httpx
+
+from youtubesearchpython.core.channel import ChannelCore
+from youtubesearchpython.core.comments import CommentsCore
+from youtubesearchpython.core.constants import ResultMode
+from youtubesearchpython.core.hashtag import HashtagCore
+from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.core.transcript import TranscriptCore
+from youtubesearchpython.core.video import VideoCore, parseInfoSource
+
+
+def search(response: str, continuation: bool = False) -> int:
+    core = SearchCore('', 20, 'en', 'US', None, None)
+    core.continuationKey = 'continuation' if continuation else None
+    core.response = response
+    core._parseSource()
+    return len(core._parseComponents(True, True, True))
+
+
+def playlist(response: str, continuation: bool = False) -> int:
+    core = PlaylistCore('', None, ResultMode.dict, None)
+    core.response = response
+    if continuation:
+        core.playlistComponent = {'videos': []}
+        core.next_post_processing()
+    else:
+        core.post_processing()
+    return len(core.playlistComponent['videos'])
+
+
+def comments(response: str, continuation: bool = False) -> int:
+    core = CommentsCore('')
+    core.isNextRequest = continuation
+    core.response = httpx.Response(200, text=response)
+    core.parse_source()
+    core._CommentsCore__getComponents()
+    return len(core.commentsComponent['result'])
+
+
+def player(response: str, continuation: bool = False) -> int:
+    core = VideoCore('', None, ResultMode.dict, None, False)
+    core.response = response
+    core.post_request_processing()
+    return 1
+
+
+def playerInfo(response: str, continuation: bool = False) -> int:
+    core = VideoCore('', 'getInfo', ResultMode.dict, None, True)
+    core.HTMLresponseSource = parseInfoSource(response)
+    core.post_request_only_html_processing()
+    return 1
+
+
+def transcript(response: str, continuation: bool = False) -> int:
+    core = TranscriptCore('', None)
+    core.data = httpx.Response(200, text=response)
+    core.extract_transcript()
+    return len(core.result['segments'])
+
+
+def channel(response: str, continuation: bool = False) -> int:
+    core = ChannelCore('', None)
+    core.data = httpx.Response(200, text=response)
+    if continuation:
+        core.result = {'playlists': []}
+        core.parse_next_response()
+    else:
+        core.parse_response()
+    return len(core.result['playlists']) + 1
+
+
+def hashtag(response: str, continuation: bool = False) -> int:
+    core = HashtagCore('', 10 ** 9, 'en', 'US', None)
+    core.continuationKey = 'continuation' if continuation else None
+    core.response = response
+    core._getComponents()
+    return len(core.resultComponents)
+
+
+PARSERS = {
+    'search': search,
+    'playlist': playlist,
+    'comments': comments,
+    'player': player,
+    'playerInfo': playerInfo,
+    'transcript': transcript,
+    'channel': channel,
+    'hashtag': hashtag,
+}
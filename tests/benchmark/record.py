@@ -0,0 +1,113 @@
+'''Records live YouTube responses into `fixtures`, for offline benchmarking with run.py. Needs network access.
+'''
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from youtubesearchpython.core.channel import ChannelCore
+from youtubesearchpython.core.comments import CommentsCore
+from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.hashtag import HashtagCore
+from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.core.transcript import TranscriptCore
+from youtubesearchpython.core.video import VideoCore
+
+
+directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+manifest = {}
+
+
+def save(name: str, parser: str, response, continuation: bool = False) -> None:
+    if not isinstance(response, str):
+        response = response.text if hasattr(response, 'text') else response.decode('utf_8')
+    with open(os.path.join(directory, name + '.json'), 'w', encoding='utf_8') as file:
+        file.write(response)
+    manifest[name] = {'file': name + '.json', 'parser': parser, 'continuation': continuation}
+    print(f'Recorded {name} ({len(response) // 1024} KB).')
+
+
+def recordSearch() -> None:
+    search = SearchCore('NoCopyrightSounds', 20, 'en', 'US', None, None)
+    search._makeRequest()
+    save('search', 'search', search.response)
+    search._parseSource()
+    search._makeRequest()
+    save('search_continuation', 'search', search.response, continuation=True)
+
+    ''' Queries for artists usually return many shelves. '''
+    search = SearchCore('Harry Styles', 20, 'en', 'US', None, None)
+    search._makeRequest()
+    save('search_shelves', 'search', search.response)
+
+    ''' YouTube only sometimes answers with the richGridRenderer layout, keep the first one we get. '''
+    for query in ['NoCopyrightSounds', 'Watermelon Sugar', 'lofi hip hop', 'minecraft', 'news']:
+        search = SearchCore(query, 20, 'en', 'US', SearchMode.videos, None)
+        search._makeRequest()
+        response = json.loads(search.response)
+        if search._getValue(response, contentPath) is None and search._getValue(response, fallbackContentPath) is not None:
+            save('search_richgrid', 'search', search.response)
+            return
+    print('No richGridRenderer search response received, search_richgrid was not recorded.')
+
+
+def recordPlaylist() -> None:
+    playlist = PlaylistCore('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', None, ResultMode.dict, None)
+    playlist.sync_create()
+    save('playlist', 'playlist', playlist.response)
+    playlist._next()
+    save('playlist_continuation', 'playlist', playlist.response, continuation=True)
+
+
+def recordComments() -> None:
+    comments = CommentsCore('_ZdsmLgCVdU')
+    comments.sync_create()
+    save('comments', 'comments', comments.response)
+    comments.sync_create_next()
+    save('comments_continuation', 'comments', comments.response, continuation=True)
+
+
+def recordPlayer() -> None:
+    video = VideoCore('E07s5ZYygMg', None, ResultMode.dict, None, False)
+    video.sync_create()
+    save('player', 'player', video.response)
+    manifest['player_info'] = {'file': 'player.json', 'parser': 'playerInfo', 'continuation': False}
+
+
+def recordTranscript() -> None:
+    transcript = TranscriptCore('https://www.youtube.com/watch?v=L7kF4MXXCoA', None)
+    transcript.sync_create()
+    save('transcript', 'transcript', transcript.data)
+
+
+def recordChannel() -> None:
+    channel = ChannelCore('UC_aEa8K-EOJ3D6gOs7HcyNg', ChannelRequestType.info)
+    channel.sync_create()
+    save('channel_info', 'channel', channel.data)
+    channel = ChannelCore('UC_aEa8K-EOJ3D6gOs7HcyNg', ChannelRequestType.playlists)
+    channel.sync_create()
+    save('channel_playlists', 'channel', channel.data)
+    if channel.has_more_playlists():
+        channel.sync_next()
+        save('channel_playlists_continuation', 'channel', channel.data, continuation=True)
+
+
+def recordHashtag() -> None:
+    hashtag = HashtagCore('ncs', 60, 'en', 'US', None)
+    hashtag.sync_create()
+    save('hashtag', 'hashtag', hashtag.response)
+    hashtag.next()
+    save('hashtag_continuation', 'hashtag', hashtag.response, continuation=True)
+
+
+if __name__ == '__main__':
+    os.makedirs(directory, exist_ok=True)
+    for record in [recordSearch, recordPlaylist, recordComments, recordPlayer, recordTranscript, recordChannel, recordHashtag]:
+        try:
+            record()
+        except Exception as e:
+            print(f'{record.__name__} failed: {e}')
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf_8') as file:
+        json.dump(manifest, file, indent=4)
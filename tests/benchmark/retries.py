@@ -0,0 +1,104 @@
+'''Checks that the playlist & channel upload crawlers retry a failed page after the retry delay, without network access.
+
+Every playlist fails its first request once. The crawl has to finish all playlists anyway, and every retry has to wait for the delay.
+
+    python tests/benchmark/retries.py
+'''
+import asyncio
+import json
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+import youtubesearchpython.core.playlistscheduler as playlistscheduler
+from synthesize import playlist, playlistContinuation
+from youtubesearchpython import Channel, PlaylistScheduler
+from youtubesearchpython.__future__ import Channel as AsyncChannel, PlaylistScheduler as AsyncPlaylistScheduler
+
+
+retryDelay = 0.2
+firstPage = playlist()
+lastPage = playlistContinuation()
+''' The stand-in playlists end after their second page. '''
+lastPage['onResponseReceivedActions'][0]['appendContinuationItemsAction']['continuationItems'].pop()
+
+
+class StandIn:
+    def __init__(self):
+        self.requests = {}
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        key = body.get('browseId') or body['continuation']
+        self.requests.setdefault(key, []).append(time.monotonic())
+        if 'continuation' in body:
+            return httpx.Response(200, json=lastPage)
+        if len(self.requests[key]) == 1:
+            return httpx.Response(500, text='Stand-in failure.')
+        return httpx.Response(200, json=firstPage)
+
+    async def handleAsync(self, request: httpx.Request) -> httpx.Response:
+        return self.handle(request)
+
+    def install(self) -> None:
+        playlistscheduler.createSyncClient = lambda concurrency: httpx.Client(transport=httpx.MockTransport(self.handle))
+        playlistscheduler.createAsyncClient = lambda concurrency: httpx.AsyncClient(transport=httpx.MockTransport(self.handleAsync))
+
+
+def verify(name: str, pages: list, ids: list, standIn: StandIn) -> list:
+    failures = []
+    videos = {id: 0 for id in ids}
+    for page in pages:
+        videos[page['id']] += len(page['videos'])
+    for id, count in videos.items():
+        if count != 200:
+            failures.append(f'{name}: {count} videos of {id}, expected 200')
+        if not pages or not [page for page in pages if page['id'] == id][-1]['progress']['done']:
+            failures.append(f'{name}: {id} is not done')
+    for key, times in standIn.requests.items():
+        if key.startswith('VL') and (len(times) != 2 or times[1] - times[0] < retryDelay):
+            failures.append(f'{name}: first page of {key[2:]} requested {len(times)} times, {[round(t - times[0], 2) for t in times]} seconds apart')
+    print(f"{name:<40}{'failed' if failures else 'passed'}")
+    return failures
+
+
+def main() -> int:
+    playlistIds = ['PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', 'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIL']
+    channelIds = ['UC_aEa8K-EOJ3D6gOs7HcyNg', 'UCZFWPqqPkFlNwIxcpsLOwew']
+    failures = []
+
+    standIn = StandIn()
+    standIn.install()
+    pages = list(PlaylistScheduler(playlistIds, concurrency=2, retryDelay=retryDelay).crawl())
+    failures.extend(verify('PlaylistScheduler.crawl', pages, playlistIds, standIn))
+
+    standIn = StandIn()
+    standIn.install()
+    pages = list(Channel.crawl_uploads(channelIds, concurrency=2, retry_delay=retryDelay))
+    failures.extend(verify('Channel.crawl_uploads', pages, channelIds, standIn))
+
+    async def crawlAsync(crawl) -> list:
+        return [page async for page in crawl]
+
+    standIn = StandIn()
+    standIn.install()
+    pages = asyncio.run(crawlAsync(AsyncPlaylistScheduler(playlistIds, concurrency=2, retryDelay=retryDelay).crawl()))
+    failures.extend(verify('async PlaylistScheduler.crawl', pages, playlistIds, standIn))
+
+    standIn = StandIn()
+    standIn.install()
+    pages = asyncio.run(crawlAsync(AsyncChannel.crawl_uploads(channelIds, concurrency=2, retry_delay=retryDelay)))
+    failures.extend(verify('async Channel.crawl_uploads', pages, channelIds, standIn))
+
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+'''Benchmarks the response parsers against the recorded responses in `fixtures`.
+
+Reports items/sec, allocated memory blocks & peak memory for every fixture, and fails if any of them regressed
+by more than the tolerance compared to `baseline.json` in every attempt, or has no entry in it.
+The committed fixtures are synthetic and the committed baseline was measured on them. Baselines are machine specific,
+record them again on the machine running the benchmark.
+
+    python tests/benchmark/synthesize.py                 # Writes the synthetic fixtures.
+    python tests/benchmark/record.py                     # Records live fixtures instead, needs network access.
+    python tests/benchmark/run.py --update-baseline      # Stores the current numbers as baseline.
+    python tests/benchmark/run.py                        # Compares against the baseline.
+'''
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from parsers import PARSERS
+
+
+directory = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(parser, response: str, continuation: bool, duration: float, windows: int = 5) -> dict:
+    items = parser(response, continuation)
+    ''' The duration is split into windows and the fastest one counts, so a short stall of the machine does not show up as a regression. '''
+    rate = 0
+    for _ in range(windows):
+        iterations = 0
+        start = time.perf_counter()
+        elapsed = 0
+        while elapsed < duration / windows:
+            parser(response, continuation)
+            iterations += 1
+            elapsed = time.perf_counter() - start
+        rate = max(rate, iterations / elapsed)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    parser(response, continuation)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    return {
+        'items': items,
+        'itemsPerSecond': round(items * rate, 1),
+        'blocks': blocks,
+        'peakKB': round(peak / 1024, 1),
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    if name not in baseline:
+        return [f'{name}: no baseline entry']
+    previous = baseline[name]
+    if result['itemsPerSecond'] < previous['itemsPerSecond'] * (1 - tolerance):
+        regressions.append(f"{name}: {result['itemsPerSecond']} items/sec, baseline {previous['itemsPerSecond']}")
+    if result['peakKB'] > previous['peakKB'] * (1 + tolerance):
+        regressions.append(f"{name}: {result['peakKB']} KB peak, baseline {previous['peakKB']}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks response parsers on recorded responses.')
+    parser.add_argument('--fixtures', default=os.path.join(directory, 'fixtures'))
+    parser.add_argument('--baseline', default=os.path.join(directory, 'baseline.json'))
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative regression. Defaults to 0.2.')
+    parser.add_argument('--duration', type=float, default=0.5, help='Seconds spent on every fixture. Defaults to 0.5.')
+    parser.add_argument('--attempts', type=int, default=3, help='Measurements of a regressed fixture before it fails. Defaults to 3.')
+    parser.add_argument('--update-baseline', action='store_true')
+    args = parser.parse_args()
+
+    manifestPath = os.path.join(args.fixtures, 'manifest.json')
+    if not os.path.exists(manifestPath):
+        print(f'No fixtures found in {args.fixtures}. Write them with tests/benchmark/synthesize.py or record them with tests/benchmark/record.py first.')
+        return 1
+    with open(manifestPath, encoding='utf_8') as file:
+        manifest = json.load(file)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf_8') as file:
+            baseline = json.load(file)
+
+    results = {}
+    regressions = []
+    print(f"{'fixture':<32}{'items':>8}{'items/sec':>14}{'blocks':>10}{'peak KB':>10}")
+    for name, fixture in manifest.items():
+        with open(os.path.join(args.fixtures, fixture['file']), encoding='utf_8') as file:
+            response = file.read()
+        ''' A regression only counts if it shows up in every attempt, a busy machine slows down single measurements. '''
+        for _ in range(args.attempts):
+            result = measure(PARSERS[fixture['parser']], response, fixture.get('continuation', False), args.duration)
+            fixtureRegressions = compare(name, result, baseline, args.tolerance)
+            if args.update_baseline or not fixtureRegressions:
+                break
+        results[name] = result
+        print(f"{name:<32}{result['items']:>8}{result['itemsPerSecond']:>14}{result['blocks']:>10}{result['peakKB']:>10}")
+        regressions.extend(fixtureRegressions)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf_8') as file:
+            json.dump(results, file, indent=4)
+        print(f'Baseline written to {args.baseline}.')
+        return 0
+    if regressions:
+        print('Regressions:')
+        for regression in regressions:
+            print('    ' + regression)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,461 @@
+'''Builds the synthetic fixture corpus in `fixtures`, for machines without network access.
+
+The responses mirror the layout of the recorded ones, including the tracking & rendering data YouTube sends
+along with every item, so the parsers walk & decode documents of a realistic shape & size.
+The corpus is generated from a fixed seed, so every run writes the same files.
+
+    python tests/benchmark/synthesize.py
+'''
+import json
+import os
+import random
+
+
+directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+words = ('music release official video remix live session lyrics mix house dubstep trap chill '
+         'episode tutorial review highlights full album cover acoustic version edit').split()
+random.seed(30)
+
+
+def token(length: int) -> str:
+    return ''.join(random.choice(alphabet) for _ in range(length))
+
+
+def text(count: int) -> str:
+    return ' '.join(random.choice(words) for _ in range(count)).capitalize()
+
+
+def videoId() -> str:
+    return token(10) + random.choice('AEIMQUYcgkosw048')
+
+
+def channelId() -> str:
+    return 'UC' + token(21) + random.choice('AQgw')
+
+
+def tracking() -> dict:
+    return {'trackingParams': token(96), 'clickTrackingParams': token(48)}
+
+
+def thumbnails(url: str, sizes=((168, 94), (196, 110), (246, 138), (336, 188))) -> dict:
+    return {'thumbnails': [{'url': f'{url}?sqp={token(40)}&rs={token(34)}', 'width': width, 'height': height} for width, height in sizes]}
+
+
+def runs(value: str, **extra) -> dict:
+    run = {'text': value}
+    run.update(extra)
+    return {'runs': [run]}
+
+
+def accessible(value: str, label: str) -> dict:
+    return {'simpleText': value, 'accessibility': {'accessibilityData': {'label': label}}}
+
+
+def browseEndpoint(id: str, url: str) -> dict:
+    return {'clickTrackingParams': token(40), 'commandMetadata': {'webCommandMetadata': {'url': url, 'webPageType': 'WEB_PAGE_TYPE_CHANNEL', 'rootVe': 3611}},
+            'browseEndpoint': {'browseId': id, 'canonicalBaseUrl': url}}
+
+
+def watchEndpoint(id: str) -> dict:
+    return {'clickTrackingParams': token(40), 'commandMetadata': {'webCommandMetadata': {'url': '/watch?v=' + id, 'webPageType': 'WEB_PAGE_TYPE_WATCH', 'rootVe': 3832}},
+            'watchEndpoint': {'videoId': id, 'watchEndpointSupportedOnesieConfig': {'html5PlaybackOnesieConfig': {'commonConfig': {'url': 'https://rr1---sn-' + token(8) + '.googlevideo.com/initplayback?source=youtube&oeis=1&c=WEB&oad=3200&ovd=3200&oaad=11000&oavd=11000&ocs=700&oewis=1&oputc=1&ofpcc=1&msp=1&odepv=1&id=' + token(16) + '&ip=0.0.0.0&initcwndbps=1000000&mt=' + token(10)}}}}}
+
+
+def continuation(key: str) -> dict:
+    return {'continuationItemRenderer': {'trigger': 'CONTINUATION_TRIGGER_ON_ITEM_SHOWN', 'continuationEndpoint': {
+        'clickTrackingParams': token(40), 'commandMetadata': {'webCommandMetadata': {'sendPost': True, 'apiUrl': '/youtubei/v1/browse'}},
+        'continuationCommand': {'token': key + token(120), 'request': 'CONTINUATION_REQUEST_TYPE_BROWSE'}}}}
+
+
+def menu() -> dict:
+    items = [{'menuServiceItemRenderer': {'text': runs(label), 'icon': {'iconType': icon}, 'serviceEndpoint': {'clickTrackingParams': token(40), 'signalServiceEndpoint': {'signal': 'CLIENT_SIGNAL', 'actions': [{'clickTrackingParams': token(40)}]}}, 'trackingParams': token(40)}}
+             for label, icon in [('Add to queue', 'ADD_TO_QUEUE_TAIL'), ('Save to Watch later', 'WATCH_LATER'), ('Save to playlist', 'PLAYLIST_ADD'), ('Share', 'SHARE')]]
+    return {'menuRenderer': {'items': items, 'trackingParams': token(40), 'accessibility': {'accessibilityData': {'label': 'Action menu'}}}}
+
+
+def ownerBadges() -> list:
+    return [{'metadataBadgeRenderer': {'icon': {'iconType': 'CHECK_CIRCLE_THICK'}, 'style': 'BADGE_STYLE_TYPE_VERIFIED', 'tooltip': 'Verified', 'trackingParams': token(40), 'accessibilityData': {'label': 'Verified'}}}]
+
+
+def searchVideo() -> dict:
+    id = videoId()
+    owner = channelId()
+    title = text(8)
+    minutes, seconds = random.randint(1, 59), random.randint(0, 59)
+    views = random.randint(1000, 90000000)
+    video = {
+        'videoId': id,
+        'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{id}/hq720.jpg', ((360, 202), (720, 404))),
+        'title': {'runs': [{'text': title}], 'accessibility': {'accessibilityData': {'label': f'{title} by NoCopyrightSounds {views:,} views {minutes} minutes, {seconds} seconds'}}},
+        'longBylineText': runs('NoCopyrightSounds', navigationEndpoint=browseEndpoint(owner, '/c/NoCopyrightSounds')),
+        'publishedTimeText': {'simpleText': f'{random.randint(1, 11)} years ago'},
+        'lengthText': accessible(f'{minutes}:{seconds:02}', f'{minutes} minutes, {seconds} seconds'),
+        'viewCountText': {'simpleText': f'{views:,} views'},
+        'navigationEndpoint': watchEndpoint(id),
+        'badges': [{'metadataBadgeRenderer': {'style': 'BADGE_STYLE_TYPE_SIMPLE', 'label': '4K', 'trackingParams': token(40)}}],
+        'ownerBadges': ownerBadges(),
+        'ownerText': runs('NoCopyrightSounds', navigationEndpoint=browseEndpoint(owner, '/c/NoCopyrightSounds')),
+        'shortBylineText': runs('NoCopyrightSounds', navigationEndpoint=browseEndpoint(owner, '/c/NoCopyrightSounds')),
+        'shortViewCountText': accessible(f'{views // 1000000}M views', f'{views // 1000000} million views'),
+        'showActionMenu': False,
+        'menu': menu(),
+        'channelThumbnailSupportedRenderers': {'channelThumbnailWithLinkRenderer': {'thumbnail': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((68, 68),)),
+                                                                                   'navigationEndpoint': browseEndpoint(owner, '/c/NoCopyrightSounds'), 'accessibility': {'accessibilityData': {'label': 'Go to channel'}}}},
+        'thumbnailOverlays': [{'thumbnailOverlayTimeStatusRenderer': {'text': accessible(f'{minutes}:{seconds:02}', f'{minutes} minutes'), 'style': 'DEFAULT'}},
+                              {'thumbnailOverlayToggleButtonRenderer': {'isToggled': False, 'untoggledIcon': {'iconType': 'WATCH_LATER'}, 'toggledIcon': {'iconType': 'CHECK'}, 'untoggledTooltip': 'Watch later', 'toggledTooltip': 'Added', 'trackingParams': token(40)}}],
+        'richThumbnail': {'movingThumbnailRenderer': {'movingThumbnailDetails': {'thumbnails': [{'url': f'https://i.ytimg.com/an_webp/{id}/mqdefault_6s.webp?du=3000&sqp={token(40)}&rs={token(34)}', 'width': 320, 'height': 180}], 'logAsMovingThumbnail': True}, 'enableHoveredLogging': True, 'enableOverlay': True}},
+        'detailedMetadataSnippets': [{'snippetText': runs(text(24)), 'snippetHoverText': runs('From the video description'), 'maxOneLine': False}],
+        'searchVideoResultEntityKey': token(40),
+    }
+    video.update(tracking())
+    return {'videoRenderer': video}
+
+
+def searchChannel() -> dict:
+    id = channelId()
+    channel = {
+        'channelId': id,
+        'title': {'simpleText': text(2)},
+        'navigationEndpoint': browseEndpoint(id, '/@' + token(12)),
+        'thumbnail': thumbnails(f'//yt3.ggpht.com/{token(60)}', ((88, 88), (176, 176))),
+        'descriptionSnippet': runs(text(20)),
+        'shortBylineText': runs(text(2)),
+        'videoCountText': runs(f'{random.randint(10, 3000)} videos'),
+        'subscriptionButton': {'subscribed': False},
+        'ownerBadges': ownerBadges(),
+        'subscriberCountText': accessible(f'{random.randint(1, 900)}K subscribers', 'subscribers'),
+        'subscribeButton': {'buttonRenderer': {'style': 'STYLE_DESTRUCTIVE', 'size': 'SIZE_DEFAULT', 'isDisabled': False, 'text': runs('Subscribe'), 'trackingParams': token(40)}},
+        'longBylineText': runs(text(2)),
+    }
+    channel.update(tracking())
+    return {'channelRenderer': channel}
+
+
+def searchPlaylist() -> dict:
+    id = 'PL' + token(32)
+    owner = channelId()
+    playlist = {
+        'playlistId': id,
+        'title': {'simpleText': text(5)},
+        'thumbnails': [thumbnails(f'https://i.ytimg.com/vi/{videoId()}/hqdefault.jpg')],
+        'videoCount': str(random.randint(5, 400)),
+        'navigationEndpoint': watchEndpoint(videoId()),
+        'viewPlaylistText': runs('View full playlist'),
+        'shortBylineText': runs(text(2), navigationEndpoint=browseEndpoint(owner, '/@' + token(10))),
+        'videos': [{'childVideoRenderer': {'title': {'simpleText': text(6)}, 'navigationEndpoint': watchEndpoint(videoId()), 'lengthText': accessible('3:21', '3 minutes, 21 seconds'), 'videoId': videoId()}} for _ in range(2)],
+        'videoCountText': runs('videos'),
+        'thumbnailRenderer': {'playlistVideoThumbnailRenderer': {'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{videoId()}/hqdefault.jpg'), 'trackingParams': token(40)}},
+        'longBylineText': runs(text(2), navigationEndpoint=browseEndpoint(owner, '/@' + token(10))),
+    }
+    playlist.update(tracking())
+    return {'playlistRenderer': playlist}
+
+
+def searchShelf(count: int) -> dict:
+    return {'shelfRenderer': {'title': {'simpleText': 'Latest from ' + text(2)}, 'content': {'verticalListRenderer': {
+        'items': [searchVideo() for _ in range(count)], 'collapsedItemCount': 2, 'collapsedStateButtonText': runs('Show more'), 'trackingParams': token(40)}}, 'trackingParams': token(40)}}
+
+
+def searchItems(shelves: bool) -> list:
+    items = [searchChannel()]
+    for index in range(20):
+        if shelves and index in (4, 12):
+            items.append(searchShelf(6))
+        elif index % 7 == 6:
+            items.append(searchPlaylist())
+        else:
+            items.append(searchVideo())
+    items.append({'adSlotRenderer': {'slotId': token(40), 'trackingParams': token(40)}})
+    return items
+
+
+def search(shelves: bool = False) -> dict:
+    section = {'itemSectionRenderer': {'contents': searchItems(shelves), 'trackingParams': token(40)}}
+    return {
+        'responseContext': {'serviceTrackingParams': [{'service': 'GFEEDBACK', 'params': [{'key': 'logged_in', 'value': '0'}]}], 'visitorData': token(48)},
+        'estimatedResults': str(random.randint(100000, 9000000)),
+        'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {'contents': [section, continuation('EpcD')], 'trackingParams': token(40)}}}},
+        'trackingParams': token(40),
+        'refinements': [text(3) for _ in range(8)],
+    }
+
+
+def searchContinuation() -> dict:
+    section = {'itemSectionRenderer': {'contents': searchItems(False), 'trackingParams': token(40)}}
+    return {'responseContext': {'visitorData': token(48)}, 'estimatedResults': '5000000',
+            'onResponseReceivedCommands': [{'clickTrackingParams': token(40), 'appendContinuationItemsAction': {'continuationItems': [section, continuation('EpcD')], 'targetId': 'search-feed'}}]}
+
+
+def searchRichGrid() -> dict:
+    items = [{'richItemRenderer': {'content': searchVideo(), 'trackingParams': token(40)}} for _ in range(20)]
+    return {'responseContext': {'visitorData': token(48)},
+            'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'richGridRenderer': {'contents': items + [continuation('EpcD')], 'trackingParams': token(40)}}}}}
+
+
+def playlistVideo(index: int) -> dict:
+    id = videoId()
+    owner = channelId()
+    title = text(7)
+    minutes, seconds = random.randint(1, 9), random.randint(0, 59)
+    video = {
+        'videoId': id,
+        'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{id}/hqdefault.jpg'),
+        'title': {'runs': [{'text': title}], 'accessibility': {'accessibilityData': {'label': f'{title} by NoCopyrightSounds {minutes} minutes, {seconds} seconds'}}},
+        'index': {'simpleText': str(index + 1)},
+        'shortBylineText': runs('NoCopyrightSounds', navigationEndpoint=browseEndpoint(owner, '/c/NoCopyrightSounds')),
+        'lengthText': accessible(f'{minutes}:{seconds:02}', f'{minutes} minutes, {seconds} seconds'),
+        'navigationEndpoint': watchEndpoint(id),
+        'lengthSeconds': str(minutes * 60 + seconds),
+        'isPlayable': True,
+        'menu': menu(),
+        'thumbnailOverlays': [{'thumbnailOverlayTimeStatusRenderer': {'text': accessible(f'{minutes}:{seconds:02}', f'{minutes} minutes'), 'style': 'DEFAULT'}},
+                              {'thumbnailOverlayNowPlayingRenderer': {'text': runs('Now playing')}}],
+        'videoInfo': {'runs': [{'text': f'{random.randint(1, 900)}M views'}, {'text': ' • '}, {'text': f'{random.randint(1, 11)} years ago'}]},
+    }
+    video.update(tracking())
+    return {'playlistVideoRenderer': video}
+
+
+def playlist(count: int = 100) -> dict:
+    id = 'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK'
+    owner = channelId()
+    videos = [playlistVideo(index) for index in range(count)] + [continuation('4qmFsgJh')]
+    videoList = {'playlistVideoListRenderer': {'contents': videos, 'playlistId': id, 'isEditable': False, 'canReorder': False, 'trackingParams': token(40), 'targetId': id}}
+    return {
+        'responseContext': {'visitorData': token(48)},
+        'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [{'tabRenderer': {'selected': True, 'content': {'sectionListRenderer': {
+            'contents': [{'itemSectionRenderer': {'contents': [videoList], 'trackingParams': token(40)}}], 'trackingParams': token(40)}}, 'trackingParams': token(40)}}]}},
+        'header': {'playlistHeaderRenderer': {'playlistId': id, 'title': {'simpleText': text(3)}, 'numVideosText': runs(f'{count * 4} videos'), 'descriptionText': {'simpleText': text(30)}, 'trackingParams': token(40)}},
+        'metadata': {'playlistMetadataRenderer': {'title': text(3), 'androidAppindexingLink': 'android-app://com.google.android.youtube/http/www.youtube.com/playlist?list=' + id}},
+        'trackingParams': token(40),
+        'microformat': {'microformatDataRenderer': {'urlCanonical': 'https://www.youtube.com/playlist?list=' + id, 'title': text(3), 'description': text(30),
+                                                    'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{videoId()}/hqdefault.jpg'), 'siteName': 'YouTube', 'noindex': False, 'unlisted': False}},
+        'sidebar': {'playlistSidebarRenderer': {'items': [
+            {'playlistSidebarPrimaryInfoRenderer': {
+                'thumbnailRenderer': {'playlistVideoThumbnailRenderer': {'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{videoId()}/hqdefault.jpg'), 'trackingParams': token(40)}},
+                'title': runs(text(3), navigationEndpoint={'clickTrackingParams': token(40), 'watchEndpoint': {'videoId': videoId(), 'playlistId': id}}),
+                'stats': [{'runs': [{'text': str(count * 4)}, {'text': ' videos'}]}, {'simpleText': f'{random.randint(100000, 9000000):,} views'}, {'runs': [{'text': 'Last updated on '}, {'text': 'Jan 1, 2024'}]}],
+                'menu': menu(), 'navigationEndpoint': {'clickTrackingParams': token(40), 'watchEndpoint': {'videoId': videoId(), 'playlistId': id}},
+                'description': {'simpleText': text(30)}, 'showMoreText': runs('Show more')}},
+            {'playlistSidebarSecondaryInfoRenderer': {'videoOwner': {'videoOwnerRenderer': {
+                'thumbnail': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((48, 48), (88, 88), (176, 176))),
+                'title': runs('NoCopyrightSounds', navigationEndpoint=browseEndpoint(owner, '/c/NoCopyrightSounds')),
+                'navigationEndpoint': browseEndpoint(owner, '/c/NoCopyrightSounds'), 'trackingParams': token(40)}}}},
+        ], 'trackingParams': token(40)}},
+    }
+
+
+def playlistContinuation(count: int = 100) -> dict:
+    videos = [playlistVideo(100 + index) for index in range(count)] + [continuation('4qmFsgJh')]
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'onResponseReceivedActions': [{'clickTrackingParams': token(40), 'appendContinuationItemsAction': {'continuationItems': videos, 'targetId': 'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK'}}]}
+
+
+def commentThread(pinned: bool = False) -> dict:
+    author = channelId()
+    comment = {
+        'authorText': {'simpleText': '@' + token(10)},
+        'authorThumbnail': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((48, 48), (88, 88), (176, 176))),
+        'authorEndpoint': browseEndpoint(author, '/@' + token(10)),
+        'contentText': runs(text(random.randint(5, 60))),
+        'publishedTimeText': runs(f'{random.randint(1, 11)} months ago', navigationEndpoint={'clickTrackingParams': token(40), 'commandMetadata': {'webCommandMetadata': {'url': '/watch?v=_ZdsmLgCVdU&lc=' + token(26)}}}),
+        'isLiked': False,
+        'commentId': 'Ug' + token(24),
+        'actionButtons': {'commentActionButtonsRenderer': {'likeButton': {'toggleButtonRenderer': {'style': {'styleType': 'STYLE_TEXT'}, 'isToggled': False, 'trackingParams': token(40)}}, 'trackingParams': token(40)}},
+        'authorIsChannelOwner': pinned,
+        'voteStatus': 'INDIFFERENT',
+        'voteCount': accessible(f'{random.randint(1, 999)}', 'likes'),
+        'expandButton': {'buttonRenderer': {'text': runs('Read more'), 'trackingParams': token(40)}},
+        'collapseButton': {'buttonRenderer': {'text': runs('Show less'), 'trackingParams': token(40)}},
+        'replyCount': random.randint(0, 40),
+        'loggingDirectives': {'trackingParams': token(40), 'visibility': {'types': '12'}},
+    }
+    if pinned:
+        comment['pinnedCommentBadge'] = {'pinnedCommentBadgeRenderer': {'icon': {'iconType': 'KEEP'}, 'label': runs('Pinned by NoCopyrightSounds')}}
+    thread = {'comment': {'commentRenderer': comment}, 'trackingParams': token(40), 'renderingPriority': 'RENDERING_PRIORITY_UNKNOWN', 'isModeratedElqComment': False}
+    if comment['replyCount']:
+        thread['replies'] = {'commentRepliesRenderer': {'contents': [continuation('Eg0S')], 'trackingParams': token(40), 'targetId': 'comment-replies-item-' + comment['commentId']}}
+    return {'commentThreadRenderer': thread}
+
+
+def comments() -> dict:
+    header = {'commentsHeaderRenderer': {'countText': runs('12,345 Comments'), 'sortMenu': {'sortFilterSubMenuRenderer': {'subMenuItems': [
+        {'title': 'Top comments', 'selected': True, 'serviceEndpoint': {'continuationCommand': {'token': token(120)}}, 'trackingParams': token(40)},
+        {'title': 'Newest first', 'selected': False, 'serviceEndpoint': {'continuationCommand': {'token': token(120)}}, 'trackingParams': token(40)}]}}, 'trackingParams': token(40)}}
+    threads = [commentThread(index == 0) for index in range(20)] + [continuation('Eg0S')]
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'onResponseReceivedEndpoints': [{'clickTrackingParams': token(40), 'reloadContinuationItemsCommand': {'targetId': 'comments-section', 'continuationItems': [header], 'slot': 'RELOAD_CONTINUATION_SLOT_HEADER'}},
+                                            {'clickTrackingParams': token(40), 'reloadContinuationItemsCommand': {'targetId': 'comments-section', 'continuationItems': threads, 'slot': 'RELOAD_CONTINUATION_SLOT_BODY'}}]}
+
+
+def commentsContinuation() -> dict:
+    threads = [commentThread() for _ in range(20)] + [continuation('Eg0S')]
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'onResponseReceivedEndpoints': [{'clickTrackingParams': token(40), 'appendContinuationItemsAction': {'continuationItems': threads, 'targetId': 'comments-section'}}]}
+
+
+def streamingFormat(itag: int, mimeType: str) -> dict:
+    return {
+        'itag': itag,
+        'url': 'https://rr3---sn-' + token(8) + '.googlevideo.com/videoplayback?expire=1700000000&ei=' + token(24) + '&ip=0.0.0.0&id=' + token(40) + '&itag=' + str(itag) +
+               '&source=youtube&requiressl=yes&mh=' + token(2) + '&mm=31%2C29&mn=sn-' + token(8) + '&ms=au%2Crdu&mv=m&mvi=3&pl=24&initcwndbps=1000000&vprv=1&mime=' + mimeType.split(';')[0].replace('/', '%2F') +
+               '&gir=yes&clen=' + str(random.randint(10 ** 5, 10 ** 8)) + '&dur=188.871&lmt=1594495537943093&mt=1700000000&fvip=3&keepalive=yes&c=WEB&txp=5531432&n=' + token(16) +
+               '&sparams=expire%2Cei%2Cip%2Cid%2Citag%2Csource%2Crequiressl%2Cvprv%2Cmime%2Cgir%2Cclen%2Cdur%2Clmt&sig=' + token(120) + '&lsparams=mh%2Cmm%2Cmn%2Cms%2Cmv%2Cmvi%2Cpl%2Cinitcwndbps&lsig=' + token(100),
+        'mimeType': mimeType,
+        'bitrate': random.randint(10 ** 4, 10 ** 7),
+        'width': random.choice([256, 426, 640, 854, 1280, 1920]),
+        'height': random.choice([144, 240, 360, 480, 720, 1080]),
+        'initRange': {'start': '0', 'end': str(random.randint(200, 800))},
+        'indexRange': {'start': str(random.randint(800, 1200)), 'end': str(random.randint(1200, 2000))},
+        'lastModified': '1594495537943093',
+        'contentLength': str(random.randint(10 ** 5, 10 ** 8)),
+        'quality': random.choice(['tiny', 'small', 'medium', 'large', 'hd720', 'hd1080']),
+        'fps': random.choice([24, 25, 30, 60]),
+        'qualityLabel': random.choice(['144p', '240p', '360p', '480p', '720p', '1080p']),
+        'projectionType': 'RECTANGULAR',
+        'averageBitrate': random.randint(10 ** 4, 10 ** 7),
+        'approxDurationMs': '188871',
+    }
+
+
+def player() -> dict:
+    id = 'E07s5ZYygMg'
+    mimeTypes = ['video/mp4; codecs="avc1.4d401e"', 'video/webm; codecs="vp9"', 'audio/mp4; codecs="mp4a.40.2"', 'audio/webm; codecs="opus"']
+    return {
+        'responseContext': {'serviceTrackingParams': [{'service': service, 'params': [{'key': token(8), 'value': token(16)} for _ in range(6)]} for service in ['GFEEDBACK', 'CSI', 'GUIDED_HELP', 'ECATCHER']], 'visitorData': token(48)},
+        'playabilityStatus': {'status': 'OK', 'playableInEmbed': True, 'miniplayer': {'miniplayerRenderer': {'playbackMode': 'PLAYBACK_MODE_ALLOW'}}, 'contextParams': token(40)},
+        'streamingData': {'expiresInSeconds': '21540', 'formats': [streamingFormat(18, mimeTypes[0])],
+                          'adaptiveFormats': [streamingFormat(random.choice([133, 134, 135, 136, 137, 140, 160, 242, 243, 244, 247, 248, 249, 250, 251, 278]), random.choice(mimeTypes)) for _ in range(24)]},
+        'playbackTracking': {key: {'baseUrl': 'https://s.youtube.com/api/stats/' + key + '?cl=' + token(9) + '&docid=' + id + '&ei=' + token(24) + '&fexp=' + ','.join(str(random.randint(23000000, 24999999)) for _ in range(40)) + '&ns=yt&plid=' + token(20) + '&el=detailpage&len=189&of=' + token(22) + '&vm=' + token(60)}
+                             for key in ['videostatsPlaybackUrl', 'videostatsDelayplayUrl', 'videostatsWatchtimeUrl', 'ptrackingUrl', 'qoeUrl', 'atrUrl']},
+        'captions': {'playerCaptionsTracklistRenderer': {'captionTracks': [{'baseUrl': 'https://www.youtube.com/api/timedtext?v=' + id + '&caps=asr&xoaf=5&hl=en&ip=0.0.0.0&ipbits=0&expire=1700000000&sparams=' + token(60) + '&signature=' + token(80) + '&kind=asr&lang=' + language,
+                                                                             'name': {'simpleText': language}, 'vssId': '.' + language, 'languageCode': language, 'isTranslatable': True} for language in ['en', 'de', 'fr', 'es']],
+                                                         'translationLanguages': [{'languageCode': token(2).lower(), 'languageName': {'simpleText': text(1)}} for _ in range(100)]}},
+        'videoDetails': {'videoId': id, 'title': text(6), 'lengthSeconds': '189', 'keywords': [text(2) for _ in range(20)], 'channelId': channelId(), 'isOwnerViewing': False,
+                         'shortDescription': '\n'.join(text(12) for _ in range(30)), 'isCrawlable': True, 'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{id}/hqdefault.jpg'),
+                         'allowRatings': True, 'viewCount': str(random.randint(10 ** 6, 10 ** 9)), 'author': 'NoCopyrightSounds', 'isPrivate': False, 'isUnpluggedCorpus': False, 'isLiveContent': False},
+        'annotations': [{'playerAnnotationsExpandedRenderer': {'featuredChannel': {'startTimeMs': '0', 'endTimeMs': '189000', 'watermark': thumbnails(f'https://i.ytimg.com/an/{token(22)}/featured_channel.jpg', ((40, 40),)),
+                                                                                   'trackingParams': token(40), 'channelName': 'NoCopyrightSounds'}, 'allowSwipeDismiss': True, 'annotationId': token(36)}}],
+        'playerConfig': {'audioConfig': {'loudnessDb': 5.5, 'perceptualLoudnessDb': -8.5, 'enablePerFormatLoudness': True},
+                         'webPlayerConfig': {'webPlayerActionsPorting': {key: {'clickTrackingParams': token(40), 'commandMetadata': {'webCommandMetadata': {'sendPost': True, 'apiUrl': '/youtubei/v1/' + key}}} for key in ['getSharePanelCommand', 'subscribeCommand', 'unsubscribeCommand', 'addToWatchLaterCommand', 'removeFromWatchLaterCommand']}}},
+        'storyboards': {'playerStoryboardSpecRenderer': {'spec': '|'.join('https://i.ytimg.com/sb/' + id + '/storyboard3_L$L/$N.jpg?sqp=' + token(60) for _ in range(4))}},
+        'microformat': {'playerMicroformatRenderer': {'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{id}/maxresdefault.jpg', ((1280, 720),)), 'embed': {'iframeUrl': 'https://www.youtube.com/embed/' + id, 'width': 1280, 'height': 720},
+                                                      'title': {'simpleText': text(6)}, 'description': {'simpleText': '\n'.join(text(12) for _ in range(30))}, 'lengthSeconds': '189', 'ownerProfileUrl': 'http://www.youtube.com/@NoCopyrightSounds',
+                                                      'externalChannelId': channelId(), 'isFamilySafe': True, 'availableCountries': [token(2).upper() for _ in range(240)], 'isUnlisted': False, 'hasYpcMetadata': False,
+                                                      'viewCount': str(random.randint(10 ** 6, 10 ** 9)), 'category': 'Music', 'publishDate': '2020-07-11', 'ownerChannelName': 'NoCopyrightSounds', 'uploadDate': '2020-07-11'}},
+        'trackingParams': token(40),
+        'attestation': {'playerAttestationRenderer': {'challenge': token(600), 'botguardData': {'program': token(4000), 'interpreterSafeUrl': {'privateDoNotAccessOrElseTrustedResourceUrlWrappedValue': '//www.google.com/js/th/' + token(40) + '.js'}}}},
+        'adPlacements': [{'adPlacementRenderer': {'config': {'adPlacementConfig': {'kind': 'AD_PLACEMENT_KIND_START', 'adTimeOffset': {'offsetStartMilliseconds': '0', 'offsetEndMilliseconds': '-1'}}}, 'renderer': {'clientForecastingAdRenderer': {}}, 'adSlotLoggingData': {'serializedSlotAdServingDataEntry': token(200)}}} for _ in range(3)],
+        'frameworkUpdates': {'entityBatchUpdate': {'mutations': [{'entityKey': token(40), 'type': 'ENTITY_MUTATION_TYPE_REPLACE', 'payload': {'offlineabilityEntity': {'key': token(40), 'addToOfflineButtonState': 'ADD_TO_OFFLINE_BUTTON_STATE_UNKNOWN'}}}], 'timestamp': {'seconds': '1700000000', 'nanos': 0}}},
+    }
+
+
+def transcript(count: int = 120) -> dict:
+    segments = []
+    for index in range(count):
+        start = index * 4200 + random.randint(0, 800)
+        segments.append({'transcriptSegmentRenderer': {'startMs': str(start), 'endMs': str(start + 4000), 'snippet': runs(text(random.randint(4, 12)).lower()),
+                                                       'startTimeText': {'simpleText': f'{start // 60000}:{start // 1000 % 60:02}'}, 'trackingParams': token(40), 'accessibility': {'accessibilityData': {'label': f'{start // 1000} seconds ' + text(6)}}, 'targetId': token(20)}})
+    languages = [{'title': title, 'selected': index == 0, 'continuation': {'reloadContinuationData': {'continuation': token(80)}}, 'trackingParams': token(40)} for index, title in enumerate(['English (auto-generated)', 'English', 'German'])]
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'actions': [{'clickTrackingParams': token(40), 'updateEngagementPanelAction': {'targetId': 'engagement-panel-searchable-transcript', 'content': {'transcriptRenderer': {'trackingParams': token(40), 'content': {'transcriptSearchPanelRenderer': {
+                'body': {'transcriptSegmentListRenderer': {'initialSegments': segments, 'noResultLabel': runs('No results found'), 'retryLabel': runs('TAP TO RETRY'), 'touchCaptionsEnabled': False}},
+                'footer': {'transcriptFooterRenderer': {'languageMenu': {'sortFilterSubMenuRenderer': {'subMenuItems': languages, 'trackingParams': token(40)}}}},
+                'trackingParams': token(40), 'targetId': 'engagement-panel-searchable-transcript-search-panel'}}}}}}]}
+
+
+def gridPlaylist() -> dict:
+    id = 'PL' + token(32)
+    return {'gridPlaylistRenderer': {'playlistId': id, 'thumbnail': thumbnails(f'https://i.ytimg.com/vi/{videoId()}/hqdefault.jpg'), 'title': runs(text(4), navigationEndpoint=watchEndpoint(videoId())),
+                                     'publishedTimeText': {'simpleText': f'Updated {random.randint(1, 30)} days ago'}, 'videoCountText': runs(f'{random.randint(2, 300)} videos'), 'navigationEndpoint': watchEndpoint(videoId()),
+                                     'videoCountShortText': {'simpleText': str(random.randint(2, 300))}, 'trackingParams': token(40), 'sidebarThumbnails': [thumbnails(f'https://i.ytimg.com/vi/{videoId()}/default.jpg', ((43, 20),)) for _ in range(4)],
+                                     'thumbnailText': {'runs': [{'text': str(random.randint(2, 300)), 'bold': True}, {'text': ' videos'}]}, 'ownerBadges': ownerBadges(), 'viewPlaylistText': runs('View full playlist')}}
+
+
+def channelResponse(tab: str) -> dict:
+    id = 'UC_aEa8K-EOJ3D6gOs7HcyNg'
+    tabs = []
+    for title in ['Home', 'Videos', 'Shorts', 'Live', 'Playlists', 'Community', 'Channels', 'About']:
+        renderer = {'endpoint': browseEndpoint(id, '/@NoCopyrightSounds/' + title.lower()), 'title': title, 'trackingParams': token(40)}
+        if title == tab == 'Playlists':
+            renderer['selected'] = True
+            renderer['content'] = {'sectionListRenderer': {'contents': [{'itemSectionRenderer': {'contents': [{'gridRenderer': {'items': [gridPlaylist() for _ in range(30)] + [continuation('4qmFsgKl')], 'trackingParams': token(40)}}], 'trackingParams': token(40)}}], 'trackingParams': token(40)}}
+        elif title == tab == 'About':
+            renderer['selected'] = True
+            renderer['content'] = {'sectionListRenderer': {'contents': [{'itemSectionRenderer': {'contents': [{'channelAboutFullMetadataRenderer': {
+                'description': {'simpleText': '\n'.join(text(12) for _ in range(12))}, 'viewCountText': {'simpleText': '13,141,578,217 views'},
+                'joinedDateText': {'runs': [{'text': 'Joined '}, {'text': 'Jun 11, 2011'}]}, 'canonicalChannelUrl': 'http://www.youtube.com/@NoCopyrightSounds',
+                'country': {'simpleText': 'United Kingdom'}, 'channelId': id, 'title': {'simpleText': 'NoCopyrightSounds'}, 'avatar': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((48, 48), (88, 88), (176, 176))),
+                'primaryLinks': [{'navigationEndpoint': {'urlEndpoint': {'url': 'https://www.youtube.com/redirect?q=' + token(40)}}, 'icon': {'thumbnails': [{'url': 'https://encrypted-tbn1.gstatic.com/favicon-tbn?q=' + token(60)}]}, 'title': {'simpleText': text(1)}} for _ in range(8)],
+                'trackingParams': token(40)}}], 'trackingParams': token(40)}}], 'trackingParams': token(40)}}
+        tabs.append({'tabRenderer': renderer})
+    return {
+        'responseContext': {'visitorData': token(48)},
+        'contents': {'twoColumnBrowseResultsRenderer': {'tabs': tabs}},
+        'header': {'c4TabbedHeaderRenderer': {'channelId': id, 'title': 'NoCopyrightSounds', 'navigationEndpoint': browseEndpoint(id, '/@NoCopyrightSounds'),
+                                              'avatar': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((48, 48), (88, 88), (176, 176))),
+                                              'banner': thumbnails(f'https://yt3.ggpht.com/{token(80)}', ((1060, 175), (1138, 188), (1707, 283), (2120, 351), (2276, 377), (2560, 424))),
+                                              'badges': ownerBadges(), 'subscriberCountText': accessible('33.5M subscribers', '33.5 million subscribers'), 'trackingParams': token(40),
+                                              'tvBanner': thumbnails(f'https://yt3.ggpht.com/{token(80)}', ((320, 180), (854, 480), (1280, 720), (1920, 1080), (2120, 1192))),
+                                              'mobileBanner': thumbnails(f'https://yt3.ggpht.com/{token(80)}', ((320, 88), (640, 175), (960, 263), (1280, 351), (1440, 395)))}},
+        'metadata': {'channelMetadataRenderer': {'title': 'NoCopyrightSounds', 'description': '\n'.join(text(12) for _ in range(12)), 'rssUrl': 'https://www.youtube.com/feeds/videos.xml?channel_id=' + id,
+                                                 'externalId': id, 'keywords': ' '.join(text(2) for _ in range(20)), 'ownerUrls': ['http://www.youtube.com/@NoCopyrightSounds'],
+                                                 'avatar': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((900, 900),)), 'channelUrl': 'https://www.youtube.com/channel/' + id, 'isFamilySafe': True,
+                                                 'availableCountryCodes': [token(2).upper() for _ in range(240)], 'vanityChannelUrl': 'http://www.youtube.com/@NoCopyrightSounds'}},
+        'trackingParams': token(40),
+        'microformat': {'microformatDataRenderer': {'urlCanonical': 'https://www.youtube.com/channel/' + id, 'title': 'NoCopyrightSounds', 'description': text(30),
+                                                    'thumbnail': thumbnails(f'https://yt3.ggpht.com/{token(60)}', ((200, 200),)), 'siteName': 'YouTube', 'tags': [text(2) for _ in range(20)], 'noindex': False, 'unlisted': False, 'familySafe': True}},
+    }
+
+
+def channelPlaylistsContinuation() -> dict:
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'onResponseReceivedActions': [{'clickTrackingParams': token(40), 'appendContinuationItemsAction': {'continuationItems': [gridPlaylist() for _ in range(30)] + [continuation('4qmFsgKl')], 'targetId': 'browse-feedUC_aEa8K-EOJ3D6gOs7HcyNgplaylists'}}]}
+
+
+def hashtag() -> dict:
+    items = [{'richItemRenderer': {'content': searchVideo(), 'trackingParams': token(40)}} for _ in range(60)] + [continuation('4qmFsgLn')]
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [{'tabRenderer': {'selected': True, 'content': {'richGridRenderer': {'contents': items, 'trackingParams': token(40)}}, 'trackingParams': token(40)}}]}},
+            'header': {'hashtagHeaderRenderer': {'hashtag': {'simpleText': '#ncs'}, 'hashtagInfoText': {'simpleText': '2.1K videos • 1.1K channels'}, 'trackingParams': token(40)}}}
+
+
+def hashtagContinuation() -> dict:
+    items = [{'richItemRenderer': {'content': searchVideo(), 'trackingParams': token(40)}} for _ in range(60)] + [continuation('4qmFsgLn')]
+    return {'responseContext': {'visitorData': token(48)}, 'trackingParams': token(40),
+            'onResponseReceivedActions': [{'clickTrackingParams': token(40), 'appendContinuationItemsAction': {'continuationItems': items, 'targetId': 'browse-feedFEhashtag'}}]}
+
+
+''' Same names & parsers as the fixtures written by record.py. '''
+FIXTURES = [
+    ('search', 'search', False, lambda: search()),
+    ('search_continuation', 'search', True, searchContinuation),
+    ('search_shelves', 'search', False, lambda: search(shelves=True)),
+    ('search_richgrid', 'search', False, searchRichGrid),
+    ('playlist', 'playlist', False, playlist),
+    ('playlist_continuation', 'playlist', True, playlistContinuation),
+    ('comments', 'comments', False, comments),
+    ('comments_continuation', 'comments', True, commentsContinuation),
+    ('player', 'player', False, player),
+    ('transcript', 'transcript', False, transcript),
+    ('channel_info', 'channel', False, lambda: channelResponse('About')),
+    ('channel_playlists', 'channel', False, lambda: channelResponse('Playlists')),
+    ('channel_playlists_continuation', 'channel', True, channelPlaylistsContinuation),
+    ('hashtag', 'hashtag', False, hashtag),
+    ('hashtag_continuation', 'hashtag', True, hashtagContinuation),
+]
+
+
+if __name__ == '__main__':
+    os.makedirs(directory, exist_ok=True)
+    manifest = {}
+    for name, parser, isContinuation, build in FIXTURES:
+        response = json.dumps(build(), separators=(',', ':'))
+        with open(os.path.join(directory, name + '.json'), 'w', encoding='utf_8') as file:
+            file.write(response)
+        manifest[name] = {'file': name + '.json', 'parser': parser, 'continuation': isContinuation}
+        print(f'Wrote {name} ({len(response) // 1024} KB).')
+    manifest['player_info'] = {'file': 'player.json', 'parser': 'playerInfo', 'continuation': False}
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf_8') as file:
+        json.dump(manifest, file, indent=4)
@@ -0,0 +1,127 @@
+'''Checks the video, playlist & channel link parsers against known links & measures how many links per second they parse.
+
+    python tests/benchmark/urls.py --count 1000000
+'''
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from youtubesearchpython.core.componenthandler import getChannelId, getPlaylistId, matchVideoId
+
+
+VIDEO_LINKS = {
+    'E07s5ZYygMg': 'E07s5ZYygMg',
+    ' E07s5ZYygMg\n': 'E07s5ZYygMg',
+    'https://www.youtube.com/watch?v=E07s5ZYygMg': 'E07s5ZYygMg',
+    'https://www.youtube.com/watch?v=E07s5ZYygMg&t=42s': 'E07s5ZYygMg',
+    'https://www.youtube.com/watch?feature=share&v=E07s5ZYygMg': 'E07s5ZYygMg',
+    'https://www.youtube.com/watch?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK&index=2&v=E07s5ZYygMg': 'E07s5ZYygMg',
+    'https://youtube.com/watch?v=E07s5ZYygMg#comments': 'E07s5ZYygMg',
+    'http://m.youtube.com/watch?v=E07s5ZYygMg': 'E07s5ZYygMg',
+    'music.youtube.com/watch?v=E07s5ZYygMg&feature=share': 'E07s5ZYygMg',
+    'https://youtu.be/E07s5ZYygMg': 'E07s5ZYygMg',
+    'https://youtu.be/E07s5ZYygMg/': 'E07s5ZYygMg',
+    'https://youtu.be/E07s5ZYygMg?t=10': 'E07s5ZYygMg',
+    'https://www.youtube.com/shorts/aqz-KE-bpKQ': 'aqz-KE-bpKQ',
+    'https://youtube.com/shorts/aqz-KE-bpKQ?feature=share': 'aqz-KE-bpKQ',
+    'https://www.youtube.com/embed/_ZdsmLgCVdU?autoplay=1': '_ZdsmLgCVdU',
+    'https://www.youtube-nocookie.com/embed/_ZdsmLgCVdU': '_ZdsmLgCVdU',
+    'https://www.youtube.com/live/L7kF4MXXCoA?si=abc': 'L7kF4MXXCoA',
+    'https://www.youtube.com/v/L7kF4MXXCoA': 'L7kF4MXXCoA',
+    'E07s5ZYygM': None,
+    'E07s5ZYygMgg': None,
+    'E07s5ZYygMh': None,
+    'E07s5ZYyg!g': None,
+    'https://www.youtube.com/watch?v=E07s5ZYygM': None,
+    'https://www.youtube.com/watch?v=E07s5ZYygMgX': None,
+    'https://www.youtube.com/watch?vv=E07s5ZYygMg': None,
+    'https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK': None,
+    'https://example.com/watch?v=E07s5ZYygMg': None,
+    'https://youtu.be/': None,
+    '': None,
+}
+
+PLAYLIST_LINKS = {
+    'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK': 'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK',
+    'https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK': 'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK',
+    'https://www.youtube.com/watch?v=E07s5ZYygMg&list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK&index=3': 'PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK',
+    'https://m.youtube.com/playlist?list=UU_aEa8K-EOJ3D6gOs7HcyNg': 'UU_aEa8K-EOJ3D6gOs7HcyNg',
+    'https://www.youtube.com/playlist?list=': None,
+    'https://www.youtube.com/watch?v=E07s5ZYygMg': None,
+    'PL RBp0Fe2Gpg': None,
+}
+
+CHANNEL_LINKS = {
+    'UC_aEa8K-EOJ3D6gOs7HcyNg': 'UC_aEa8K-EOJ3D6gOs7HcyNg',
+    'https://www.youtube.com/channel/UC_aEa8K-EOJ3D6gOs7HcyNg': 'UC_aEa8K-EOJ3D6gOs7HcyNg',
+    'https://www.youtube.com/channel/UC_aEa8K-EOJ3D6gOs7HcyNg/videos': 'UC_aEa8K-EOJ3D6gOs7HcyNg',
+    'https://m.youtube.com/channel/UC_aEa8K-EOJ3D6gOs7HcyNg?view_as=subscriber': 'UC_aEa8K-EOJ3D6gOs7HcyNg',
+    'UC_aEa8K-EOJ3D6gOs7HcyN': None,
+    'UC_aEa8K-EOJ3D6gOs7HcyNh': None,
+    'https://www.youtube.com/@NoCopyrightSounds': None,
+    'https://www.youtube.com/c/NoCopyrightSounds': None,
+}
+
+
+def legacyGetVideoId(videoLink: str) -> str:
+    if 'youtu.be' in videoLink:
+        if videoLink[-1] == '/':
+            return videoLink.split('/')[-2]
+        return videoLink.split('/')[-1]
+    elif 'youtube.com' in videoLink:
+        if '&' not in videoLink:
+            return videoLink[videoLink.index('v=') + 2:]
+        return videoLink[videoLink.index('v=') + 2: videoLink.index('&')]
+    else:
+        return videoLink
+
+
+def orNone(parse, link: str):
+    try:
+        return parse(link)
+    except Exception:
+        return None
+
+
+def check() -> list:
+    failures = []
+    for cases, parse in [(VIDEO_LINKS, matchVideoId), (PLAYLIST_LINKS, getPlaylistId), (CHANNEL_LINKS, getChannelId)]:
+        for link, expected in cases.items():
+            result = orNone(parse, link)
+            if result != expected:
+                failures.append(f'{parse.__name__}({link!r}) returned {result!r}, expected {expected!r}')
+    return failures
+
+
+def measure(parse, links: list) -> float:
+    start = time.perf_counter()
+    for link in links:
+        parse(link)
+    return len(links) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Checks & benchmarks the link parsers.')
+    parser.add_argument('--count', type=int, default=1000000, help='Number of links parsed by every parser. Defaults to 1000000.')
+    args = parser.parse_args()
+
+    failures = check()
+    for failure in failures:
+        print(failure)
+    print(f'{sum(map(len, [VIDEO_LINKS, PLAYLIST_LINKS, CHANNEL_LINKS])) - len(failures)} link checks passed, {len(failures)} failed.')
+
+    ''' Only links the legacy parser handles correctly, so both parse the same input. '''
+    valid = [link for link, expected in VIDEO_LINKS.items() if expected is not None and orNone(legacyGetVideoId, link) == expected]
+    links = list(itertools.islice(itertools.cycle(valid), args.count))
+    print(f"{'parser':<24}{'links/sec':>14}")
+    print(f"{'legacy getVideoId':<24}{measure(legacyGetVideoId, links):>14.0f}")
+    print(f"{'matchVideoId':<24}{measure(matchVideoId, links):>14.0f}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from youtubesearchpython import *
 
 
@@ -7,6 +10,16 @@ videoInfo = Video.getInfo('https://youtu.be/z0GKGpObgPY', mode = ResultMode.json
 print(videoInfo)
 videoFormats = Video.getFormats('z0GKGpObgPY')
 print(videoFormats)
+for video in Video.getMany(['z0GKGpObgPY', 'E07s5ZYygMg', 'https://youtu.be/K4DyBUG242c'], concurrency = 3, ordered = True):
+    print(video['id'], video['error'])
+
+watch = LiveWatch(['5qap5aO4i9A', 'E07s5ZYygMg'])
+print(watch.poll())
+watch.close()
+
+cache = VideoCache()
+video = Video.getInfo('E07s5ZYygMg', cache = cache)
+print(Video.getInfo('E07s5ZYygMg', cache = cache, fields = ['title']) == video)
 
 
 suggestions = Suggestions(language = 'en', region = 'US')
@@ -26,6 +39,11 @@ allUrlsB = fetcher.getAll(videoB)
 print(singleUrlA)
 print(allUrlsB)
 
+selector = PlayerClientSelector(raceWidth = 2)
+videoC = Video.getFormats("https://www.youtube.com/watch?v=aqz-KE-bpKQ", clientSelector = selector)
+print(videoC["streamingData"] is not None)
+print(selector.successRates())
+
 
 comments = Comments("_ZdsmLgCVdU")
 
@@ -36,6 +54,27 @@ while len(comments.comments["result"]) < 100:
     print(len(comments.comments["result"]))
 print("Found all comments")
 
+count = 0
+for comment in Comments.iter("_ZdsmLgCVdU"):
+    count += 1
+    if count == 100:
+        break
+print(f"Comments Streamed: {count}")
+
+count = 0
+for comment in Comments.iter("_ZdsmLgCVdU", replies = True):
+    count += len(comment["replies"])
+    if count >= 100:
+        break
+print(f"Replies Streamed: {count}")
+
+newestComments = list(Comments.iter("_ZdsmLgCVdU", sortBy = CommentsSortOrder.newest, maxComments = 50))
+print(f"Newest Comments: {len(newestComments)}")
+
+directory = os.path.join(tempfile.gettempdir(), "comments-export")
+for video in CommentsExporter(["_ZdsmLgCVdU"], directory, columnar = True, overwrite = True).export():
+    print(video)
+
 
 print(Transcript.get("https://www.youtube.com/watch?v=L7kF4MXXCoA"))
 
@@ -56,3 +95,14 @@ print(len(channel.result["playlists"]))
 while channel.has_more_playlists():
     channel.next()
     print(len(channel.result["playlists"]))
+
+for page in Channel.iter_playlists("UC_aEa8K-EOJ3D6gOs7HcyNg"):
+    print(page["info"]["title"] if page["info"] else None, len(page["playlists"]), page["hasMorePlaylists"])
+
+for channel in Channel.get_many(["UC_aEa8K-EOJ3D6gOs7HcyNg", "UCZFWPqqPkFlNwIxcpsLOwew"], rate = 5, report = os.path.join(tempfile.mkdtemp(), "report.json")):
+    print(channel["id"], channel["channel"]["subscribers"] if channel["channel"] else channel["error"])
+
+uploads = list(Channel.iter_uploads("UC_aEa8K-EOJ3D6gOs7HcyNg", since = "K4DyBUG242c"))
+print(f"New Uploads: {len(uploads)}")
+for page in Channel.crawl_uploads(["UC_aEa8K-EOJ3D6gOs7HcyNg", "UCZFWPqqPkFlNwIxcpsLOwew"]):
+    print(page["id"], len(page["videos"]), page["progress"]["done"])
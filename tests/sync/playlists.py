@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from youtubesearchpython import *
 
 playlist = Playlist.get('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', mode = ResultMode.json)
@@ -26,3 +29,20 @@ while playlist.hasMoreVideos:
 
 print('Found all the videos.')
 
+count = 0
+for video in Playlist.iter_videos('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK'):
+    count += 1
+print(f'Videos Streamed: {count}')
+
+checkpointFile = os.path.join(tempfile.gettempdir(), 'playlist-checkpoint.json')
+count = len(list(Playlist.iter_videos('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', checkpointFile = checkpointFile)))
+print(f'Videos Streamed With Checkpoints: {count}')
+os.remove(checkpointFile)
+
+newVideos = Playlist.getNewVideos(playlist_from_channel_id('UC_aEa8K-EOJ3D6gOs7HcyNg'), until = 'K4DyBUG242c')
+print(f'New Videos: {len(newVideos)}')
+
+scheduler = PlaylistScheduler(['PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', playlist_from_channel_id('UC_aEa8K-EOJ3D6gOs7HcyNg')], concurrency = 2)
+for page in scheduler.crawl():
+    print(page['id'], len(page['videos']), page['progress']['done'])
+
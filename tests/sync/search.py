@@ -21,6 +21,23 @@ customSearch = CustomSearch('NoCopyrightSounds', VideoSortOrder.uploadDate, lang
 print(customSearch.result())
 
 
+filteredSearch = CustomSearch('NoCopyrightSounds', SearchFilter(type = 'video', duration = 'short', sortBy = 'uploadDate'), language = 'en', region = 'US')
+print(filteredSearch.result())
+
+
+cache = SearchCache()
+cachedSearch = VideosSearch('NoCopyrightSounds', limit = 5, cache = cache)
+print(cachedSearch.result())
+cachedSearch = VideosSearch('nocopyrightsounds ', limit = 10, cache = cache)
+print(cachedSearch.result())
+
+
+multiSearch = MultiSearch('NoCopyrightSounds', [('en', 'US'), ('en', 'GB'), ('de', 'DE'), ('ja', 'JP')], limit = 5)
+print(multiSearch.result())
+multiSearch.next()
+print(multiSearch.result())
+
+
 search = VideosSearch('NoCopyrightSounds')
 index = 0
 for video in search.result()['result']:
@@ -43,6 +60,9 @@ print(channel.result(mode=ResultMode.json))
 channel = ChannelSearch('The Beatles - Topic', 'UC2XdaAVUannpujzv32jcouQ')
 print(channel.result(mode=ResultMode.json))
 
+results = list(ChannelSearch.iter('The Beatles - Topic', 'UC2XdaAVUannpujzv32jcouQ'))
+print(f"Channel Search Results: {len(results)}")
+
 #channel = ChannelPlaylistSearch('PewDiePie', 'UC-lHJZR3Gqxm24_Vd_AJ5Yw')
 #print(channel.result())
 
@@ -1,6 +1,10 @@
-from youtubesearchpython.__future__.search import Search, VideosSearch, ChannelsSearch, PlaylistsSearch, CustomSearch, ChannelSearch
-from youtubesearchpython.__future__.extras import Video, Playlist, Suggestions, Hashtag, Comments, Transcript, Channel
+from youtubesearchpython.__future__.search import Search, VideosSearch, ChannelsSearch, PlaylistsSearch, CustomSearch, ChannelSearch, MultiSearch
+from youtubesearchpython.__future__.extras import Video, Playlist, Suggestions, Hashtag, Comments, CommentsExporter, Transcript, Channel, LiveWatch, PlaylistScheduler
 from youtubesearchpython.__future__.streamurlfetcher import StreamURLFetcher
+from youtubesearchpython.core.searchfilter import SearchFilter
+from youtubesearchpython.core.searchcache import SearchCache
+from youtubesearchpython.core.video import PlayerClientSelector
+from youtubesearchpython.core.videocache import VideoCache
 from youtubesearchpython.core.utils import *
 from youtubesearchpython.core.constants import *
 
@@ -1,25 +1,40 @@
+import asyncio
 import copy
-from typing import Union
+import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Union
 
 from youtubesearchpython.core import VideoCore
+from youtubesearchpython.core.video import PlayerClientSelector
+from youtubesearchpython.core.videocache import VideoCache
+from youtubesearchpython.core.livewatch import LiveWatchCore
+from youtubesearchpython.core.batch import asyncBatch
+from youtubesearchpython.core.componenthandler import matchVideoId
 from youtubesearchpython.core.comments import CommentsCore
-from youtubesearchpython.core.constants import ResultMode, ChannelRequestType
+from youtubesearchpython.core.commentsexport import CommentsExporterCore
+from youtubesearchpython.core.constants import ResultMode, ChannelRequestType, CommentsSortOrder
 from youtubesearchpython.core.hashtag import HashtagCore
-from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.playlist import PlaylistCore, knownVideoIdSet
+from youtubesearchpython.core.playlistscheduler import ChannelUploadsCore, PlaylistSchedulerCore
 from youtubesearchpython.core.suggestions import SuggestionsCore
 from youtubesearchpython.core.transcript import TranscriptCore
+from youtubesearchpython.core.utils import playlist_from_channel_id
 from youtubesearchpython.core.channel import ChannelCore
+from youtubesearchpython.core.channelbatch import ChannelBatchCore
 
 
 class Video:
     @staticmethod
-    async def get(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, get_upload_date: bool = False) -> \
+    async def get(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, get_upload_date: bool = False, clientSelector: PlayerClientSelector = None, contentClass: str = None, cache: VideoCache = None, fields: List[str] = None) -> \
     Union[dict, None]:
         '''Fetches information and formats  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
+            clientSelector (PlayerClientSelector, optional): Chooses the player client adaptively, or races several of them. Defaults to None, which uses ANDROID.
+            contentClass (str, optional): Kind of the video e.g. 'ageRestricted', the clientSelector learns the best client for every kind separately. Defaults to None.
+            cache (VideoCache, optional): Shares results between requests & only fetches again when a field is stale. Defaults to None.
+            fields (List[str], optional): Fields which have to be fresh when read from the cache, others may be stale. Defaults to all of them.
 
         Examples:
 
@@ -259,19 +274,22 @@ class Video:
                     ]
                 }
         '''
-        video = VideoCore(videoLink, None, resultMode, timeout, get_upload_date)
+        video = VideoCore(videoLink, None, resultMode, timeout, get_upload_date, cache=cache, freshFields=fields)
         if get_upload_date:
-            await video.async_html_create()
-        await video.async_create()
+            await video.async_create_with_html(clientSelector, contentClass)
+        else:
+            await video.async_create(clientSelector, contentClass)
         return video.result
 
     @staticmethod
-    async def getInfo(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2) -> Union[dict, None]:
+    async def getInfo(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, cache: VideoCache = None, fields: List[str] = None) -> Union[dict, None]:
         '''Fetches only information  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
+            cache (VideoCache, optional): Shares results between requests & only fetches again when a field is stale. Defaults to None.
+            fields (List[str], optional): Fields which have to be fresh when read from the cache, others may be stale. Defaults to all of them.
 
         Examples:
 
@@ -346,18 +364,23 @@ class Video:
                 "link": "https://www.youtube.com/watch?v=E07s5ZYygMg",
             }
         '''
-        video = VideoCore(videoLink, "getInfo", resultMode, timeout, True)
-        await video.async_html_create()
-        video.post_request_only_html_processing()
+        video = VideoCore(videoLink, "getInfo", resultMode, timeout, True, cache=cache, freshFields=fields)
+        if not video.load_from_cache():
+            await video.async_html_create()
+            video.post_request_only_html_processing()
         return video.result
 
     @staticmethod
-    async def getFormats(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2) -> Union[dict, None]:
+    async def getFormats(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, clientSelector: PlayerClientSelector = None, contentClass: str = None, cache: VideoCache = None, fields: List[str] = None) -> Union[dict, None]:
         '''Fetches formats  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
+            clientSelector (PlayerClientSelector, optional): Chooses the player client adaptively, or races several of them. Defaults to None, which uses ANDROID.
+            contentClass (str, optional): Kind of the video e.g. 'ageRestricted', the clientSelector learns the best client for every kind separately. Defaults to None.
+            cache (VideoCache, optional): Shares results between requests & only fetches again when a field is stale. Defaults to None.
+            fields (List[str], optional): Fields which have to be fresh when read from the cache, others may be stale. Defaults to all of them.
 
         Examples:
 
@@ -532,10 +555,46 @@ class Video:
                 }
             }
         '''
-        video = VideoCore(videoLink, "getFormats", resultMode, timeout, False)
-        await video.async_create()
+        video = VideoCore(videoLink, "getFormats", resultMode, timeout, False, cache=cache, freshFields=fields)
+        await video.async_create(clientSelector, contentClass)
         return video.result
 
+    @staticmethod
+    async def getMany(videoLinks: Iterable[str], concurrency: int = 10, resultMode: int = ResultMode.dict, timeout: int = 2, get_upload_date: bool = False, ordered: bool = False, clientSelector: PlayerClientSelector = None, contentClass: str = None, cache: VideoCache = None, fields: List[str] = None) -> AsyncIterator[dict]:
+        '''Fetches information and formats for many video links or IDs concurrently, sharing one connection pool.
+        Results are yielded as soon as they are fetched. A failed video does not stop the others, its error is returned instead.
+
+        Args:
+            videoLinks (Iterable[str]): links or IDs of the videos on YouTube.
+            concurrency (int, optional): Maximum number of simultaneous requests. Defaults to 10.
+            timeout (int, optional): Seconds to wait for each request. Defaults to 2, the same as Video.get.
+            ordered (bool, optional): Yields results in the order of `videoLinks` instead of the order of completion. Defaults to False.
+            clientSelector (PlayerClientSelector, optional): Chooses the player client adaptively, or races several of them. Defaults to None, which uses ANDROID.
+            cache (VideoCache, optional): Shares results between requests & only fetches again when a field is stale. Defaults to None.
+            fields (List[str], optional): Fields which have to be fresh when read from the cache, others may be stale. Defaults to all of them.
+
+        Examples:
+            >>> async for video in Video.getMany(["E07s5ZYygMg", "K4DyBUG242c"], concurrency = 10):
+            >>>     print(video["id"], video["error"], video["result"]["title"] if video["result"] else None)
+            E07s5ZYygMg None Harry Styles - Watermelon Sugar (Official Video)
+            K4DyBUG242c None Cartoon - On & On (feat. Daniel Levi) [NCS Release]
+        '''
+        async def fetch(videoLink: str, client) -> Union[dict, None]:
+            video = VideoCore(videoLink, None, resultMode, timeout, get_upload_date, cache=cache, freshFields=fields)
+            video.asyncClient = client
+            if get_upload_date:
+                await video.async_create_with_html(clientSelector, contentClass)
+            else:
+                await video.async_create(clientSelector, contentClass)
+            return video.result
+
+        async for videoLink, result, error in asyncBatch(videoLinks, fetch, concurrency, ordered):
+            yield {
+                "id": matchVideoId(videoLink) or videoLink,
+                "result": result,
+                "error": str(error) if error else None,
+            }
+
 
 class Suggestions:
     '''Gets search suggestions for the given query.
@@ -585,6 +644,64 @@ class Suggestions:
         return suggestions
 
 
+class LiveWatch(LiveWatchCore):
+    '''Watches the live status of many videos, polling each of them every `interval` seconds with bounded concurrency.
+
+    Only the fields needed to notice a change (isLiveContent, lengthSeconds & viewCount) are requested & parsed.
+    Instead of complete video information, events are emitted when something changed:
+
+        'initial': first status of a video.
+        'started': the video became live.
+        'ended': the live stream ended.
+        'viewCount': view count changed by at least `minViewCountChange`.
+        'error': the status could not be fetched, the video is polled again later.
+
+    Args:
+        videoLinks (Iterable[str]): links or IDs of the videos on YouTube.
+        interval (float, optional): Seconds between two polls of the same video. Defaults to 5.
+        jitter (float, optional): Randomly varies every interval by up to this fraction, to spread the requests. Defaults to 0.2.
+        concurrency (int, optional): Maximum number of simultaneous requests. Defaults to 10.
+        minViewCountChange (int, optional): Smallest view count change, which emits an event. None never emits one. Defaults to 1.
+
+    Examples:
+        >>> watch = LiveWatch(['5qap5aO4i9A', 'jfKfPfyJRdk'], interval = 10)
+        >>> async for event in watch.events():
+        >>>     print(event['id'], event['type'], event['status']['isLiveNow'], event['status']['viewCount'])
+        5qap5aO4i9A initial True 1204
+        jfKfPfyJRdk initial True 31056
+        5qap5aO4i9A viewCount True 1210
+    '''
+    def __init__(self, videoLinks: Iterable[str], interval: float = 5, jitter: float = 0.2, concurrency: int = 10, minViewCountChange: int = 1, timeout: int = 2):
+        super().__init__(videoLinks, interval, jitter, concurrency, minViewCountChange, timeout)
+        self.stopped = False
+
+    async def poll(self) -> List[dict]:
+        '''Polls the videos, which are due, once & returns their events.
+        '''
+        return [event async for event in self._pollAsync()]
+
+    async def events(self) -> AsyncIterator[dict]:
+        '''Polls the videos on schedule & yields their events, until `stop` is called.
+        '''
+        self.stopped = False
+        try:
+            while not self.stopped:
+                async for event in self._pollAsync():
+                    yield event
+                if not self.stopped:
+                    await asyncio.sleep(self._waitTime())
+        finally:
+            await self.close()
+
+    def stop(self) -> None:
+        self.stopped = True
+
+    async def close(self) -> None:
+        '''Closes the connection pool, it is opened again by the next poll.
+        '''
+        await self._closeAsync()
+
+
 class Playlist:
     '''Fetches information and videos for the given playlist link.
     Returns None if playlist is unavailable.
@@ -627,6 +744,52 @@ class Playlist:
             self.videos = self.__playlist.playlistComponent['videos']
             self.hasMoreVideos = self.__playlist.continuationKey != None
 
+    @staticmethod
+    async def iter_videos(playlistLink: str, timeout: int = 2, prefetch: bool = True, until: Union[str, Iterable[str]] = None, checkpointFile: str = None) -> AsyncIterator[dict]:
+        '''Yields every video of the playlist, page by page as the pages are fetched.
+
+        Only the current page is kept in memory, so even very long playlists can be crawled.
+        With `prefetch`, the next page is requested while the current one is being consumed.
+
+        Args:
+            playlistLink (str): link of the playlist on YouTube.
+            prefetch (bool, optional): Requests the next page in the background. Defaults to True.
+            until (Union[str, Iterable[str]], optional): ID of the newest already known video, or IDs of all known videos.
+                Stops before the first known video, without requesting any further page. Defaults to None.
+            checkpointFile (str, optional): Path of a file, to which the crawl state is saved atomically after every page.
+                If the file already exists, the crawl resumes after the last page saved in it, so an interrupted crawl can be continued.
+                Once the crawl is complete, at the end of the playlist or at a video in `until`, the file is removed & the next crawl starts over.
+                The file holds the playlist ID, continuation key, number of pages & videos and the playlist info. Defaults to None.
+
+        Examples:
+            >>> async for video in Playlist.iter_videos("https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK"):
+            >>>     print(video["id"], video["title"])
+            LIvSF0fQPJc Alan Walker - Fade [NCS Release]
+            bM7SZ5SBzyY Alan Walker - Fade [NCS Release]
+        '''
+        playlist = PlaylistCore(playlistLink, None, ResultMode.dict, timeout)
+        async for page in playlist._asyncPages(prefetch, knownVideoIdSet(until), checkpointFile):
+            for video in page:
+                yield video
+
+    @staticmethod
+    async def getNewVideos(playlistLink: str, until: Union[str, Iterable[str]], timeout: int = 2) -> List[dict]:
+        '''Fetches the videos of a playlist, which were added after the already known ones e.g. new uploads of a channel.
+
+        Pagination stops at the first known video, so only the pages holding new videos are requested.
+        The playlist should be ordered newest first, like the uploads playlist of a channel.
+
+        Args:
+            playlistLink (str): link of the playlist on YouTube.
+            until (Union[str, Iterable[str]]): ID of the newest already known video, or IDs of all known videos.
+
+        Examples:
+            >>> videos = await Playlist.getNewVideos(playlist_from_channel_id("UC_aEa8K-EOJ3D6gOs7HcyNg"), until = "K4DyBUG242c")
+            >>> print([video["id"] for video in videos])
+            ['z0GKGpObgPY', 'bM7SZ5SBzyY']
+        '''
+        return [video async for video in Playlist.iter_videos(playlistLink, timeout, False, until)]
+
     @staticmethod
     async def get(playlistLink: str) -> Union[dict, str, None]:
         '''Fetches information and videos for the given playlist link.
@@ -1753,6 +1916,42 @@ class Playlist:
         return playlist.playlistComponent
 
 
+class PlaylistScheduler(PlaylistSchedulerCore):
+    '''Crawls many playlists at once, interleaving their continuation requests round-robin over a shared connection pool.
+
+    Every playlist is a chain of sequential requests, so each of them has at most one request in flight.
+    A playlist, which got its page, waits behind all other playlists before its next page is requested,
+    so one huge playlist cannot starve the others. A failed request is retried up to `retries` times, after a delay which doubles before every further retry.
+
+    Args:
+        playlistLinks (Iterable[str]): links or IDs of the playlists on YouTube.
+        concurrency (int, optional): Maximum number of simultaneous requests over all playlists. Defaults to 10.
+        checkpoints (Dict[str, dict], optional): Result of `checkpoints` of an earlier crawl, to resume it. Defaults to None.
+        retries (int, optional): Number of times a failed page is requested again. Defaults to 2.
+        until (Dict[str, Union[str, Iterable[str]]], optional): ID of the newest already known video, or IDs of all known videos, by playlist link or ID.
+            A playlist is done at its first known video, without requesting any further page. Defaults to None.
+        retryDelay (float, optional): Seconds to wait before the first retry of a page, doubled before every further one. Defaults to 1.
+
+    Examples:
+        >>> scheduler = PlaylistScheduler(["PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK", "UU_aEa8K-EOJ3D6gOs7HcyNg"], concurrency = 10)
+        >>> async for page in scheduler.crawl():
+        >>>     print(page["id"], len(page["videos"]), page["progress"]["videos"], page["progress"]["done"])
+        PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK 100 100 False
+        UU_aEa8K-EOJ3D6gOs7HcyNg 100 100 False
+        PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK 100 200 False
+        UU_aEa8K-EOJ3D6gOs7HcyNg 100 200 False
+        PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK 9 209 True
+    '''
+    def __init__(self, playlistLinks: Iterable[str], concurrency: int = 10, timeout: int = 2, checkpoints: Dict[str, dict] = None, retries: int = 2, until: Dict[str, Union[str, Iterable[str]]] = None, retryDelay: float = 1):
+        super().__init__(playlistLinks, concurrency, timeout, checkpoints, retries, until, retryDelay)
+
+    def crawl(self) -> AsyncIterator[dict]:
+        '''Yields every fetched page with the ID of its playlist & the progress of that playlist.
+        Continues playlists from their checkpoint, finished playlists are skipped.
+        '''
+        return self._asyncCrawl()
+
+
 class Hashtag(HashtagCore):
     '''Fetches videos for the given hashtag.
 
@@ -1853,13 +2052,14 @@ class Comments:
     hasMoreComments = True
     __comments = None
 
-    def __init__(self, playlistLink: str, timeout: int = None):
+    def __init__(self, playlistLink: str, timeout: int = None, sortBy: int = CommentsSortOrder.top):
         self.timeout = timeout
         self.playlistLink = playlistLink
+        self.sortBy = sortBy
 
     async def getNextComments(self) -> None:
         if self.__comments is None:
-            self.__comments = CommentsCore(self.playlistLink)
+            self.__comments = CommentsCore(self.playlistLink, self.sortBy)
             await self.__comments.async_create()
         else:
             await self.__comments.async_create_next()
@@ -1867,11 +2067,81 @@ class Comments:
         self.hasMoreComments = self.__comments.continuationKey is not None
 
     @staticmethod
-    async def get(playlistLink: str) -> Union[dict, str, None]:
-        pc = CommentsCore(playlistLink)
+    async def get(playlistLink: str, sortBy: int = CommentsSortOrder.top) -> Union[dict, str, None]:
+        pc = CommentsCore(playlistLink, sortBy)
         await pc.async_create()
         return pc.commentsComponent
 
+    @staticmethod
+    async def iter(videoLink: str, prefetch: bool = True, replies: bool = False, concurrency: int = 10, sortBy: int = CommentsSortOrder.top, maxComments: int = None, since: datetime.datetime = None) -> AsyncIterator[dict]:
+        '''Yields every comment of the video, page by page as the pages are fetched.
+
+        Only the current page is kept in memory, so videos with hundreds of thousands of comments can be read.
+        With `prefetch`, the next page is requested while the current one is being consumed.
+
+        Args:
+            videoLink (str): link or ID of the video on YouTube.
+            prefetch (bool, optional): Requests the next page in the background. Defaults to True.
+            replies (bool, optional): Fetches the replies of every comment & attaches them as its `replies` list.
+                The reply threads are fetched concurrently over a shared connection pool. If a thread fails, its comment gets an empty `replies` list
+                & the error as `repliesError`, and the other comments follow as usual. Defaults to False.
+            concurrency (int, optional): Maximum number of reply threads fetched at once. Defaults to 10.
+            sortBy (int, optional): Order of the comments, CommentsSortOrder.top or CommentsSortOrder.newest. Defaults to CommentsSortOrder.top.
+            maxComments (int, optional): Stops after this many comments, without requesting any further page. Defaults to None.
+            since (datetime.datetime, optional): Stops at the first comment published before this time. Requires CommentsSortOrder.newest.
+                YouTube only shows the relative time of a comment like "3 days ago", so the cut is approximate. Defaults to None.
+
+        Examples:
+            >>> async for comment in Comments.iter("_ZdsmLgCVdU"):
+            >>>     print(comment["author"]["name"], comment["content"])
+
+            >>> async for comment in Comments.iter("_ZdsmLgCVdU", replies = True):
+            >>>     print(comment["content"], len(comment["replies"]))
+
+            >>> async for comment in Comments.iter("_ZdsmLgCVdU", sortBy = CommentsSortOrder.newest, maxComments = 300):
+            >>>     print(comment["published"], comment["content"])
+        '''
+        comments = CommentsCore(videoLink, sortBy)
+        async for comment in comments._asyncComments(prefetch, replies, concurrency, maxComments, since):
+            yield comment
+
+
+class CommentsExporter(CommentsExporterCore):
+    '''Exports the comments of many videos to gzip compressed files, fetching up to `concurrency` videos at once.
+
+    The comments of every video are written to `<directory>/<videoId>.jsonl.gz`, one comment per line, in batches of `batchSize`,
+    so only one batch per video is kept in memory. With `columnar`, they are also written to `<videoId>.columns.json.gz` with typed columns:
+    id, authorId, text & published as str, publishedAt, votes & replyCount as int. `published` holds the relative text shown by YouTube,
+    like "3 weeks ago", & publishedAt the approximate unix time derived from it, or null if it could not be read.
+    Its first line holds the column types, every following line a row group, which maps each column to the list of its values.
+
+    Files only get their final name once the export of the video is complete, & videos, which were already exported, are skipped.
+    So an interrupted export can be continued by running it again.
+
+    Args:
+        videoLinks (Iterable[str]): links or IDs of the videos on YouTube.
+        directory (str): Directory, in which the files are written. Created if it doesn't exist.
+        columnar (bool, optional): Also writes the columnar file. Defaults to False.
+        concurrency (int, optional): Maximum number of videos exported at once. Defaults to 10.
+        batchSize (int, optional): Number of comments written at once. Defaults to 1000.
+        overwrite (bool, optional): Exports videos again, which were already exported. Defaults to False.
+
+    Examples:
+        >>> exporter = CommentsExporter(["_ZdsmLgCVdU", "E07s5ZYygMg"], "comments", columnar = True)
+        >>> async for video in exporter.export():
+        >>>     print(video["id"], video["comments"], video["error"])
+        E07s5ZYygMg 3458 None
+        _ZdsmLgCVdU 10873 None
+    '''
+    def __init__(self, videoLinks: Iterable[str], directory: str, columnar: bool = False, concurrency: int = 10, batchSize: int = 1000, overwrite: bool = False):
+        super().__init__(videoLinks, directory, columnar, concurrency, batchSize, overwrite)
+
+    def export(self) -> AsyncIterator[dict]:
+        '''Exports the videos & yields the result of every video as soon as it is done.
+        Each result holds the number of exported comments, which is None for skipped videos, the written files & the error, if the export failed.
+        '''
+        return self._asyncRun()
+
 
 class Transcript:
     @staticmethod
@@ -1896,3 +2166,87 @@ class Channel(ChannelCore):
         channel_core = ChannelCore(channel_id, request_type)
         await channel_core.async_create()
         return channel_core.result
+
+    @staticmethod
+    def get_many(channel_ids: Iterable[str], images: bool = False, concurrency: int = 10, rate: float = None, timeout: int = None, retries: int = 2, retry_delay: float = 1, report: str = None, report_interval: float = 10) -> AsyncIterator[dict]:
+        '''Refreshes the information of many channels at once over a shared connection pool, yielding every channel as soon as it arrives.
+
+        Every channel is a compact record of its metadata, like subscribers, views & joinedDate, without thumbnails or banners unless `images` is set.
+        With `report`, a JSON report of the progress, throughput & the error of every failed channel is written to that path
+        every `report_interval` seconds & once the batch is over.
+
+        Args:
+            channel_ids (Iterable[str]): links or IDs of the channels on YouTube.
+            images (bool, optional): Adds the thumbnails & banners to the records. Defaults to False.
+            concurrency (int, optional): Maximum number of simultaneous requests. Defaults to 10.
+            rate (float, optional): Maximum number of requests started per second. Defaults to None, which does not limit the rate.
+            retries (int, optional): Number of times a failed channel is requested again. Invalid links are not retried. Defaults to 2.
+            retry_delay (float, optional): Seconds to wait before the first retry of a channel, doubled before every further one. Defaults to 1.
+            report (str, optional): Path of the report file. Defaults to None.
+            report_interval (float, optional): Seconds between two writes of the report. Defaults to 10.
+
+        Examples:
+            >>> async for channel in Channel.get_many(["UC_aEa8K-EOJ3D6gOs7HcyNg", "UCZFWPqqPkFlNwIxcpsLOwew"], rate = 20, report = "report.json"):
+            >>>     if channel["error"] is None:
+            >>>         print(channel["id"], channel["channel"]["subscribers"]["simpleText"], channel["channel"]["views"])
+        '''
+        return ChannelBatchCore(channel_ids, images, concurrency, rate, timeout, retries, retry_delay, report, report_interval)._asyncRun()
+
+    @staticmethod
+    def iter_playlists(channel_id: str, info: bool = True, prefetch: bool = True) -> AsyncIterator[dict]:
+        '''Yields the playlists of the channel page by page, together with the channel information.
+
+        The information & the first page of playlists are requested at once, so the first page arrives after a single round trip.
+        It carries the merged result, like `Channel.get` returns it, with the first playlists. Later pages only carry their playlists.
+
+        Args:
+            channel_id (str): link or ID of the channel on YouTube.
+            info (bool, optional): Requests the channel information along with the first page. Defaults to True.
+            prefetch (bool, optional): Requests the next page in the background. Defaults to True.
+
+        Examples:
+            >>> async for page in Channel.iter_playlists("UC_aEa8K-EOJ3D6gOs7HcyNg"):
+            >>>     if page["info"]:
+            >>>         print(page["info"]["title"], page["info"]["subscribers"])
+            >>>     print(len(page["playlists"]), page["hasMorePlaylists"])
+        '''
+        return ChannelCore(channel_id, ChannelRequestType.playlists)._asyncInfoAndPlaylists(info, prefetch)
+
+    @staticmethod
+    def iter_uploads(channel_id: str, since: Union[str, Iterable[str]] = None, prefetch: bool = True, timeout: int = 2) -> AsyncIterator[dict]:
+        '''Yields the uploads of the channel, newest first, page by page as the pages of its uploads playlist are fetched.
+
+        Only the current page is kept in memory & with `prefetch`, the next page is requested while the current one is being consumed.
+
+        Args:
+            channel_id (str): link or ID of the channel on YouTube.
+            since (Union[str, Iterable[str]], optional): ID of the newest already seen video, or IDs of all seen videos.
+                Stops before the first seen video, without requesting any further page. Defaults to None.
+            prefetch (bool, optional): Requests the next page in the background. Defaults to True.
+
+        Examples:
+            >>> async for video in Channel.iter_uploads("UC_aEa8K-EOJ3D6gOs7HcyNg", since = "K4DyBUG242c"):
+            >>>     print(video["id"], video["title"])
+        '''
+        return Playlist.iter_videos(playlist_from_channel_id(channel_id), timeout, prefetch, since)
+
+    @staticmethod
+    def crawl_uploads(channel_ids: Iterable[str], since: Dict[str, Union[str, Iterable[str]]] = None, concurrency: int = 10, timeout: int = 2, retries: int = 2, retry_delay: float = 1) -> AsyncIterator[dict]:
+        '''Crawls the uploads of many channels at once, interleaving their pages round-robin over a shared connection pool.
+
+        Yields every fetched page with the ID of its channel & the progress of that channel, like `PlaylistScheduler.crawl`.
+        A channel is done at its first already seen video, so a regular refresh only requests the pages holding new uploads.
+
+        Args:
+            channel_ids (Iterable[str]): links or IDs of the channels on YouTube.
+            since (Dict[str, Union[str, Iterable[str]]], optional): ID of the newest already seen video, or IDs of all seen videos, by channel ID.
+                Defaults to None.
+            concurrency (int, optional): Maximum number of simultaneous requests over all channels. Defaults to 10.
+            retries (int, optional): Number of times a failed page is requested again. Defaults to 2.
+            retry_delay (float, optional): Seconds to wait before the first retry of a page, doubled before every further one. Defaults to 1.
+
+        Examples:
+            >>> async for page in Channel.crawl_uploads(["UC_aEa8K-EOJ3D6gOs7HcyNg", "UCZFWPqqPkFlNwIxcpsLOwew"], since = {"UC_aEa8K-EOJ3D6gOs7HcyNg": "K4DyBUG242c"}):
+            >>>     print(page["id"], len(page["videos"]), page["progress"]["done"])
+        '''
+        return ChannelUploadsCore(channel_ids, since, concurrency, timeout, retries, retry_delay)._asyncCrawl()
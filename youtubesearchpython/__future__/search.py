@@ -1,8 +1,10 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from youtubesearchpython.core.channelsearch import ChannelSearchCore
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.multisearch import MultiSearchCore
 from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.core.searchcache import SearchCache
 
 
 class Search(SearchCore):
@@ -13,6 +15,7 @@ class Search(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -71,9 +74,9 @@ class Search(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, cache: SearchCache = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, None, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, None, timeout, cache)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -87,6 +90,7 @@ class VideosSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -145,9 +149,9 @@ class VideosSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, cache: SearchCache = None):
         self.searchMode = (True, False, False)
-        super().__init__(query, limit, language, region, SearchMode.videos, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.videos, timeout, cache)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -161,6 +165,7 @@ class ChannelsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -194,9 +199,9 @@ class ChannelsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, cache: SearchCache = None):
         self.searchMode = (False, True, False)
-        super().__init__(query, limit, language, region, SearchMode.channels, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.channels, timeout, cache)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -210,6 +215,7 @@ class PlaylistsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -256,9 +262,9 @@ class PlaylistsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, cache: SearchCache = None):
         self.searchMode = (False, False, True)
-        super().__init__(query, limit, language, region, SearchMode.playlists, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.playlists, timeout, cache)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -273,15 +279,17 @@ class CustomSearch(SearchCore):
         4 - VideoSortOrder.viewCount
 
     There are many other to use.
+    Several filters & a sorting order can be combined into one value using `SearchFilter`, which can also be passed as `searchPreferences` directly.
     The value of `sp` parameter in the YouTube search query can be used as a search filter e.g. 
     `EgQIBRAB` from https://www.youtube.com/results?search_query=NoCopyrightSounds&sp=EgQIBRAB can be passed as `searchPreferences`, to get videos, which are uploaded this year.
 
     Args:
         query (str): Sets the search query.
-        searchPreferences (str): Sets the `sp` query parameter in the YouTube search request.
+        searchPreferences (Union[str, SearchFilter]): Sets the `sp` query parameter in the YouTube search request.
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
     
     Examples:
         Calling `result` method gives the search result.
@@ -340,9 +348,9 @@ class CustomSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, cache: SearchCache = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, searchPreferences, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, searchPreferences, timeout, cache)  # type: ignore
 
     async def next(self) -> Dict[str, Any]:
         return await self._nextAsync()  # type: ignore
@@ -422,3 +430,67 @@ class ChannelSearch(ChannelSearchCore):
 
     def __init__(self, query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: Optional[int] = None):
         super().__init__(query, language, region, searchPreferences, browseId, timeout)  # type: ignore
+
+    @staticmethod
+    async def iter(query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: Optional[int] = None, prefetch: bool = True) -> AsyncIterator[dict]:
+        '''Yields every result of the search in the channel, page by page as the pages are fetched.
+
+        Unlike `result`, which only holds the first page, the pages after it are requested as the results are consumed.
+        Only the current page is kept in memory & with `prefetch`, the next page is requested while the current one is being consumed.
+
+        Args:
+            query (str): Sets the search query.
+            browseId (str): Channel ID
+            prefetch (bool, optional): Requests the next page in the background. Defaults to True.
+
+        Examples:
+            >>> async for video in ChannelSearch.iter('Watermelon Sugar', "UCZFWPqqPkFlNwIxcpsLOwew"):
+            >>>     print(video["id"], video["title"])
+        '''
+        search = ChannelSearchCore(query, language, region, searchPreferences, browseId, timeout)
+        async for page in search._asyncPages(prefetch):
+            for result in page:
+                yield result
+
+
+class MultiSearch(MultiSearchCore):
+    '''Performs the same search in many languages & regions concurrently, over a shared connection pool.
+
+    Results are merged by their ID. Each result appears once, with its position in every language & region in `positions`.
+    Results are ordered by their combined ranking. Languages & regions, which failed, are listed in `errors`.
+
+    Args:
+        query (str): Sets the search query.
+        locales (List[Tuple[str, str]]): Pairs of language & region to search in e.g. [('en', 'US'), ('de', 'DE')].
+        limit (int, optional): Sets limit to the number of results in each language & region. Defaults to 20.
+        searchPreferences (Union[str, SearchFilter], optional): Sets the `sp` query parameter in the YouTube search request. Defaults to None.
+        concurrency (int, optional): Maximum number of simultaneous requests. Defaults to 10.
+
+    Examples:
+        Calling `next` method gives the merged search result of the next page.
+
+        >>> search = MultiSearch('Watermelon Sugar', [('en', 'US'), ('en', 'GB'), ('de', 'DE')], limit = 1)
+        >>> result = await search.next()
+        >>> print(result)
+        {
+            "result": [
+                {
+                    "type": "video",
+                    "id": "E07s5ZYygMg",
+                    "title": "Harry Styles - Watermelon Sugar (Official Video)",
+                    ...
+                    "positions": {
+                        "en-US": 0,
+                        "en-GB": 0,
+                        "de-DE": 0
+                    }
+                }
+            ],
+            "errors": {}
+        }
+    '''
+    def __init__(self, query: str, locales: List[Tuple[str, str]], limit: int = 20, searchPreferences: Optional[str] = None, concurrency: int = 10, timeout: Optional[int] = None):
+        super().__init__(query, locales, limit, searchPreferences, (True, True, True), concurrency, timeout)  # type: ignore
+
+    async def next(self) -> Dict[str, Any]:
+        return await self._nextAsync()  # type: ignore
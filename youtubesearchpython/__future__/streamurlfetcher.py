@@ -1,5 +1,6 @@
 from typing import Union
 from youtubesearchpython.core.streamurlfetcher import StreamURLFetcherCore
+from youtubesearchpython.core.video import PlayerClientSelector
 
 
 class StreamURLFetcher(StreamURLFetcherCore):
@@ -11,6 +12,8 @@ class StreamURLFetcher(StreamURLFetcherCore):
     Getting URLs or downloading streams using youtube-dl or PyTube is can be a slow, because of the fact that they make requests to fetch the same content, which one might have already recieved at the time of showing it to the user etc.
     This class makes use of PyTube (if installed) & makes some slight improvements to functioning of PyTube.
     
+    Age-restricted videos are retried with the TV_EMBED client, or with the clients which worked best so far if a `PlayerClientSelector` is passed.
+
     Call `self.getJavaScript` method before any other method from this class.
     Do not call this method more than once & avoid reinstaciating the class.
 
@@ -28,8 +31,8 @@ class StreamURLFetcher(StreamURLFetcherCore):
         >>> print(url)
         "https://r6---sn-gwpa-5bgk.googlevideo.com/videoplayback?expire=1610798125&ei=zX8CYITXEIGKz7sP9MWL0AE&ip=2409%3A4053%3A803%3A2b22%3Adc68%3Adfb9%3Aa676%3A26a3&id=o-APBakKSE2_eMDMegtCmeWXfuhhUfAzJTmOCWj4lkEjAM&itag=251&source=youtube&requiressl=yes&mh=aP&mm=31%2C29&mn=sn-gwpa-5bgk%2Csn-gwpa-qxad&ms=au%2Crdu&mv=m&mvi=6&pl=36&initcwndbps=146250&vprv=1&mime=audio%2Fwebm&ns=ULL4mkMO31KDtEhOjkOrmpkF&gir=yes&clen=10210834&dur=634.601&lmt=1544629945422176&mt=1610776131&fvip=6&keepalive=yes&c=WEB&txp=5511222&n=uEjSqtzBZaJyVn&sparams=expire%2Cei%2Cip%2Cid%2Citag%2Csource%2Crequiressl%2Cvprv%2Cmime%2Cns%2Cgir%2Cclen%2Cdur%2Clmt&sig=AOq0QJ8wRAIgKKIEiwQTgXsdKPEyOckgVPs_LMH6KJoeaYmZic_lelECIHXHs1ZnSP5mgtpffNlIMJM3DhxcvDbA-4udFFE6AmVP&lsparams=mh%2Cmm%2Cmn%2Cms%2Cmv%2Cmvi%2Cpl%2Cinitcwndbps&lsig=AG3C_xAwRQIhAPmhL745RYeL_ffgUJk_xJLC-8riXKMylLTLA_pITYWWAiB2qUIXur8ThW7cLfQ73mIVK61mMZc2ncK6FZWjUHGcUw%3D%3D"
     '''
-    def __init__(self):
-        super().__init__()
+    def __init__(self, clientSelector: PlayerClientSelector = None):
+        super().__init__(clientSelector)
 
     async def get(self, videoFormats: dict, itag: int) -> Union[str, None]:
         '''Gets direct stream URL for a YouTube video fetched using `Video.get` or `Video.getFormats`.
@@ -1,6 +1,10 @@
-from youtubesearchpython.search import Search, VideosSearch, ChannelsSearch, PlaylistsSearch, CustomSearch, ChannelSearch
-from youtubesearchpython.extras import Video, Playlist, Suggestions, Hashtag, Comments, Transcript, Channel
+from youtubesearchpython.search import Search, VideosSearch, ChannelsSearch, PlaylistsSearch, CustomSearch, ChannelSearch, MultiSearch
+from youtubesearchpython.extras import Video, Playlist, Suggestions, Hashtag, Comments, CommentsExporter, Transcript, Channel, LiveWatch, PlaylistScheduler
 from youtubesearchpython.streamurlfetcher import StreamURLFetcher
+from youtubesearchpython.core.searchfilter import SearchFilter
+from youtubesearchpython.core.searchcache import SearchCache
+from youtubesearchpython.core.video import PlayerClientSelector
+from youtubesearchpython.core.videocache import VideoCache
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.utils import *
 
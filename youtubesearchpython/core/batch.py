@@ -0,0 +1,123 @@
+import asyncio
+import collections
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Tuple, TypeVar
+
+import httpx
+
+from youtubesearchpython.core.requests import createAsyncClient, createSyncClient
+
+
+T = TypeVar('T')
+
+
+class RateLimiter:
+    '''Spaces the starts of requests evenly, so at most `rate` requests per second are sent over all threads or tasks sharing it.
+    '''
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.nextStart = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        # Takes the next free start time & returns how long to wait for it.
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.nextStart)
+            self.nextStart = start + self.interval
+            return start - now
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def asyncWait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def syncBatch(items: Iterable[T], fetch: Callable[[T, httpx.Client], Any], concurrency: int, ordered: bool = False, client: httpx.Client = None) -> Iterator[Tuple[T, Any, Exception]]:
+    '''Calls `fetch` for every item on a thread pool, sharing one connection pool.
+
+    Yields (item, result, error) tuples in completion order, or in input order if `ordered` is True.
+    At most `concurrency` items are in flight at once, so `items` may be a long or lazy iterable.
+    A connection pool is opened for the batch & closed afterwards, unless an open `client` is given.
+    '''
+    items = iter(items)
+    ownsClient = client is None
+    if ownsClient:
+        client = createSyncClient(concurrency)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = collections.OrderedDict()
+
+            def submit() -> bool:
+                for item in items:
+                    pending[executor.submit(fetch, item, client)] = item
+                    return True
+                return False
+
+            for _ in range(concurrency):
+                if not submit():
+                    break
+            while pending:
+                if ordered:
+                    future = next(iter(pending))
+                    wait([future])
+                    done = [future]
+                else:
+                    done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    submit()
+                    error = future.exception()
+                    yield item, None if error else future.result(), error
+    finally:
+        if ownsClient:
+            client.close()
+
+
+async def asyncBatch(items: Iterable[T], fetch: Callable[[T, httpx.AsyncClient], Awaitable[Any]], concurrency: int, ordered: bool = False, client: httpx.AsyncClient = None) -> AsyncIterator[Tuple[T, Any, Exception]]:
+    '''Awaits `fetch` for every item, sharing one connection pool.
+
+    Yields (item, result, error) tuples in completion order, or in input order if `ordered` is True.
+    At most `concurrency` items are in flight at once, so `items` may be a long or lazy iterable.
+    A connection pool is opened for the batch & closed afterwards, unless an open `client` is given.
+    '''
+    items = iter(items)
+    ownsClient = client is None
+    if ownsClient:
+        client = createAsyncClient(concurrency)
+    pending = collections.OrderedDict()
+
+    def submit() -> bool:
+        for item in items:
+            pending[asyncio.ensure_future(fetch(item, client))] = item
+            return True
+        return False
+
+    try:
+        for _ in range(concurrency):
+            if not submit():
+                break
+        while pending:
+            if ordered:
+                task = next(iter(pending))
+                await asyncio.wait([task])
+                done = [task]
+            else:
+                done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                submit()
+                error = task.exception()
+                yield item, None if error else task.result(), error
+    finally:
+        for task in pending:
+            task.cancel()
+        if ownsClient:
+            await client.aclose()
@@ -1,11 +1,20 @@
+import asyncio
 import copy
 import json
-from typing import Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Union, List
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
-from youtubesearchpython.core.componenthandler import getValue, getVideoId
+from youtubesearchpython.core.requests import RequestCore, createAsyncClient, createSyncClient
+from youtubesearchpython.core.componenthandler import getChannelId, getValue, getVideoId
+
+
+''' Titles of the tabs, which hold the results of a request type. Other request types look at every known tab. '''
+channelTabTitles = {
+    ChannelRequestType.info: ["About"],
+    ChannelRequestType.playlists: ["Playlists"],
+}
 
 
 class ChannelCore(RequestCore):
@@ -15,6 +24,9 @@ class ChannelCore(RequestCore):
         self.params = request_params
         self.result = {}
         self.continuation = None
+        ''' Playlists of the last fetched page. While streaming, these replace the earlier playlists in the result. '''
+        self.pagePlaylists = []
+        self.streaming = False
 
     def prepare_request(self):
         self.url = 'https://www.youtube.com/youtubei/v1/browse' + "?" + urlencode({
@@ -24,7 +36,7 @@ class ChannelCore(RequestCore):
         self.data = copy.deepcopy(requestPayload)
         if not self.continuation:
             self.data["params"] = self.params
-            self.data["browseId"] = self.browseId
+            self.data["browseId"] = getChannelId(self.browseId)
         else:
             self.data["continuation"] = self.continuation
 
@@ -56,10 +68,16 @@ class ChannelCore(RequestCore):
         
         tabData: dict = {}
         playlists: list = []
+        wantedTabs = set(channelTabTitles.get(self.params, ["Playlists", "About"]))
 
         for tab in getValue(response, ["contents", "twoColumnBrowseResultsRenderer", "tabs"]):
             tab: dict
+            if not wantedTabs:
+                break
             title = getValue(tab, ["tabRenderer", "title"])
+            if title not in wantedTabs:
+                continue
+            wantedTabs.discard(title)
             if title == "Playlists":
                 playlist = getValue(tab,
                                     ["tabRenderer", "content", "sectionListRenderer", "contents", 0, "itemSectionRenderer",
@@ -102,11 +120,13 @@ class ChannelCore(RequestCore):
             "country": getValue(metadata, ["country", "simpleText"]) if metadata else None,
             "playlists": playlists,
         }
+        self.pagePlaylists = playlists
 
     def parse_next_response(self):
         response = self.data.json()
 
         self.continuation = None
+        playlists = []
 
         response = getValue(response, ["onResponseReceivedActions", 0, "appendContinuationItemsAction", "continuationItems"])
         for i in response:
@@ -114,14 +134,20 @@ class ChannelCore(RequestCore):
                 self.continuation = getValue(i, ["continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"])
                 break
             elif getValue(i, ['gridPlaylistRenderer']):
-                self.result["playlists"].append(self.playlist_parse(getValue(i, ['gridPlaylistRenderer'])))
+                playlists.append(self.playlist_parse(getValue(i, ['gridPlaylistRenderer'])))
             # TODO: Handle other types like gridShowRenderer
+        self.pagePlaylists = playlists
+        if self.streaming:
+            self.result["playlists"] = playlists
+        else:
+            self.result["playlists"].extend(playlists)
 
     async def async_next(self):
         if not self.continuation:
             return
         self.prepare_request()
         self.data = await self.asyncPostRequest()
+        self._checkStatus()
         self.parse_next_response()
 
     def sync_next(self):
@@ -129,17 +155,117 @@ class ChannelCore(RequestCore):
             return
         self.prepare_request()
         self.data = self.syncPostRequest()
+        self._checkStatus()
         self.parse_next_response()
 
+    def _checkStatus(self) -> None:
+        if self.data.status_code != 200:
+            raise Exception('ERROR: Invalid status code.')
+
     def has_more_playlists(self):
         return self.continuation is not None
 
     async def async_create(self):
         self.prepare_request()
         self.data = await self.asyncPostRequest()
+        self._checkStatus()
         self.parse_response()
 
     def sync_create(self):
         self.prepare_request()
         self.data = self.syncPostRequest()
+        self._checkStatus()
         self.parse_response()
+
+    def _syncPages(self, prefetch: bool = True) -> Iterator[List[dict]]:
+        # Yields the playlists page by page. With `prefetch`, the next page is requested while the current one is consumed.
+        self.streaming = True
+        self.sync_create()
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while True:
+                page = self.pagePlaylists
+                if not self.continuation:
+                    yield page
+                    return
+                if executor is None:
+                    yield page
+                    self.sync_next()
+                else:
+                    nextPage = executor.submit(self.sync_next)
+                    yield page
+                    nextPage.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def _asyncPages(self, prefetch: bool = True) -> AsyncIterator[List[dict]]:
+        self.streaming = True
+        await self.async_create()
+        nextPage = None
+        try:
+            while True:
+                page = self.pagePlaylists
+                if not self.continuation:
+                    yield page
+                    return
+                if not prefetch:
+                    yield page
+                    await self.async_next()
+                else:
+                    nextPage = asyncio.ensure_future(self.async_next())
+                    yield page
+                    await nextPage
+                    nextPage = None
+        finally:
+            if nextPage is not None:
+                nextPage.cancel()
+
+    def _infoCore(self, info: bool) -> Union["ChannelCore", None]:
+        if not info:
+            return None
+        channel = ChannelCore(self.browseId, ChannelRequestType.info)
+        channel.client = self.client
+        channel.asyncClient = self.asyncClient
+        return channel
+
+    def _page(self, info: Union["ChannelCore", None], page: List[dict]) -> dict:
+        # The first page carries the channel information, merged with the first playlists.
+        result = None
+        if info is not None:
+            result = info.result
+            result["playlists"] = page
+        return {"info": result, "playlists": page, "hasMorePlaylists": self.has_more_playlists()}
+
+    def _syncInfoAndPlaylists(self, info: bool, prefetch: bool) -> Iterator[dict]:
+        # The information & the first playlists page are requested at once, the remaining pages are streamed.
+        with createSyncClient(2) as client, ThreadPoolExecutor(max_workers=1) as executor:
+            self.client = client
+            infoCore = self._infoCore(info)
+            infoRequest = executor.submit(infoCore.sync_create) if infoCore is not None else None
+            try:
+                for page in self._syncPages(prefetch):
+                    if infoRequest is not None:
+                        infoRequest.result()
+                        infoRequest = None
+                    yield self._page(infoCore, page)
+                    infoCore = None
+            finally:
+                self.client = None
+
+    async def _asyncInfoAndPlaylists(self, info: bool, prefetch: bool) -> AsyncIterator[dict]:
+        async with createAsyncClient(2) as client:
+            self.asyncClient = client
+            infoCore = self._infoCore(info)
+            infoRequest = asyncio.ensure_future(infoCore.async_create()) if infoCore is not None else None
+            try:
+                async for page in self._asyncPages(prefetch):
+                    if infoRequest is not None:
+                        await infoRequest
+                        infoRequest = None
+                    yield self._page(infoCore, page)
+                    infoCore = None
+            finally:
+                if infoRequest is not None:
+                    infoRequest.cancel()
+                self.asyncClient = None
@@ -0,0 +1,141 @@
+import asyncio
+import collections
+import time
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+import httpx
+
+from youtubesearchpython.core.batch import RateLimiter, asyncBatch, syncBatch
+from youtubesearchpython.core.channel import ChannelCore
+from youtubesearchpython.core.checkpoint import saveCheckpoint
+from youtubesearchpython.core.componenthandler import getChannelId
+from youtubesearchpython.core.constants import ChannelRequestType
+
+
+''' Fields of the compact channel records. The images are only added on request. '''
+channelRecordFields = ['id', 'url', 'title', 'description', 'subscribers', 'views', 'joinedDate', 'country', 'isFamilySafe', 'keywords', 'tags']
+channelImageFields = ['thumbnails', 'banners']
+
+
+def channelRecord(result: dict, images: bool) -> dict:
+    fields = channelRecordFields + channelImageFields if images else channelRecordFields
+    return {field: result[field] for field in fields}
+
+
+def channelKey(channelLink: str) -> str:
+    # Invalid links are kept as they are, so they are reported as failures of their own instead of stopping the batch.
+    try:
+        return getChannelId(channelLink)
+    except Exception:
+        return channelLink
+
+
+class ChannelBatchCore:
+    def __init__(self, channelIds: Iterable[str], images: bool, concurrency: int, rate: Optional[float], timeout: Optional[int], retries: int, retryDelay: float, reportPath: Optional[str], reportInterval: float):
+        self.images = images
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate) if rate else None
+        self.timeout = timeout
+        self.retries = retries
+        self.retryDelay = retryDelay
+        self.reportPath = reportPath
+        self.reportInterval = reportInterval
+        self.channelIds = list(collections.OrderedDict.fromkeys(channelKey(channelId) for channelId in channelIds))
+        self.succeeded = 0
+        self.failures = collections.OrderedDict()
+        self.startTime = None
+        self.reportTime = None
+
+    def report(self) -> dict:
+        '''Returns the number of refreshed & failed channels, the throughput & the error of every failed channel.
+        '''
+        done = self.succeeded + len(self.failures)
+        elapsed = time.monotonic() - self.startTime if self.startTime is not None else 0
+        return {
+            'total': len(self.channelIds),
+            'done': done,
+            'succeeded': self.succeeded,
+            'failed': len(self.failures),
+            'elapsed': round(elapsed, 3),
+            'channelsPerSecond': round(done / elapsed, 3) if elapsed else None,
+            'finished': done == len(self.channelIds),
+            'failures': dict(self.failures),
+        }
+
+    def _saveReport(self, force: bool) -> None:
+        if self.reportPath is None:
+            return
+        now = time.monotonic()
+        if force or now - self.reportTime >= self.reportInterval:
+            self.reportTime = now
+            saveCheckpoint(self.reportPath, self.report())
+
+    def _channel(self, channelId: str) -> ChannelCore:
+        channel = ChannelCore(channelId, ChannelRequestType.info)
+        if self.timeout is not None:
+            channel.timeout = self.timeout
+        return channel
+
+    def _backoff(self, attempt: int) -> float:
+        # Waits twice as long after every failed attempt, so a throttled batch slows down instead of hammering YouTube.
+        return self.retryDelay * 2 ** attempt
+
+    def _syncFetch(self, channelId: str, client: httpx.Client) -> dict:
+        # An invalid link fails right away, without any request or retry.
+        getChannelId(channelId)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._backoff(attempt - 1))
+            if self.limiter is not None:
+                self.limiter.wait()
+            channel = self._channel(channelId)
+            channel.client = client
+            try:
+                channel.sync_create()
+                return channelRecord(channel.result, self.images)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+
+    async def _asyncFetch(self, channelId: str, client: httpx.AsyncClient) -> dict:
+        getChannelId(channelId)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self._backoff(attempt - 1))
+            if self.limiter is not None:
+                await self.limiter.asyncWait()
+            channel = self._channel(channelId)
+            channel.asyncClient = client
+            try:
+                await channel.async_create()
+                return channelRecord(channel.result, self.images)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+
+    def _event(self, channelId: str, record: Optional[dict], error: Optional[Exception]) -> dict:
+        if error is None:
+            self.succeeded += 1
+        else:
+            self.failures[channelId] = str(error)
+        self._saveReport(False)
+        return {'id': channelId, 'channel': record, 'error': str(error) if error is not None else None}
+
+    def _start(self) -> None:
+        self.startTime = self.reportTime = time.monotonic()
+
+    def _syncRun(self) -> Iterator[dict]:
+        self._start()
+        try:
+            for channelId, record, error in syncBatch(self.channelIds, self._syncFetch, self.concurrency):
+                yield self._event(channelId, record, error)
+        finally:
+            self._saveReport(True)
+
+    async def _asyncRun(self) -> AsyncIterator[dict]:
+        self._start()
+        try:
+            async for channelId, record, error in asyncBatch(self.channelIds, self._asyncFetch, self.concurrency):
+                yield self._event(channelId, record, error)
+        finally:
+            self._saveReport(True)
@@ -1,5 +1,7 @@
+import asyncio
 import copy
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Union
 import json
 from urllib.parse import urlencode
 
@@ -34,6 +36,16 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
         self.response = self._getChannelSearchComponent(self.response)
         return self.response
 
+    def sync_next(self) -> None:
+        self._syncRequest(continuation = True)
+        self._parseChannelSearchContinuationSource()
+        self.response = self._getChannelSearchComponent(self.response)
+
+    async def async_next(self) -> None:
+        await self._asyncRequest(continuation = True)
+        self._parseChannelSearchContinuationSource()
+        self.response = self._getChannelSearchComponent(self.response)
+
     def _parseChannelSearchSource(self) -> None:
         try:
             last_tab = self.response["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][-1]
@@ -48,24 +60,36 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
         except:
             raise Exception('ERROR: Could not parse YouTube response.')
 
-    def _getRequestBody(self):
+    def _parseChannelSearchContinuationSource(self) -> None:
+        try:
+            if 'onResponseReceivedActions' in self.response:
+                self.response = self.response['onResponseReceivedActions'][0]['appendContinuationItemsAction']['continuationItems']
+            else:
+                self.response = []
+        except:
+            raise Exception('ERROR: Could not parse YouTube response.')
+
+    def _getRequestBody(self, continuation: bool = False):
         ''' Fixes #47 '''
         requestBody = copy.deepcopy(requestPayload)
-        requestBody['query'] = self.query
         requestBody['client'] = {
             'hl': self.language,
             'gl': self.region,
         }
-        requestBody['params'] = self.searchPreferences
-        requestBody['browseId'] = self.browseId
+        if continuation:
+            requestBody['continuation'] = self.continuationKey
+        else:
+            requestBody['query'] = self.query
+            requestBody['params'] = self.searchPreferences
+            requestBody['browseId'] = self.browseId
         self.url = 'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
             'key': searchKey,
         })
         self.data = requestBody
 
-    def _syncRequest(self) -> None:
+    def _syncRequest(self, continuation: bool = False) -> None:
         ''' Fixes #47 '''
-        self._getRequestBody()
+        self._getRequestBody(continuation)
 
         request = self.syncPostRequest()
         try:
@@ -73,9 +97,9 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
         except:
             raise Exception('ERROR: Could not make request.')
 
-    async def _asyncRequest(self) -> None:
+    async def _asyncRequest(self, continuation: bool = False) -> None:
         ''' Fixes #47 '''
-        self._getRequestBody()
+        self._getRequestBody(continuation)
 
         request = await self.asyncPostRequest()
         try:
@@ -95,3 +119,44 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
         elif mode == ResultMode.dict:
             return {'result': self.response}
 
+    def _syncPages(self, prefetch: bool = True) -> Iterator[list]:
+        # Yields the results page by page. With `prefetch`, the next page is requested while the current one is consumed.
+        self.sync_create()
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while True:
+                page = self.response
+                if not self.continuationKey:
+                    yield page
+                    return
+                if executor is None:
+                    yield page
+                    self.sync_next()
+                else:
+                    nextPage = executor.submit(self.sync_next)
+                    yield page
+                    nextPage.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def _asyncPages(self, prefetch: bool = True) -> AsyncIterator[list]:
+        await self.next()
+        nextPage = None
+        try:
+            while True:
+                page = self.response
+                if not self.continuationKey:
+                    yield page
+                    return
+                if not prefetch:
+                    yield page
+                    await self.async_next()
+                else:
+                    nextPage = asyncio.ensure_future(self.async_next())
+                    yield page
+                    await nextPage
+                    nextPage = None
+        finally:
+            if nextPage is not None:
+                nextPage.cancel()
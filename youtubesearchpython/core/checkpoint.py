@@ -0,0 +1,42 @@
+import json
+import os
+import tempfile
+from typing import Optional
+
+
+def loadCheckpoint(path: str) -> Optional[dict]:
+    '''Returns the checkpoint stored at `path`, or None if there is none yet.
+    '''
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf_8') as file:
+            return json.load(file)
+    except ValueError:
+        raise Exception('ERROR: Could not parse checkpoint file.')
+
+
+def saveCheckpoint(path: str, checkpoint: dict) -> None:
+    '''Replaces the checkpoint stored at `path` atomically.
+
+    The checkpoint is written to a temporary file next to `path` first, so a crash while writing leaves the previous one intact.
+    '''
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporaryPath = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf_8') as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporaryPath, path)
+    except:
+        if os.path.exists(temporaryPath):
+            os.remove(temporaryPath)
+        raise
+
+
+def removeCheckpoint(path: str) -> None:
+    '''Removes the checkpoint stored at `path`, if there is one.
+    '''
+    if os.path.exists(path):
+        os.remove(path)
@@ -1,30 +1,128 @@
+import asyncio
 import collections
 import copy
+import datetime
 import itertools
 import json
-from typing import Iterable, Mapping, Tuple, TypeVar, Union, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, Iterator, Mapping, Optional, Tuple, TypeVar, Union, List
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+import httpx
+
+from youtubesearchpython.core.batch import asyncBatch, syncBatch
 from youtubesearchpython.core.componenthandler import getVideoId, getValue
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, createAsyncClient, createSyncClient
 
 K = TypeVar("K")
 T = TypeVar("T")
 
 
+def parseComment(comment: dict) -> dict:
+    return {
+        "id": getValue(comment, ["commentId"]),
+        "author": {
+            "id": getValue(comment, ["authorEndpoint", "browseEndpoint", "browseId"]),
+            "name": getValue(comment, ["authorText", "simpleText"]),
+            "thumbnails": getValue(comment, ["authorThumbnail", "thumbnails"])
+        },
+        "content": getValue(comment, ["contentText", "runs", 0, "text"]),
+        "published": getValue(comment, ["publishedTimeText", "runs", 0, "text"]),
+        "isLiked": getValue(comment, ["isLiked"]),
+        "authorIsChannelOwner": getValue(comment, ["authorIsChannelOwner"]),
+        "voteStatus": getValue(comment, ["voteStatus"]),
+        "votes": {
+            "simpleText": getValue(comment, ["voteCount", "simpleText"]),
+            "label": getValue(comment, ["voteCount", "accessibility", "accessibilityData", "label"])
+        },
+        "replyCount": getValue(comment, ["replyCount"]),
+        "isPinned": "pinnedCommentBadge" in comment,
+    }
+
+
+publishedPattern = re.compile(r'(\d+)\s*(second|minute|hour|day|week|month|year)')
+publishedUnits = {
+    'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400, 'week': 604800, 'month': 2592000, 'year': 31536000,
+}
+
+
+def publishedAge(published: Optional[str]) -> Optional[datetime.timedelta]:
+    # YouTube only tells the relative time like "3 weeks ago (edited)", so the age is approximate.
+    match = publishedPattern.search(published or '')
+    if match is None:
+        return None
+    return datetime.timedelta(seconds=int(match.group(1)) * publishedUnits[match.group(2)])
+
+
+def replyContinuationKey(continuationItem: dict) -> Union[str, None]:
+    # The first page of replies is linked directly, further pages are behind a "Show more replies" button.
+    token = getValue(continuationItem, ["continuationEndpoint", "continuationCommand", "token"])
+    if token is None:
+        token = getValue(continuationItem, ["button", "buttonRenderer", "command", "continuationCommand", "token"])
+    return token
+
+
+class CommentRepliesCore(RequestCore):
+    '''Fetches all replies of a single comment thread, following the reply continuations.
+    '''
+    def __init__(self, continuationKey: str):
+        super().__init__()
+        self.continuationKey = continuationKey
+        self.replies = []
+
+    def prepare_request(self):
+        self.data = {
+            "context": {"client": {"clientName": "WEB", "clientVersion": "2.20210820.01.00"}},
+            "continuation": self.continuationKey
+        }
+        self.url = f"https://www.youtube.com/youtubei/v1/next?key={searchKey}"
+
+    def parse_response(self):
+        if self.response.status_code != 200:
+            raise Exception('ERROR: Invalid status code.')
+        items = getValue(self.response.json(), ["onResponseReceivedEndpoints", 0, "appendContinuationItemsAction", "continuationItems"])
+        self.continuationKey = None
+        for item in items or []:
+            if "commentRenderer" in item:
+                self.replies.append(parseComment(item["commentRenderer"]))
+            elif continuationItemKey in item:
+                self.continuationKey = replyContinuationKey(item[continuationItemKey])
+
+    def sync_create(self):
+        while self.continuationKey:
+            self.prepare_request()
+            self.response = self.syncPostRequest()
+            self.parse_response()
+
+    async def async_create(self):
+        while self.continuationKey:
+            self.prepare_request()
+            self.response = await self.asyncPostRequest()
+            self.parse_response()
+
+
 class CommentsCore(RequestCore):
     result = None
     continuationKey = None
     isNextRequest = False
     response = None
 
-    def __init__(self, videoLink: str):
+    def __init__(self, videoLink: str, sortBy: int = CommentsSortOrder.top):
         super().__init__()
         self.commentsComponent = {"result": []}
         self.responseSource = None
         self.videoLink = videoLink
+        self.sortBy = sortBy
+        ''' Comments of the last fetched page. While streaming, these replace the earlier comments in the result. '''
+        self.pageComments = []
+        self.streaming = False
+        ''' Continuations of the reply threads of fetched comments, by comment ID. Only kept while replies are requested,
+        & taken out when the replies are fetched or the comment is cut from its page. '''
+        self.replyContinuationKeys = {}
+        self.collectReplies = False
 
     def prepare_continuation_request(self):
         self.data = {
@@ -47,6 +145,19 @@ class CommentsCore(RequestCore):
             "continuationItems",
         ])
 
+    def parse_sort_source(self) -> bool:
+        # The first page comes in the default order. Its header holds the continuations of all sort orders.
+        if self.sortBy == CommentsSortOrder.top or self.response.status_code != 200:
+            return False
+        for endpoint in getValue(self.response.json(), ["onResponseReceivedEndpoints"]) or []:
+            for item in getValue(endpoint, ["reloadContinuationItemsCommand", "continuationItems"]) or []:
+                sortItems = getValue(item, ["commentsHeaderRenderer", "sortMenu", "sortFilterSubMenuRenderer", "subMenuItems"])
+                if sortItems and self.sortBy < len(sortItems):
+                    self.continuationKey = getValue(sortItems[self.sortBy], ["serviceEndpoint", "continuationCommand", "token"])
+                    if self.continuationKey:
+                        return True
+        raise Exception('ERROR: Could not retrieve the sort order of comments.')
+
     def parse_continuation_source(self):
         self.continuationKey = getValue(
             self.response.json(),
@@ -102,6 +213,8 @@ class CommentsCore(RequestCore):
     def sync_create(self):
         self.sync_make_continuation_request()
         self.sync_make_comment_request()
+        if self.parse_sort_source():
+            self.sync_make_comment_request()
         self.__getComponents()
 
     def sync_create_next(self):
@@ -112,6 +225,8 @@ class CommentsCore(RequestCore):
     async def async_create(self):
         await self.async_make_continuation_request()
         await self.async_make_comment_request()
+        if self.parse_sort_source():
+            await self.async_make_comment_request()
         self.__getComponents()
 
     async def async_create_next(self):
@@ -119,36 +234,165 @@ class CommentsCore(RequestCore):
         await self.async_make_comment_request()
         self.__getComponents()
 
+    def _checkStatus(self) -> None:
+        if self.response.status_code != 200:
+            raise Exception('ERROR: Invalid status code.')
+
+    def _limitPage(self, maxComments: Optional[int], since: Optional[datetime.datetime], count: int) -> Tuple[List[dict], bool]:
+        # Cuts the current page after `maxComments` comments in total, or at the first comment published before `since`.
+        # A pinned comment is shown first regardless of its age, so it is only left out. Returns the comments & whether to stop.
+        if maxComments is None and since is None:
+            return self.pageComments, False
+        now = datetime.datetime.now(since.tzinfo) if since is not None else None
+        page = []
+        for comment in self.pageComments:
+            if maxComments is not None and count + len(page) >= maxComments:
+                return page, True
+            if since is not None:
+                age = publishedAge(comment["published"])
+                if age is not None and now - age < since:
+                    if comment["isPinned"]:
+                        continue
+                    return page, True
+            page.append(comment)
+        return page, maxComments is not None and count + len(page) >= maxComments
+
+    def _dropReplyContinuations(self, page: List[dict]) -> None:
+        # The replies of comments, which were cut from the page, are never requested.
+        if len(page) != len(self.pageComments):
+            kept = set(comment["id"] for comment in page)
+            for comment in self.pageComments:
+                if comment["id"] not in kept:
+                    self.replyContinuationKeys.pop(comment["id"], None)
+
+    def _syncPages(self, prefetch: bool = True, maxComments: int = None, since: datetime.datetime = None) -> Iterator[List[dict]]:
+        # Yields the comments page by page. With `prefetch`, the next page is requested while the current one is consumed.
+        # Stops once `maxComments` or the first comment published before `since` is reached, without requesting any further page.
+        if since is not None and self.sortBy != CommentsSortOrder.newest:
+            raise Exception('ERROR: since can only be used with CommentsSortOrder.newest.')
+        self.streaming = True
+        self.sync_create()
+        self._checkStatus()
+        count = 0
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while True:
+                page, reachedLimit = self._limitPage(maxComments, since, count)
+                self._dropReplyContinuations(page)
+                count += len(page)
+                if reachedLimit or not self.continuationKey:
+                    yield page
+                    return
+                if executor is None:
+                    yield page
+                    self.sync_create_next()
+                else:
+                    nextPage = executor.submit(self.sync_create_next)
+                    yield page
+                    nextPage.result()
+                self._checkStatus()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def _asyncPages(self, prefetch: bool = True, maxComments: int = None, since: datetime.datetime = None) -> AsyncIterator[List[dict]]:
+        if since is not None and self.sortBy != CommentsSortOrder.newest:
+            raise Exception('ERROR: since can only be used with CommentsSortOrder.newest.')
+        self.streaming = True
+        await self.async_create()
+        self._checkStatus()
+        count = 0
+        nextPage = None
+        try:
+            while True:
+                page, reachedLimit = self._limitPage(maxComments, since, count)
+                self._dropReplyContinuations(page)
+                count += len(page)
+                if reachedLimit or not self.continuationKey:
+                    yield page
+                    return
+                if not prefetch:
+                    yield page
+                    await self.async_create_next()
+                else:
+                    nextPage = asyncio.ensure_future(self.async_create_next())
+                    yield page
+                    await nextPage
+                    nextPage = None
+                self._checkStatus()
+        finally:
+            if nextPage is not None:
+                nextPage.cancel()
+
+    def _syncReplies(self, comment: dict, client: httpx.Client) -> List[dict]:
+        replies = CommentRepliesCore(self.replyContinuationKeys.pop(comment["id"], None))
+        replies.client = client
+        replies.sync_create()
+        return replies.replies
+
+    async def _asyncReplies(self, comment: dict, client: httpx.AsyncClient) -> List[dict]:
+        replies = CommentRepliesCore(self.replyContinuationKeys.pop(comment["id"], None))
+        replies.asyncClient = client
+        await replies.async_create()
+        return replies.replies
+
+    def _syncComments(self, prefetch: bool, replies: bool, concurrency: int, maxComments: int = None, since: datetime.datetime = None) -> Iterator[dict]:
+        # With `replies`, the comments of all pages are fed lazily to one batch, which fetches up to `concurrency` reply threads at once.
+        # Every comment is yielded in order, as soon as its replies arrived.
+        if not replies:
+            for page in self._syncPages(prefetch, maxComments, since):
+                yield from page
+            return
+        self.collectReplies = True
+        with createSyncClient(concurrency + 1) as client:
+            self.client = client
+            comments = itertools.chain.from_iterable(self._syncPages(prefetch, maxComments, since))
+            for comment, commentReplies, error in syncBatch(comments, self._syncReplies, concurrency, ordered=True, client=client):
+                yield self.__withReplies(comment, commentReplies, error)
+
+    async def _asyncComments(self, prefetch: bool, replies: bool, concurrency: int, maxComments: int = None, since: datetime.datetime = None) -> AsyncIterator[dict]:
+        if not replies:
+            async for page in self._asyncPages(prefetch, maxComments, since):
+                for comment in page:
+                    yield comment
+            return
+        self.collectReplies = True
+        async with createAsyncClient(concurrency + 1) as client:
+            self.asyncClient = client
+            # The next page is prefetched while the replies of the current one are fetched.
+            async for page in self._asyncPages(prefetch, maxComments, since):
+                async for comment, commentReplies, error in asyncBatch(page, self._asyncReplies, concurrency, ordered=True, client=client):
+                    yield self.__withReplies(comment, commentReplies, error)
+
+    def __withReplies(self, comment: dict, commentReplies: List[dict], error: Exception) -> dict:
+        # A failed reply thread does not end the stream, the comment is yielded without its replies & with the error instead.
+        comment["replies"] = commentReplies if error is None else []
+        if error is not None:
+            comment["repliesError"] = str(error)
+        return comment
+
     def __getComponents(self) -> None:
         comments = []
-        for comment in self.responseSource:
-            comment = getValue(comment, ["commentThreadRenderer", "comment", "commentRenderer"])
+        for thread in self.responseSource or []:
+            comment = getValue(thread, ["commentThreadRenderer", "comment", "commentRenderer"])
             #print(json.dumps(comment, indent=4))
             try:
-                j = {
-                    "id": self.__getValue(comment, ["commentId"]),
-                    "author": {
-                        "id": self.__getValue(comment, ["authorEndpoint", "browseEndpoint", "browseId"]),
-                        "name": self.__getValue(comment, ["authorText", "simpleText"]),
-                        "thumbnails": self.__getValue(comment, ["authorThumbnail", "thumbnails"])
-                    },
-                    "content": self.__getValue(comment, ["contentText", "runs", 0, "text"]),
-                    "published": self.__getValue(comment, ["publishedTimeText", "runs", 0, "text"]),
-                    "isLiked": self.__getValue(comment, ["isLiked"]),
-                    "authorIsChannelOwner": self.__getValue(comment, ["authorIsChannelOwner"]),
-                    "voteStatus": self.__getValue(comment, ["voteStatus"]),
-                    "votes": {
-                        "simpleText": self.__getValue(comment, ["voteCount", "simpleText"]),
-                        "label": self.__getValue(comment, ["voteCount", "accessibility", "accessibilityData", "label"])
-                    },
-                    "replyCount": self.__getValue(comment, ["replyCount"]),
-                }
+                j = parseComment(comment)
                 comments.append(j)
             except:
-                pass
+                continue
+            if not self.collectReplies:
+                continue
+            for item in getValue(thread, ["commentThreadRenderer", "replies", "commentRepliesRenderer", "contents"]) or []:
+                if continuationItemKey in item:
+                    self.replyContinuationKeys[j["id"]] = replyContinuationKey(item[continuationItemKey])
 
-        self.commentsComponent["result"].extend(comments)
-        self.continuationKey = self.__getValue(self.responseSource, [-1, "continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"])
+        self.pageComments = comments
+        if self.streaming:
+            self.commentsComponent["result"] = comments
+        else:
+            self.commentsComponent["result"].extend(comments)
+        self.continuationKey = self.__getValue(self.responseSource, [-1, "continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"]) if self.responseSource else None
 
     def __result(self, mode: int) -> Union[dict, str]:
         if mode == ResultMode.dict:
@@ -0,0 +1,176 @@
+import collections
+import gzip
+import json
+import os
+import re
+import time
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+
+import httpx
+
+from youtubesearchpython.core.batch import asyncBatch, syncBatch
+from youtubesearchpython.core.comments import CommentsCore, publishedAge
+from youtubesearchpython.core.componenthandler import getVideoId, matchVideoId
+
+
+''' Columns of the columnar export & their types. '''
+columnTypes = collections.OrderedDict([
+    ('id', 'str'),
+    ('authorId', 'str'),
+    ('text', 'str'),
+    ('published', 'str'),
+    ('publishedAt', 'int'),
+    ('votes', 'int'),
+    ('replyCount', 'int'),
+])
+
+countPattern = re.compile(r'([\d.,]+)\s*([KMB]?)', re.IGNORECASE)
+countMultipliers = {'': 1, 'K': 1000, 'M': 1000000, 'B': 1000000000}
+
+
+def parseCount(text: Optional[str]) -> int:
+    # Vote counts are abbreviated like "1.2K". YouTube shows no count for comments without votes.
+    if not text:
+        return 0
+    match = countPattern.search(text)
+    if match is None:
+        return 0
+    return int(float(match.group(1).replace(',', '')) * countMultipliers[match.group(2).upper()])
+
+
+def commentRow(comment: dict, now: float) -> dict:
+    # `published` is the relative text YouTube shows, like "3 weeks ago". `publishedAt` is the unix time derived from it,
+    # as approximate as the text itself, or None if the text could not be read.
+    age = publishedAge(comment['published'])
+    return {
+        'id': comment['id'],
+        'authorId': comment['author']['id'],
+        'text': comment['content'],
+        'published': comment['published'],
+        'publishedAt': int(now - age.total_seconds()) if age is not None else None,
+        'votes': parseCount(comment['votes']['simpleText']),
+        'replyCount': comment['replyCount'] or 0,
+    }
+
+
+class CommentsExportWriter:
+    '''Writes the comments of a single video batch by batch.
+
+    Files are written under a `.part` name & only renamed once the export is complete,
+    so an interrupted export never leaves a file, which looks complete.
+    '''
+    def __init__(self, path: str, columnar: bool):
+        self.paths = [path + '.jsonl.gz']
+        if columnar:
+            self.paths.append(path + '.columns.json.gz')
+        self.rows = gzip.open(self.paths[0] + '.part', 'wt', encoding='utf_8')
+        self.columns = None
+        if columnar:
+            self.columns = gzip.open(self.paths[1] + '.part', 'wt', encoding='utf_8')
+            self.columns.write(json.dumps({'columns': columnTypes}) + '\n')
+        self.count = 0
+
+    def write(self, comments: List[dict]) -> None:
+        if not comments:
+            return
+        self.rows.write(''.join(json.dumps(comment, ensure_ascii=False) + '\n' for comment in comments))
+        if self.columns is not None:
+            now = time.time()
+            rows = [commentRow(comment, now) for comment in comments]
+            group = {'rows': len(rows)}
+            for column in columnTypes:
+                group[column] = [row[column] for row in rows]
+            self.columns.write(json.dumps(group, ensure_ascii=False) + '\n')
+        self.count += len(comments)
+
+    def close(self, complete: bool) -> None:
+        self.rows.close()
+        if self.columns is not None:
+            self.columns.close()
+        for path in self.paths:
+            if complete:
+                os.replace(path + '.part', path)
+            elif os.path.exists(path + '.part'):
+                os.remove(path + '.part')
+
+
+class CommentsExporterCore:
+    def __init__(self, videoLinks: Iterable[str], directory: str, columnar: bool, concurrency: int, batchSize: int, overwrite: bool):
+        self.directory = directory
+        self.columnar = columnar
+        self.concurrency = concurrency
+        self.batchSize = batchSize
+        self.overwrite = overwrite
+        ''' Invalid links are kept as they are, so they are reported as failed exports instead of stopping the others. '''
+        self.videoIds = list(collections.OrderedDict.fromkeys(matchVideoId(videoLink) or videoLink for videoLink in videoLinks))
+
+    def _paths(self, videoId: str) -> List[str]:
+        path = os.path.join(self.directory, videoId)
+        return [path + '.jsonl.gz'] + ([path + '.columns.json.gz'] if self.columnar else [])
+
+    def _exported(self, videoId: str) -> bool:
+        return not self.overwrite and all(os.path.exists(path) for path in self._paths(videoId))
+
+    def _writer(self, videoId: str) -> CommentsExportWriter:
+        os.makedirs(self.directory, exist_ok=True)
+        return CommentsExportWriter(os.path.join(self.directory, videoId), self.columnar)
+
+    def _syncExport(self, videoId: str, client: httpx.Client) -> Optional[int]:
+        # Many videos are exported at once, so their pages aren't prefetched individually.
+        getVideoId(videoId)
+        if self._exported(videoId):
+            return None
+        comments = CommentsCore(videoId)
+        comments.client = client
+        writer = self._writer(videoId)
+        try:
+            batch = []
+            for page in comments._syncPages(prefetch=False):
+                batch.extend(page)
+                if len(batch) >= self.batchSize:
+                    writer.write(batch)
+                    batch = []
+            writer.write(batch)
+        except:
+            writer.close(False)
+            raise
+        writer.close(True)
+        return writer.count
+
+    async def _asyncExport(self, videoId: str, client: httpx.AsyncClient) -> Optional[int]:
+        getVideoId(videoId)
+        if self._exported(videoId):
+            return None
+        comments = CommentsCore(videoId)
+        comments.asyncClient = client
+        writer = self._writer(videoId)
+        try:
+            batch = []
+            async for page in comments._asyncPages(prefetch=False):
+                batch.extend(page)
+                if len(batch) >= self.batchSize:
+                    writer.write(batch)
+                    batch = []
+            writer.write(batch)
+        except:
+            writer.close(False)
+            raise
+        writer.close(True)
+        return writer.count
+
+    def _event(self, videoId: str, count: Optional[int], error: Optional[Exception]) -> dict:
+        return {
+            'id': videoId,
+            'comments': count,
+            'files': self._paths(videoId) if error is None else [],
+            'skipped': error is None and count is None,
+            'error': str(error) if error is not None else None,
+        }
+
+    def _syncRun(self) -> Iterator[dict]:
+        for videoId, count, error in syncBatch(self.videoIds, self._syncExport, self.concurrency):
+            yield self._event(videoId, count, error)
+
+    async def _asyncRun(self) -> AsyncIterator[dict]:
+        async for videoId, count, error in asyncBatch(self.videoIds, self._asyncExport, self.concurrency):
+            yield self._event(videoId, count, error)
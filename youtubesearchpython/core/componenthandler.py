@@ -1,4 +1,5 @@
-from typing import Union, List
+import re
+from typing import Optional, Union, List
 
 
 def getValue(source: dict, path: List[str]) -> Union[str, int, dict, None]:
@@ -19,15 +20,69 @@ def getValue(source: dict, path: List[str]) -> Union[str, int, dict, None]:
     return value
 
 
+''' Video IDs are 11 characters long & encode 64 bits, so the last character only takes 16 values. '''
+videoLinkPattern = re.compile(
+    r'(?:https?://)?(?:(?:www|m|music)\.)?'
+    r'(?:youtube\.com/(?:watch/?\?(?:[^#]*?&)?v=|shorts/|embed/|live/|v/|e/)|youtube-nocookie\.com/embed/|youtu\.be/)'
+    r'(?P<id>[A-Za-z0-9_-]{10}[AEIMQUYcgkosw048])(?:[?&#/].*)?'
+)
+playlistIdPattern = re.compile(r'[A-Za-z0-9_-]{2,}')
+playlistLinkPattern = re.compile(
+    r'(?:https?://)?(?:(?:www|m|music)\.)?(?:youtube\.com|youtu\.be)/[^?#]*\?(?:[^#]*?&)?list=(?P<id>[A-Za-z0-9_-]{2,})(?:[&#].*)?'
+)
+channelIdPattern = re.compile(r'UC[A-Za-z0-9_-]{21}[AQgw]')
+channelLinkPattern = re.compile(
+    r'(?:https?://)?(?:(?:www|m|music)\.)?youtube\.com/channel/(?P<id>UC[A-Za-z0-9_-]{21}[AQgw])(?:[/?#].*)?'
+)
+
+
+''' Bare IDs are checked with string operations, and plain watch & youtu.be links with a short pattern, before the full one. '''
+videoIdCharacters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-'
+plainVideoLinkPattern = re.compile(
+    r'https://(?:(?:www\.|m\.)?youtube\.com/watch\?v=|youtu\.be/)(?P<id>[A-Za-z0-9_-]{10}[AEIMQUYcgkosw048])(?:[?&#/].*)?'
+)
+
+
+def matchVideoId(videoLink: str) -> Optional[str]:
+    '''Returns the ID of a YouTube video link or ID, or None if it is not one.
+
+    Accepts watch, youtu.be, shorts, embed & live links of youtube.com, m.youtube.com & music.youtube.com.
+    '''
+    videoLink = videoLink.strip()
+    if len(videoLink) == 11:
+        return videoLink if videoLink[10] in 'AEIMQUYcgkosw048' and not videoLink.strip(videoIdCharacters) else None
+    match = plainVideoLinkPattern.fullmatch(videoLink) or videoLinkPattern.fullmatch(videoLink)
+    return match.group('id') if match else None
+
+
 def getVideoId(videoLink: str) -> str:
-    if 'youtu.be' in videoLink:
-        if videoLink[-1] == '/':
-            return videoLink.split('/')[-2]
-        return videoLink.split('/')[-1]
-    elif 'youtube.com' in videoLink:
-        if '&' not in videoLink:
-            return videoLink[videoLink.index('v=') + 2:]
-        return videoLink[videoLink.index('v=') + 2: videoLink.index('&')]
-    else:
-        return videoLink
+    videoId = matchVideoId(videoLink)
+    if videoId is None:
+        raise Exception('ERROR: Invalid video link or ID.')
+    return videoId
+
+
+def getPlaylistId(playlistLink: str) -> str:
+    playlistLink = playlistLink.strip()
+    match = playlistLinkPattern.fullmatch(playlistLink)
+    if match:
+        return match.group('id')
+    if playlistIdPattern.fullmatch(playlistLink):
+        return playlistLink
+    raise Exception('ERROR: Invalid playlist link or ID.')
+
+
+def getChannelId(channelLink: str) -> str:
+    channelLink = channelLink.strip()
+    if channelIdPattern.fullmatch(channelLink):
+        return channelLink
+    match = channelLinkPattern.fullmatch(channelLink)
+    if match:
+        return match.group('id')
+    raise Exception('ERROR: Invalid channel link or ID.')
+
+
+def uploadsPlaylistId(channelLink: str) -> str:
+    ''' Every channel has a playlist of all its uploads, newest first. Its ID is the channel ID with "UU" instead of "UC". '''
+    return 'UU' + getChannelId(channelLink)[2:]
 
@@ -69,6 +69,11 @@ class VideoSortOrder:
     rating = 'CAESAhAB'
 
 
+class CommentsSortOrder:
+    top = 0
+    newest = 1
+
+
 class ChannelRequestType:
     info = "EgVhYm91dA%3D%3D"
     playlists = "EglwbGF5bGlzdHMYAyABcAA%3D"
@@ -0,0 +1,109 @@
+import random
+import time
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+
+import httpx
+
+from youtubesearchpython.core.batch import asyncBatch, syncBatch
+from youtubesearchpython.core.componenthandler import getVideoId
+from youtubesearchpython.core.constants import ResultMode
+from youtubesearchpython.core.requests import createAsyncClient, createSyncClient
+from youtubesearchpython.core.video import VideoCore
+
+
+class LiveWatchCore:
+    def __init__(self, videoLinks: Iterable[str], interval: float, jitter: float, concurrency: int, minViewCountChange: Optional[int], timeout: int):
+        self.interval = interval
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.minViewCountChange = minViewCountChange
+        self.timeout = timeout
+        ''' Last known status & time of the next poll of every watched video. '''
+        self.statuses = {}
+        self.due = {}
+        self.client = None
+        self.asyncClient = None
+        for videoLink in videoLinks:
+            self.add(videoLink)
+
+    def add(self, videoLink: str) -> None:
+        '''Starts watching a video, which is polled right away.
+        '''
+        videoId = getVideoId(videoLink)
+        if videoId not in self.due:
+            self.due[videoId] = time.monotonic()
+
+    def remove(self, videoLink: str) -> None:
+        '''Stops watching a video.
+        '''
+        videoId = getVideoId(videoLink)
+        self.due.pop(videoId, None)
+        self.statuses.pop(videoId, None)
+
+    def _delay(self) -> float:
+        # Spreads the polls of videos added at the same time, instead of sending them in bursts.
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _dueVideoIds(self) -> List[str]:
+        now = time.monotonic()
+        return [videoId for videoId, due in self.due.items() if due <= now]
+
+    def _waitTime(self) -> float:
+        if not self.due:
+            return self.interval
+        return max(0, min(self.due.values()) - time.monotonic())
+
+    def _events(self, videoId: str, status: Optional[dict], error: Optional[Exception]) -> List[dict]:
+        if videoId not in self.due:
+            return []
+        self.due[videoId] = time.monotonic() + self._delay()
+        if error is not None:
+            return [{'id': videoId, 'type': 'error', 'status': self.statuses.get(videoId), 'previous': None, 'error': str(error)}]
+        previous = self.statuses.get(videoId)
+        self.statuses[videoId] = status
+        if previous is None:
+            types = ['initial']
+        else:
+            types = []
+            if status['isLiveNow'] and not previous['isLiveNow']:
+                types.append('started')
+            elif previous['isLiveNow'] and not status['isLiveNow']:
+                types.append('ended')
+            if self.minViewCountChange is not None and status['viewCount'] is not None and previous['viewCount'] is not None \
+                    and abs(status['viewCount'] - previous['viewCount']) >= self.minViewCountChange:
+                types.append('viewCount')
+        return [{'id': videoId, 'type': eventType, 'status': status, 'previous': previous, 'error': None} for eventType in types]
+
+    def _syncStatus(self, videoId: str, client: httpx.Client) -> dict:
+        video = VideoCore(videoId, None, ResultMode.dict, self.timeout, False)
+        video.client = client
+        return video.sync_live_status()
+
+    async def _asyncStatus(self, videoId: str, client: httpx.AsyncClient) -> dict:
+        video = VideoCore(videoId, None, ResultMode.dict, self.timeout, False)
+        video.asyncClient = client
+        return await video.async_live_status()
+
+    def _poll(self) -> Iterator[dict]:
+        # Polls every video, which is due, yielding the events as soon as its status arrives.
+        if self.client is None:
+            self.client = createSyncClient(self.concurrency)
+        for videoId, status, error in syncBatch(self._dueVideoIds(), self._syncStatus, self.concurrency, client=self.client):
+            yield from self._events(videoId, status, error)
+
+    async def _pollAsync(self) -> AsyncIterator[dict]:
+        if self.asyncClient is None:
+            self.asyncClient = createAsyncClient(self.concurrency)
+        async for videoId, status, error in asyncBatch(self._dueVideoIds(), self._asyncStatus, self.concurrency, client=self.asyncClient):
+            for event in self._events(videoId, status, error):
+                yield event
+
+    def _close(self) -> None:
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    async def _closeAsync(self) -> None:
+        if self.asyncClient is not None:
+            await self.asyncClient.aclose()
+            self.asyncClient = None
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Union
+
+from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.requests import createAsyncClient, createSyncClient
+from youtubesearchpython.core.search import SearchCore
+
+
+''' Constant of the reciprocal rank fusion, used to merge rankings of different regions. '''
+rankConstant = 60
+
+
+class MultiSearchCore:
+    def __init__(self, query: str, locales: List[Tuple[str, str]], limit: int, searchPreferences: str, searchMode: Tuple[bool, bool, bool], concurrency: int, timeout: int):
+        self.query = query
+        self.searchMode = searchMode
+        self.concurrency = concurrency
+        self.searches = {}
+        self.offsets = {}
+        for language, region in locales:
+            locale = f'{language}-{region}'
+            search = SearchCore(query, limit, language, region, searchPreferences, timeout)
+            search.searchMode = searchMode
+            self.searches[locale] = search
+            self.offsets[locale] = 0
+        self.resultComponents = []
+        self.errors = {}
+
+    def result(self, mode: int = ResultMode.dict) -> Union[str, dict]:
+        '''Returns the merged search result.
+
+        Args:
+            mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+
+        Returns:
+            Union[str, dict]: Returns JSON or dictionary.
+        '''
+        if mode == ResultMode.json:
+            return json.dumps({'result': self.resultComponents, 'errors': self.errors}, indent=4)
+        elif mode == ResultMode.dict:
+            return {'result': self.resultComponents, 'errors': self.errors}
+
+    def _pendingLocales(self) -> List[str]:
+        return [locale for locale, search in self.searches.items() if search.pageIndex < 0 or search.continuationKey]
+
+    def _syncSearch(self, search: SearchCore) -> List[dict]:
+        if search.pageIndex < 0:
+            search.sync_create()
+            search._getComponents(*self.searchMode)
+        else:
+            search._next()
+        return search.resultComponents
+
+    async def _asyncSearch(self, search: SearchCore, semaphore: asyncio.Semaphore) -> List[dict]:
+        async with semaphore:
+            await search._nextAsync()
+            return search.resultComponents
+
+    def _next(self) -> bool:
+        locales = self._pendingLocales()
+        if not locales:
+            return False
+        pages = {}
+        self.errors = {}
+        with createSyncClient(self.concurrency) as client, ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for locale in locales:
+                self.searches[locale].client = client
+            futures = {locale: executor.submit(self._syncSearch, self.searches[locale]) for locale in locales}
+            for locale, future in futures.items():
+                try:
+                    pages[locale] = future.result()
+                except Exception as e:
+                    self.errors[locale] = str(e)
+        for locale in locales:
+            self.searches[locale].client = None
+        self._merge(pages)
+        return True
+
+    async def _nextAsync(self) -> dict:
+        locales = self._pendingLocales()
+        pages = {}
+        self.errors = {}
+        if locales:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            async with createAsyncClient(self.concurrency) as client:
+                for locale in locales:
+                    self.searches[locale].asyncClient = client
+                results = await asyncio.gather(
+                    *[self._asyncSearch(self.searches[locale], semaphore) for locale in locales],
+                    return_exceptions=True
+                )
+            for locale, result in zip(locales, results):
+                self.searches[locale].asyncClient = None
+                if isinstance(result, BaseException):
+                    self.errors[locale] = str(result)
+                else:
+                    pages[locale] = result
+        self._merge(pages)
+        return {
+            'result': self.resultComponents,
+            'errors': self.errors,
+        }
+
+    def _merge(self, pages: Dict[str, List[dict]]) -> None:
+        merged = {}
+        scores = {}
+        for locale, components in pages.items():
+            offset = self.offsets[locale]
+            for index, component in enumerate(components):
+                id = component.get('id')
+                if id is None:
+                    continue
+                if id not in merged:
+                    merged[id] = dict(component)
+                    merged[id]['positions'] = {}
+                    scores[id] = 0
+                if locale not in merged[id]['positions']:
+                    merged[id]['positions'][locale] = offset + index
+                    scores[id] += 1 / (rankConstant + offset + index)
+            self.offsets[locale] = offset + len(components)
+        self.resultComponents = sorted(merged.values(), key=lambda component: scores[component['id']], reverse=True)
@@ -1,18 +1,25 @@
-import collections
+import asyncio
 import copy
-import itertools
 import json
-import re
-from typing import Iterable, Mapping, Tuple, TypeVar, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, AsyncIterator, Iterable, Iterator, Optional, Tuple, Union, List
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+from youtubesearchpython.core.checkpoint import loadCheckpoint, removeCheckpoint, saveCheckpoint
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.componenthandler import getPlaylistId
 
 
-K = TypeVar("K")
-T = TypeVar("T")
+def knownVideoIdSet(knownVideoIds: Union[str, Iterable[str], None]) -> Optional[AbstractSet[str]]:
+    # Accepts the ID of the newest known video or a collection of known video IDs.
+    if knownVideoIds is None:
+        return None
+    if isinstance(knownVideoIds, str):
+        return {knownVideoIds}
+    if isinstance(knownVideoIds, AbstractSet):
+        return knownVideoIds
+    return set(knownVideoIds)
 
 
 class PlaylistCore(RequestCore):
@@ -26,6 +33,9 @@ class PlaylistCore(RequestCore):
         self.resultMode = resultMode
         self.timeout = timeout
         self.url = playlistLink
+        ''' Videos of the last fetched page. When streaming, earlier pages are not kept in `playlistComponent`. '''
+        self.pageVideos = []
+        self.streaming = False
 
     def post_processing(self):
         self.__parseSource()
@@ -82,10 +92,109 @@ class PlaylistCore(RequestCore):
         else:
             await self.async_create()
     
-    def prepare_first_request(self):
-        self.url.strip('/')
+    def _knownPage(self, knownVideoIds: Optional[AbstractSet[str]]) -> Tuple[List[dict], bool]:
+        # Cuts the current page at the first known video. Returns the new videos & whether a known one was reached.
+        if knownVideoIds:
+            for index, video in enumerate(self.pageVideos):
+                if video['id'] in knownVideoIds:
+                    return self.pageVideos[:index], True
+        return self.pageVideos, False
+
+    def _newCheckpoint(self, checkpointFile: Optional[str]) -> Optional[dict]:
+        # Restores the crawl from `checkpointFile` if it holds an unfinished one, otherwise starts a new checkpoint.
+        # Same format as the checkpoints of PlaylistScheduler.
+        if checkpointFile is None:
+            return None
+        playlistId = getPlaylistId(self.url)
+        checkpoint = loadCheckpoint(checkpointFile)
+        if checkpoint is not None and checkpoint['playlistId'] != playlistId:
+            raise Exception('ERROR: Checkpoint file belongs to another playlist.')
+        if checkpoint is None or checkpoint['done']:
+            return {'playlistId': playlistId, 'continuationKey': None, 'pages': 0, 'videos': 0, 'info': None, 'done': False}
+        self.continuationKey = checkpoint['continuationKey']
+        self.playlistComponent = {'info': checkpoint['info'], 'videos': []}
+        self.pageVideos = []
+        return checkpoint
+
+    def _saveCheckpoint(self, checkpointFile: Optional[str], checkpoint: Optional[dict], page: List[dict], continuationKey: Optional[str]) -> None:
+        # Called once every video of the page was handed to the caller, so a resumed crawl continues after it.
+        # A complete crawl, at the end of the playlist or at a known video, removes the checkpoint, so the next one starts over.
+        if checkpoint is None:
+            return
+        if not continuationKey:
+            removeCheckpoint(checkpointFile)
+            return
+        if checkpoint['info'] is None:
+            checkpoint['info'] = self.playlistComponent['info']
+        checkpoint['continuationKey'] = continuationKey
+        checkpoint['pages'] += 1
+        checkpoint['videos'] += len(page)
+        saveCheckpoint(checkpointFile, checkpoint)
+
+    def _syncPages(self, prefetch: bool = True, knownVideoIds: AbstractSet[str] = None, checkpointFile: str = None) -> Iterator[List[dict]]:
+        # Yields the videos page by page. With `prefetch`, the next page is requested while the current one is consumed.
+        # Stops at the first video in `knownVideoIds`, without requesting any further page.
+        # With `checkpointFile`, the crawl state is saved after every page & a previous crawl is resumed from it.
+        self.streaming = True
+        checkpoint = self._newCheckpoint(checkpointFile)
+        if checkpoint is None or not checkpoint['pages']:
+            self.sync_create()
+        else:
+            self._next()
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while True:
+                page, reachedKnown = self._knownPage(knownVideoIds)
+                continuationKey = None if reachedKnown else self.continuationKey
+                if not continuationKey:
+                    yield page
+                    self._saveCheckpoint(checkpointFile, checkpoint, page, None)
+                    return
+                if executor is None:
+                    yield page
+                    self._saveCheckpoint(checkpointFile, checkpoint, page, continuationKey)
+                    self._next()
+                else:
+                    nextPage = executor.submit(self._next)
+                    yield page
+                    self._saveCheckpoint(checkpointFile, checkpoint, page, continuationKey)
+                    nextPage.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-        id = re.search(r"(?<=list=)([a-zA-Z0-9+/=_-]+)", self.url).group()
+    async def _asyncPages(self, prefetch: bool = True, knownVideoIds: AbstractSet[str] = None, checkpointFile: str = None) -> AsyncIterator[List[dict]]:
+        self.streaming = True
+        checkpoint = self._newCheckpoint(checkpointFile)
+        if checkpoint is None or not checkpoint['pages']:
+            await self.async_create()
+        else:
+            await self._async_next()
+        nextPage = None
+        try:
+            while True:
+                page, reachedKnown = self._knownPage(knownVideoIds)
+                continuationKey = None if reachedKnown else self.continuationKey
+                if not continuationKey:
+                    yield page
+                    self._saveCheckpoint(checkpointFile, checkpoint, page, None)
+                    return
+                if not prefetch:
+                    yield page
+                    self._saveCheckpoint(checkpointFile, checkpoint, page, continuationKey)
+                    await self._async_next()
+                else:
+                    nextPage = asyncio.ensure_future(self._async_next())
+                    yield page
+                    self._saveCheckpoint(checkpointFile, checkpoint, page, continuationKey)
+                    await nextPage
+                    nextPage = None
+        finally:
+            if nextPage is not None:
+                nextPage.cancel()
+
+    def prepare_first_request(self):
+        id = getPlaylistId(self.url)
         browseId = "VL" + id if not id.startswith("VL") else id
 
         self.url = 'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
@@ -136,31 +245,7 @@ class PlaylistCore(RequestCore):
         inforenderer = sidebar[0]["playlistSidebarPrimaryInfoRenderer"]
         channel_details_available = len(sidebar) != 1
         channelrenderer = sidebar[1]["playlistSidebarSecondaryInfoRenderer"]["videoOwner"]["videoOwnerRenderer"] if channel_details_available else None
-        videorenderer: list = self.__getFirstValue(self.responseSource, ["contents", "twoColumnBrowseResultsRenderer", "tabs", None, "tabRenderer", "content", "sectionListRenderer", "contents", None, "itemSectionRenderer", "contents", None, "playlistVideoListRenderer", "contents"])
-        videos = []
-        for video in videorenderer:
-            try:
-                video = video["playlistVideoRenderer"]
-                j = {
-                    "id": self.__getValue(video, ["videoId"]),
-                    "thumbnails": self.__getValue(video, ["thumbnail", "thumbnails"]),
-                    "title": self.__getValue(video, ["title", "runs", 0, "text"]),
-                    "channel": {
-                        "name": self.__getValue(video, ["shortBylineText", "runs", 0, "text"]),
-                        "id": self.__getValue(video, ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "browseId"]),
-                        "link": self.__getValue(video, ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"]),
-                    },
-                    "duration": self.__getValue(video, ["lengthText", "simpleText"]),
-                    "accessibility": {
-                        "title": self.__getValue(video, ["title", "accessibility", "accessibilityData", "label"]),
-                        "duration": self.__getValue(video, ["lengthText", "accessibility", "accessibilityData", "label"]),
-                    },
-                    "link": "https://www.youtube.com" + self.__getValue(video, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    "isPlayable": self.__getValue(video, ["isPlayable"]),
-                }
-                videos.append(j)
-            except:
-                pass
+        videos = self.__getVideos(self.__getVideoElements())
 
         playlistElement = {
             'info': {
@@ -180,53 +265,77 @@ class PlaylistCore(RequestCore):
             },
             'videos': videos,
         }
+        self.pageVideos = videos
         if self.componentMode == "getInfo":
             self.playlistComponent = playlistElement["info"]
         elif self.componentMode == "getVideos":
             self.playlistComponent = {"videos": videos}
         else:
             self.playlistComponent = playlistElement
-        self.continuationKey = self.__getValue(videorenderer, [-1, "continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"])
 
     def __getNextComponents(self) -> None:
-        self.continuationKey = None
-        playlistComponent = {
-            'videos': [],
-        }
         continuationElements = self.__getValue(self.responseSource,
                                                ['onResponseReceivedActions', 0, 'appendContinuationItemsAction',
                                                 'continuationItems'])
         if continuationElements is None:
             # YouTube Backend issue - See https://github.com/alexmercerind/youtube-search-python/issues/157
+            self.continuationKey = None
+            self.pageVideos = []
             return
-        for videoElement in continuationElements:
-            if playlistVideoKey in videoElement.keys():
-                videoComponent = {
-                    'id': self.__getValue(videoElement, [playlistVideoKey, 'videoId']),
-                    'title': self.__getValue(videoElement, [playlistVideoKey, 'title', 'runs', 0, 'text']),
-                    'thumbnails': self.__getValue(videoElement, [playlistVideoKey, 'thumbnail', 'thumbnails']),
-                    'link': "https://www.youtube.com" + self.__getValue(videoElement, [playlistVideoKey, "navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    'channel': {
-                        'name': self.__getValue(videoElement, [playlistVideoKey, 'shortBylineText', 'runs', 0, 'text']),
-                        'id': self.__getValue(videoElement,
-                                              [playlistVideoKey, 'shortBylineText', 'runs', 0, 'navigationEndpoint',
-                                               'browseEndpoint', 'browseId']),
-                        "link": "https://www.youtube.com" + self.__getValue(videoElement, [playlistVideoKey, "shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"])
-                    },
-                    'duration': self.__getValue(videoElement, [playlistVideoKey, 'lengthText', 'simpleText']),
-                    'accessibility': {
-                        'title': self.__getValue(videoElement,
-                                                 [playlistVideoKey, 'title', 'accessibility', 'accessibilityData',
-                                                  'label']),
-                        'duration': self.__getValue(videoElement, [playlistVideoKey, 'lengthText', 'accessibility',
-                                                                   'accessibilityData', 'label']),
-                    },
-                }
-                playlistComponent['videos'].append(
-                    videoComponent
-                )
-            self.continuationKey = self.__getValue(videoElement, continuationKeyPath)
-        self.playlistComponent["videos"].extend(playlistComponent['videos'])
+        self.pageVideos = self.__getVideos(continuationElements)
+        if self.streaming:
+            self.playlistComponent["videos"] = self.pageVideos
+        else:
+            self.playlistComponent["videos"].extend(self.pageVideos)
+
+    def __getVideoElements(self) -> Optional[list]:
+        # Walks the few tabs & sections of the first page directly, instead of searching the whole response.
+        for tab in self.__getValue(self.responseSource, ["contents", "twoColumnBrowseResultsRenderer", "tabs"]) or []:
+            for section in self.__getValue(tab, ["tabRenderer", "content", "sectionListRenderer", "contents"]) or []:
+                for item in self.__getValue(section, ["itemSectionRenderer", "contents"]) or []:
+                    elements = self.__getValue(item, ["playlistVideoListRenderer", "contents"])
+                    if elements is not None:
+                        return elements
+        return None
+
+    def __getVideos(self, elements: Optional[list]) -> List[dict]:
+        # Single pass over the items of the first page or of a continuation.
+        # Shared parts of a video are looked up once, & the item following the videos carries the continuation token.
+        self.continuationKey = None
+        videos = []
+        for element in elements or []:
+            video = element.get(playlistVideoKey)
+            if video is None:
+                if continuationItemKey in element:
+                    self.continuationKey = self.__getValue(element, continuationKeyPath)
+                continue
+            videoId = video.get("videoId")
+            if videoId is None:
+                continue
+            title = video.get("title", {})
+            length = video.get("lengthText", {})
+            byline = self.__getValue(video, ["shortBylineText", "runs", 0]) or {}
+            browseEndpoint = self.__getValue(byline, ["navigationEndpoint", "browseEndpoint"]) or {}
+            url = self.__getValue(video, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"])
+            canonicalBaseUrl = browseEndpoint.get("canonicalBaseUrl")
+            videos.append({
+                "id": videoId,
+                "thumbnails": self.__getValue(video, ["thumbnail", "thumbnails"]),
+                "title": self.__getValue(title, ["runs", 0, "text"]),
+                "channel": {
+                    "name": byline.get("text"),
+                    "id": browseEndpoint.get("browseId"),
+                    "link": "https://www.youtube.com" + canonicalBaseUrl if canonicalBaseUrl else None,
+                },
+                "duration": length.get("simpleText"),
+                "accessibility": {
+                    "title": self.__getValue(title, ["accessibility", "accessibilityData", "label"]),
+                    "duration": self.__getValue(length, ["accessibility", "accessibilityData", "label"]),
+                },
+                "link": "https://www.youtube.com" + url if url else "https://www.youtube.com/watch?v=" + videoId,
+                "isPlayable": video.get("isPlayable"),
+            })
+        return videos
 
     def __getPlaylistComponent(self, element: dict, mode: str) -> dict:
         playlistComponent = {}
@@ -325,33 +434,3 @@ class PlaylistCore(RequestCore):
                     value = None
                     break
         return value
-
-    def __getAllWithKey(self, source: Iterable[Mapping[K, T]], key: K) -> Iterable[T]:
-        for item in source:
-            if key in item:
-                yield item[key]
-
-    def __getValueEx(self, source: dict, path: List[str]) -> Iterable[Union[str, int, dict, None]]:
-        if len(path) <= 0:
-            yield source
-            return
-        key = path[0]
-        upcoming = path[1:]
-        if key is None:
-            following_key = upcoming[0]
-            upcoming = upcoming[1:]
-            if following_key is None:
-                raise Exception("Cannot search for a key twice consecutive or at the end with no key given")
-            values = self.__getAllWithKey(source, following_key)
-            for val in values:
-                yield from self.__getValueEx(val, path=upcoming)
-        else:
-            val = self.__getValue(source, path=[key])
-            yield from self.__getValueEx(val, path=upcoming)
-
-    def __getFirstValue(self, source: dict, path: Iterable[str]) -> Union[str, int, dict, list, None]:
-        values = self.__getValueEx(source, list(path))
-        for val in values:
-            if val is not None:
-                return val
-        return None
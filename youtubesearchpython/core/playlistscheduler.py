@@ -0,0 +1,229 @@
+import asyncio
+import collections
+import copy
+import heapq
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AbstractSet, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+from youtubesearchpython.core.componenthandler import getChannelId, getPlaylistId, uploadsPlaylistId
+from youtubesearchpython.core.constants import ResultMode
+from youtubesearchpython.core.playlist import PlaylistCore, knownVideoIdSet
+from youtubesearchpython.core.requests import createAsyncClient, createSyncClient
+
+
+class PlaylistChain:
+    '''Crawl state of a single playlist, which is a chain of sequential continuation requests.
+    '''
+    def __init__(self, playlistId: str, timeout: int, checkpoint: dict = None, knownVideoIds: AbstractSet[str] = None):
+        self.playlistId = playlistId
+        self.knownVideoIds = knownVideoIds
+        self.playlist = PlaylistCore(playlistId, None, ResultMode.dict, timeout)
+        self.playlist.streaming = True
+        self.pages = 0
+        self.videos = 0
+        self.info = None
+        self.done = False
+        self.error = None
+        self.failures = 0
+        self.retryAt = 0
+        self.previousKey = None
+        if checkpoint is not None:
+            self.restore(checkpoint)
+
+    def restore(self, checkpoint: dict) -> None:
+        self.pages = checkpoint['pages']
+        self.videos = checkpoint['videos']
+        self.info = checkpoint['info']
+        self.done = checkpoint['done']
+        self.playlist.continuationKey = checkpoint['continuationKey']
+        self.playlist.playlistComponent = {'videos': []}
+
+    def checkpoint(self) -> dict:
+        return {
+            'playlistId': self.playlistId,
+            'continuationKey': self.playlist.continuationKey,
+            'pages': self.pages,
+            'videos': self.videos,
+            'info': self.info,
+            'done': self.done,
+        }
+
+    def progress(self) -> dict:
+        return {
+            'pages': self.pages,
+            'videos': self.videos,
+            'videoCount': self.info['videoCount'] if self.info else None,
+            'done': self.done,
+            'error': self.error,
+        }
+
+    def started(self) -> bool:
+        return self.pages > 0
+
+    def finishPage(self) -> List[dict]:
+        page, reachedKnown = self.playlist._knownPage(self.knownVideoIds)
+        if not self.started():
+            self.info = copy.deepcopy(self.playlist.playlistComponent['info'])
+        self.pages += 1
+        self.videos += len(page)
+        self.failures = 0
+        self.error = None
+        self.done = reachedKnown or not self.playlist.continuationKey
+        return page
+
+    def rollback(self) -> None:
+        # Makes the chain resumable from the page, which failed or was fetched but never handed to the caller.
+        # The first request replaces the link of the playlist with the API URL, so it is put back to request the first page again.
+        self.playlist.continuationKey = self.previousKey
+        if not self.started():
+            self.playlist.url = self.playlistId
+
+    def syncStep(self) -> None:
+        self.previousKey = self.playlist.continuationKey
+        try:
+            if not self.started():
+                self.playlist.sync_create()
+            else:
+                self.playlist._next()
+        except:
+            self.rollback()
+            raise
+
+    async def asyncStep(self) -> None:
+        self.previousKey = self.playlist.continuationKey
+        try:
+            if not self.started():
+                await self.playlist.async_create()
+            else:
+                await self.playlist._async_next()
+        except:
+            self.rollback()
+            raise
+
+
+class PlaylistSchedulerCore:
+    def __init__(self, playlistLinks: Iterable[str], concurrency: int, timeout: int, checkpoints: Dict[str, dict], retries: int, until: Dict[str, Union[str, Iterable[str]]] = None, retryDelay: float = 1):
+        self.concurrency = concurrency
+        self.retries = retries
+        self.retryDelay = retryDelay
+        self.chains = collections.OrderedDict()
+        checkpoints = checkpoints or {}
+        until = {getPlaylistId(playlistLink): knownVideoIds for playlistLink, knownVideoIds in (until or {}).items()}
+        for playlistLink in playlistLinks:
+            playlistId = getPlaylistId(playlistLink)
+            if playlistId not in self.chains:
+                self.chains[playlistId] = PlaylistChain(playlistId, timeout, checkpoints.get(playlistId), knownVideoIdSet(until.get(playlistId)))
+
+    def progress(self) -> Dict[str, dict]:
+        '''Returns the number of fetched pages & videos, the total video count & the status of every playlist.
+        '''
+        return {playlistId: chain.progress() for playlistId, chain in self.chains.items()}
+
+    def checkpoints(self) -> Dict[str, dict]:
+        '''Returns the state of every playlist, which can be passed to a new scheduler to resume the crawl.
+        '''
+        return {playlistId: chain.checkpoint() for playlistId, chain in self.chains.items()}
+
+    def _ready(self) -> collections.deque:
+        return collections.deque(chain for chain in self.chains.values() if not chain.done)
+
+    def _schedule(self, ready: collections.deque, waiting: list, slots: int) -> List[PlaylistChain]:
+        # Takes up to `slots` chains from the queue. A failed chain waits aside until its retry delay has passed.
+        now = time.monotonic()
+        while waiting and waiting[0][0] <= now:
+            ready.append(heapq.heappop(waiting)[2])
+        chains = []
+        while ready and len(chains) < slots:
+            chain = ready.popleft()
+            if chain.retryAt > now:
+                heapq.heappush(waiting, (chain.retryAt, chain.playlistId, chain))
+            else:
+                chains.append(chain)
+        return chains
+
+    def _timeout(self, waiting: list) -> Optional[float]:
+        return max(0, waiting[0][0] - time.monotonic()) if waiting else None
+
+    def _event(self, chain: PlaylistChain, error: Exception, ready: collections.deque) -> dict:
+        # A chain, which got its page, goes to the back of the queue, so every playlist gets a turn before it continues.
+        # Its progress is only updated here, when the page is handed to the caller.
+        page = []
+        if error is not None:
+            chain.failures += 1
+            chain.error = str(error)
+            if chain.failures <= self.retries:
+                chain.retryAt = time.monotonic() + self.retryDelay * 2 ** (chain.failures - 1)
+                ready.append(chain)
+        else:
+            page = chain.finishPage()
+            if not chain.done:
+                ready.append(chain)
+        return {'id': chain.playlistId, 'videos': page, 'progress': chain.progress()}
+
+    def _syncCrawl(self) -> Iterator[dict]:
+        ready = self._ready()
+        waiting = []
+        inFlight = {}
+        with createSyncClient(self.concurrency) as client, ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for chain in self.chains.values():
+                chain.playlist.client = client
+            try:
+                while ready or waiting or inFlight:
+                    for chain in self._schedule(ready, waiting, self.concurrency - len(inFlight)):
+                        inFlight[executor.submit(chain.syncStep)] = chain
+                    if not inFlight:
+                        time.sleep(self._timeout(waiting))
+                        continue
+                    done, _ = wait(list(inFlight), timeout=self._timeout(waiting), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chain = inFlight.pop(future)
+                        yield self._event(chain, future.exception(), ready)
+            finally:
+                for future in inFlight:
+                    future.cancel()
+                wait(list(inFlight))
+                for chain in inFlight.values():
+                    chain.rollback()
+                for chain in self.chains.values():
+                    chain.playlist.client = None
+
+    async def _asyncCrawl(self) -> AsyncIterator[dict]:
+        ready = self._ready()
+        waiting = []
+        inFlight = {}
+        async with createAsyncClient(self.concurrency) as client:
+            for chain in self.chains.values():
+                chain.playlist.asyncClient = client
+            try:
+                while ready or waiting or inFlight:
+                    for chain in self._schedule(ready, waiting, self.concurrency - len(inFlight)):
+                        inFlight[asyncio.ensure_future(chain.asyncStep())] = chain
+                    if not inFlight:
+                        await asyncio.sleep(self._timeout(waiting))
+                        continue
+                    done, _ = await asyncio.wait(list(inFlight), timeout=self._timeout(waiting), return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        chain = inFlight.pop(task)
+                        yield self._event(chain, task.exception(), ready)
+            finally:
+                for task in inFlight:
+                    task.cancel()
+                for chain in inFlight.values():
+                    chain.rollback()
+                for chain in self.chains.values():
+                    chain.playlist.asyncClient = None
+
+
+class ChannelUploadsCore(PlaylistSchedulerCore):
+    '''Crawls the uploads playlists of many channels, reporting every page by the ID of its channel.
+    '''
+    def __init__(self, channelIds: Iterable[str], since: Dict[str, Union[str, Iterable[str]]], concurrency: int, timeout: int, retries: int, retryDelay: float = 1):
+        self.channelIds = collections.OrderedDict((uploadsPlaylistId(channelId), getChannelId(channelId)) for channelId in channelIds)
+        until = {uploadsPlaylistId(channelId): knownVideoIds for channelId, knownVideoIds in (since or {}).items()}
+        super().__init__(self.channelIds, concurrency, timeout, None, retries, until, retryDelay)
+
+    def _event(self, chain: PlaylistChain, error: Exception, ready: collections.deque) -> dict:
+        event = super()._event(chain, error, ready)
+        event['id'] = self.channelIds[chain.playlistId]
+        return event
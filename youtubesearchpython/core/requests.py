@@ -3,20 +3,49 @@ import os
 
 from youtubesearchpython.core.constants import userAgent
 
+
+def getProxies() -> dict:
+    proxy = {}
+    http_proxy = os.environ.get("HTTP_PROXY")
+    if http_proxy:
+        proxy["http://"] = http_proxy
+    https_proxy = os.environ.get("HTTPS_PROXY")
+    if https_proxy:
+        proxy["https://"] = https_proxy
+    return proxy
+
+
+def createSyncClient(maxConnections: int = 10) -> httpx.Client:
+    '''Creates a connection pool, which can be shared by many requests using `RequestCore.client`.
+    '''
+    return httpx.Client(
+        proxies=getProxies(),
+        limits=httpx.Limits(max_connections=maxConnections, max_keepalive_connections=maxConnections)
+    )
+
+
+def createAsyncClient(maxConnections: int = 10) -> httpx.AsyncClient:
+    '''Creates a connection pool, which can be shared by many requests using `RequestCore.asyncClient`.
+    '''
+    return httpx.AsyncClient(
+        proxies=getProxies(),
+        limits=httpx.Limits(max_connections=maxConnections, max_keepalive_connections=maxConnections)
+    )
+
+
 class RequestCore:
     def __init__(self):
         self.url = None
         self.data = None
         self.timeout = 2
-        self.proxy = {}
-        http_proxy = os.environ.get("HTTP_PROXY")
-        if http_proxy:
-            self.proxy["http://"] = http_proxy
-        https_proxy = os.environ.get("HTTPS_PROXY")
-        if https_proxy:
-            self.proxy["https://"] = https_proxy
+        self.proxy = getProxies()
+        ''' Shared connection pools. When not set, every request opens its own connection. '''
+        self.client = None
+        self.asyncClient = None
 
     def syncPostRequest(self) -> httpx.Response:
+        if self.client is not None:
+            return self.client.post(self.url, headers={"User-Agent": userAgent}, json=self.data, timeout=self.timeout)
         return httpx.post(
             self.url,
             headers={"User-Agent": userAgent},
@@ -26,14 +55,20 @@ class RequestCore:
         )
 
     async def asyncPostRequest(self) -> httpx.Response:
+        if self.asyncClient is not None:
+            return await self.asyncClient.post(self.url, headers={"User-Agent": userAgent}, json=self.data, timeout=self.timeout)
         async with httpx.AsyncClient(proxies=self.proxy) as client:
             r = await client.post(self.url, headers={"User-Agent": userAgent}, json=self.data, timeout=self.timeout)
             return r
 
     def syncGetRequest(self) -> httpx.Response:
+        if self.client is not None:
+            return self.client.get(self.url, headers={"User-Agent": userAgent}, timeout=self.timeout, cookies={'CONSENT': 'YES+1'})
         return httpx.get(self.url, headers={"User-Agent": userAgent}, timeout=self.timeout, cookies={'CONSENT': 'YES+1'}, proxies=self.proxy)
 
     async def asyncGetRequest(self) -> httpx.Response:
+        if self.asyncClient is not None:
+            return await self.asyncClient.get(self.url, headers={"User-Agent": userAgent}, timeout=self.timeout, cookies={'CONSENT': 'YES+1'})
         async with httpx.AsyncClient(proxies=self.proxy) as client:
             r = await client.get(self.url, headers={"User-Agent": userAgent}, timeout=self.timeout, cookies={'CONSENT': 'YES+1'})
             return r
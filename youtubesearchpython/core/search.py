@@ -1,8 +1,12 @@
+import asyncio
 import copy
-from typing import Union
+import threading
+from typing import Iterator, List, Union
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.searchcache import SearchCache
+from youtubesearchpython.core.searchfilter import SearchFilter
 from youtubesearchpython.handlers.componenthandler import ComponentHandler
 from youtubesearchpython.handlers.requesthandler import RequestHandler
 from youtubesearchpython.core.constants import *
@@ -15,19 +19,31 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
     responseSource = None
     resultComponents = []
 
-    def __init__(self, query: str, limit: int, language: str, region: str, searchPreferences: str, timeout: int):
+    def __init__(self, query: str, limit: int, language: str, region: str, searchPreferences: str, timeout: int, cache: SearchCache = None):
         super().__init__()
         self.query = query
         self.limit = limit
         self.language = language
         self.region = region
+        if isinstance(searchPreferences, SearchFilter):
+            searchPreferences = searchPreferences.build()
         self.searchPreferences = searchPreferences
         self.timeout = timeout
         self.continuationKey = None
+        self.cache = cache
+        self.pageIndex = -1
+        self._cachedComponents = None
 
     def sync_create(self):
-        self._makeRequest()
-        self._parseSource()
+        ''' The page only counts once it was fetched, so a failed page is requested again by the next call. '''
+        self.pageIndex += 1
+        try:
+            if not self._loadFromCache(self._startRefresh):
+                self._makeRequest()
+                self._parseSource()
+        except:
+            self.pageIndex -= 1
+            raise
 
     def _getRequestBody(self):
         ''' Fixes #47 '''
@@ -89,8 +105,7 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
             self.response = None
             self.responseSource = None
             self.resultComponents = []
-            self._makeRequest()
-            self._parseSource()
+            self.sync_create()
             self._getComponents(*self.searchMode)
             return True
         else:
@@ -100,34 +115,132 @@ class SearchCore(RequestCore, RequestHandler, ComponentHandler):
         self.response = None
         self.responseSource = None
         self.resultComponents = []
-        await self._makeAsyncRequest()
-        self._parseSource()
+        self.pageIndex += 1
+        try:
+            if not self._loadFromCache(self._startAsyncRefresh):
+                await self._makeAsyncRequest()
+                self._parseSource()
+        except:
+            self.pageIndex -= 1
+            raise
         self._getComponents(*self.searchMode)
         return {
             'result': self.resultComponents,
         }
 
+    def _cacheKey(self):
+        return SearchCache.key(self.query, self.searchPreferences, self.language, self.region, self.searchMode, self.pageIndex)
+
+    def _loadFromCache(self, startRefresh) -> bool:
+        if self.cache is None:
+            return False
+        key = self._cacheKey()
+        cached = self.cache.get(key)
+        if cached is None:
+            return False
+        components, continuationKey, isStale = cached
+        if isStale:
+            requestContinuationKey = self.continuationKey
+            self.cache.refresh(key, lambda: startRefresh(key, requestContinuationKey))
+        self._cachedComponents = components
+        self.continuationKey = continuationKey
+        return True
+
+    def _refreshCore(self, continuationKey: str) -> 'SearchCore':
+        core = SearchCore(self.query, self.limit, self.language, self.region, self.searchPreferences, self.timeout)
+        core.searchMode = self.searchMode
+        core.continuationKey = continuationKey
+        return core
+
+    def _startRefresh(self, key, continuationKey: str) -> threading.Thread:
+        def refresh():
+            try:
+                core = self._refreshCore(continuationKey)
+                core._makeRequest()
+                core._parseSource()
+                self.cache.set(key, core._parseComponents(*self.searchMode, None), core.continuationKey)
+            except:
+                pass
+            finally:
+                self.cache.finishRefresh(key)
+        thread = threading.Thread(target=refresh, daemon=True)
+        thread.start()
+        return thread
+
+    def _startAsyncRefresh(self, key, continuationKey: str) -> asyncio.Task:
+        async def refresh():
+            try:
+                core = self._refreshCore(continuationKey)
+                await core._makeAsyncRequest()
+                core._parseSource()
+                self.cache.set(key, core._parseComponents(*self.searchMode, None), core.continuationKey)
+            except:
+                pass
+            finally:
+                self.cache.finishRefresh(key)
+        return asyncio.ensure_future(refresh())
+
     def _getComponents(self, findVideos: bool, findChannels: bool, findPlaylists: bool) -> None:
-        self.resultComponents = []
+        if self.cache is None:
+            self.resultComponents = self._parseComponents(findVideos, findChannels, findPlaylists, self.limit)
+            return
+        if self._cachedComponents is None:
+            ''' Whole page is parsed & cached, so later searches with a greater limit can use it too. '''
+            self._cachedComponents = self._parseComponents(findVideos, findChannels, findPlaylists, None)
+            self.cache.set(self._cacheKey(), self._cachedComponents, self.continuationKey)
+        self.resultComponents = self._cachedComponents[:self.limit]
+        self._cachedComponents = None
+
+    def _getParsers(self, findVideos: bool, findChannels: bool, findPlaylists: bool) -> dict:
+        ''' Renderer types excluded by the search mode are left out, so their elements are skipped without being parsed. '''
+        parsers = {}
+        if findVideos:
+            parsers[videoElementKey] = self._parseVideoElement
+            parsers[shelfElementKey] = self._parseShelfElement
+            parsers[richItemKey] = self._parseRichItemElement
+        if findChannels:
+            parsers[channelElementKey] = self._parseChannelElement
+        if findPlaylists:
+            parsers[playlistElementKey] = self._parsePlaylistElement
+        return parsers
+
+    def _parseVideoElement(self, element: dict) -> Iterator[dict]:
+        yield self._getVideoComponent(element)
+
+    def _parseChannelElement(self, element: dict) -> Iterator[dict]:
+        yield self._getChannelComponent(element)
+
+    def _parsePlaylistElement(self, element: dict) -> Iterator[dict]:
+        yield self._getPlaylistComponent(element)
+
+    def _parseShelfElement(self, element: dict) -> Iterator[dict]:
+        shelfComponent = self._getShelfComponent(element)
+        if shelfComponent['elements'] is None:
+            return
+        shelfTitle = shelfComponent['title']
+        for shelfElement in shelfComponent['elements']:
+            if videoElementKey in shelfElement:
+                yield self._getVideoComponent(shelfElement, shelfTitle=shelfTitle)
+
+    def _parseRichItemElement(self, element: dict) -> Iterator[dict]:
+        richItemElement = self._getValue(element, [richItemKey, 'content'])
+        ''' Initial fallback handling for VideosSearch '''
+        if richItemElement is not None and videoElementKey in richItemElement:
+            yield self._getVideoComponent(richItemElement)
+
+    def _parseComponents(self, findVideos: bool, findChannels: bool, findPlaylists: bool, limit: int = None) -> List[dict]:
+        parsers = self._getParsers(findVideos, findChannels, findPlaylists)
+        components = []
         for element in self.responseSource:
-            if videoElementKey in element.keys() and findVideos:
-                self.resultComponents.append(self._getVideoComponent(element))
-            if channelElementKey in element.keys() and findChannels:
-                self.resultComponents.append(self._getChannelComponent(element))
-            if playlistElementKey in element.keys() and findPlaylists:
-                self.resultComponents.append(self._getPlaylistComponent(element))
-            if shelfElementKey in element.keys() and findVideos:
-                shelfComponent = self._getShelfComponent(element)
-                if (not 'elements' in shelfComponent) or shelfComponent['elements'] == None:
-                    continue
-                for shelfElement in shelfComponent['elements']:
-                    self.resultComponents.append(
-                        self._getVideoComponent(shelfElement, shelfTitle=self._getShelfComponent(element)['title']))
-            if richItemKey in element.keys() and findVideos:
-                richItemElement = self._getValue(element, [richItemKey, 'content'])
-                ''' Initial fallback handling for VideosSearch '''
-                if videoElementKey in richItemElement.keys():
-                    videoComponent = self._getVideoComponent(richItemElement)
-                    self.resultComponents.append(videoComponent)
-            if len(self.resultComponents) >= self.limit:
-                break
\ No newline at end of file
+            parser = None
+            for key in element:
+                parser = parsers.get(key)
+                if parser is not None:
+                    break
+            if parser is None:
+                continue
+            for component in parser(element):
+                components.append(component)
+                if limit is not None and len(components) >= limit:
+                    return components
+        return components
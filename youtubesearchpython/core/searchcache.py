@@ -0,0 +1,76 @@
+import collections
+import threading
+import time
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class SearchCache:
+    '''Caches parsed search results, so repeated queries don't hit YouTube again.
+
+    Entries are keyed by the normalized query (case-folded & whitespace-collapsed), search preferences, language, region & page index.
+    An entry older than `ttl` is stale. Stale entries younger than `staleTtl` are still returned immediately, while a single
+    background request refreshes them. Older entries are dropped.
+
+    Cached components are shared between searches & should be treated as read-only.
+
+    Args:
+        ttl (int, optional): Seconds for which an entry is fresh. Defaults to 60.
+        staleTtl (int, optional): Seconds for which an entry may be served while being refreshed. Defaults to 600.
+        maxSize (int, optional): Maximum number of cached pages. Least recently used pages are evicted first. Defaults to 1024.
+
+    Examples:
+        Pass the same cache to every search, which should share the results.
+
+        >>> cache = SearchCache(ttl = 60, staleTtl = 600)
+        >>> search = VideosSearch('NoCopyrightSounds', cache = cache)
+    '''
+
+    def __init__(self, ttl: int = 60, staleTtl: int = 600, maxSize: int = 1024):
+        self.ttl = ttl
+        self.staleTtl = staleTtl
+        self.maxSize = maxSize
+        self._entries = collections.OrderedDict()
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query: str, searchPreferences: Optional[str], language: str, region: str, searchMode: Tuple[bool, bool, bool], page: int) -> Hashable:
+        return (' '.join(query.casefold().split()), searchPreferences, language, region, tuple(searchMode), page)
+
+    def get(self, key: Hashable) -> Optional[Tuple[List[dict], Optional[str], bool]]:
+        '''Returns the cached components, continuation key & whether the entry is stale. None, if nothing usable is cached.
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            components, continuationKey, storedAt = entry
+            age = time.monotonic() - storedAt
+            if age > self.staleTtl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return components, continuationKey, age > self.ttl
+
+    def set(self, key: Hashable, components: List[dict], continuationKey: Optional[str]) -> None:
+        with self._lock:
+            self._entries[key] = (components, continuationKey, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key: Hashable, start: Callable[[], Any]) -> None:
+        '''Calls `start` to begin a background refresh of the entry, unless one is already running.
+        '''
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing[key] = start()
+
+    def finishRefresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,162 @@
+import base64
+from typing import List
+from urllib.parse import quote
+
+
+''' Field numbers & values of the protobuf message YouTube expects in the `sp` / `params` search parameter. '''
+sortOrderField = 1
+filtersField = 2
+
+uploadDateField = 1
+typeField = 2
+durationField = 3
+
+sortOrders = {
+    'relevance': 0,
+    'rating': 1,
+    'uploadDate': 2,
+    'viewCount': 3,
+}
+
+uploadDates = {
+    'lastHour': 1,
+    'today': 2,
+    'thisWeek': 3,
+    'thisMonth': 4,
+    'thisYear': 5,
+}
+
+types = {
+    'video': 1,
+    'channel': 2,
+    'playlist': 3,
+    'movie': 4,
+}
+
+durations = {
+    'short': 1,
+    'long': 2,
+    'medium': 3,
+}
+
+features = {
+    'hd': 4,
+    'subtitles': 5,
+    'creativeCommons': 6,
+    '3d': 7,
+    'live': 8,
+    'purchased': 9,
+    '4k': 14,
+    '360': 15,
+    'location': 23,
+    'hdr': 25,
+    'vr180': 26,
+}
+
+
+def _encodeVarint(value: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def _encodeVarintField(field: int, value: int) -> bytes:
+    return _encodeVarint(field << 3) + _encodeVarint(value)
+
+
+def _encodeMessageField(field: int, message: bytes) -> bytes:
+    return _encodeVarint((field << 3) | 2) + _encodeVarint(len(message)) + message
+
+
+class SearchFilter:
+    '''Builds a single `searchPreferences` value out of any combination of search filters & a sorting order.
+
+    Unlike the predefined values in `SearchMode`, `VideoUploadDateFilter`, `VideoDurationFilter` & `VideoSortOrder`, which can only be used one at a time,
+    every filter set here is encoded into the same value, so YouTube itself does the filtering.
+
+    Args:
+        type (str, optional): One of 'video', 'channel', 'playlist' or 'movie'.
+        uploadDate (str, optional): One of 'lastHour', 'today', 'thisWeek', 'thisMonth' or 'thisYear'.
+        duration (str, optional): One of 'short' (under 4 minutes), 'medium' (4 - 20 minutes) or 'long' (over 20 minutes).
+        sortBy (str, optional): One of 'relevance', 'rating', 'uploadDate' or 'viewCount'.
+        features (List[str], optional): Any of 'hd', 'subtitles', 'creativeCommons', '3d', 'live', 'purchased', '4k', '360', 'location', 'hdr' or 'vr180'.
+
+    Examples:
+        Methods can be chained, `build` gives the value to pass as `searchPreferences`.
+
+        >>> searchPreferences = SearchFilter().type('video').uploadDate('thisWeek').duration('short').sortBy('viewCount').build()
+        >>> search = CustomSearch('NoCopyrightSounds', searchPreferences)
+    '''
+
+    def __init__(self, type: str = None, uploadDate: str = None, duration: str = None, sortBy: str = None, features: List[str] = None):
+        self._type = None
+        self._uploadDate = None
+        self._duration = None
+        self._sortBy = None
+        self._features = []
+        if type:
+            self.type(type)
+        if uploadDate:
+            self.uploadDate(uploadDate)
+        if duration:
+            self.duration(duration)
+        if sortBy:
+            self.sortBy(sortBy)
+        if features:
+            self.features(*features)
+
+    def type(self, value: str) -> 'SearchFilter':
+        self._type = self.__lookup(types, value, 'type')
+        return self
+
+    def uploadDate(self, value: str) -> 'SearchFilter':
+        self._uploadDate = self.__lookup(uploadDates, value, 'upload date')
+        return self
+
+    def duration(self, value: str) -> 'SearchFilter':
+        self._duration = self.__lookup(durations, value, 'duration')
+        return self
+
+    def sortBy(self, value: str) -> 'SearchFilter':
+        self._sortBy = self.__lookup(sortOrders, value, 'sort order')
+        return self
+
+    def features(self, *values: str) -> 'SearchFilter':
+        for value in values:
+            field = self.__lookup(features, value, 'feature')
+            if field not in self._features:
+                self._features.append(field)
+        return self
+
+    def build(self) -> str:
+        '''Returns the encoded value, which can be passed as `searchPreferences` to `CustomSearch`.
+        '''
+        filters = b''
+        if self._uploadDate is not None:
+            filters += _encodeVarintField(uploadDateField, self._uploadDate)
+        if self._type is not None:
+            filters += _encodeVarintField(typeField, self._type)
+        if self._duration is not None:
+            filters += _encodeVarintField(durationField, self._duration)
+        for field in sorted(self._features):
+            filters += _encodeVarintField(field, 1)
+        message = b''
+        if self._sortBy is not None:
+            message += _encodeVarintField(sortOrderField, self._sortBy)
+        if filters:
+            message += _encodeMessageField(filtersField, filters)
+        return quote(base64.b64encode(message).decode('utf_8'), safe='')
+
+    def __str__(self) -> str:
+        return self.build()
+
+    def __lookup(self, table: dict, value: str, name: str) -> int:
+        if value not in table:
+            raise Exception(f'ERROR: Invalid {name} "{value}". Expected one of {", ".join(table.keys())}.')
+        return table[value]
@@ -5,7 +5,7 @@ import urllib.parse
 import re
 
 from youtubesearchpython.core.constants import ResultMode
-from youtubesearchpython.core.video import VideoCore
+from youtubesearchpython.core.video import PlayerClientSelector, VideoCore
 from youtubesearchpython.core.componenthandler import getValue
 from youtubesearchpython.core.requests import RequestCore
 
@@ -25,9 +25,10 @@ class StreamURLFetcherCore(RequestCore):
     '''
     Overrided parent's constructor.
     '''
-    def __init__(self):
+    def __init__(self, clientSelector: PlayerClientSelector = None):
         if isYtDLPinstalled:
             super().__init__()
+            self.clientSelector = clientSelector
             self._js_url = None
             self._js = None
             #self.ytdlp = YoutubeBaseInfoExtractor()
@@ -49,10 +50,13 @@ class StreamURLFetcherCore(RequestCore):
 
         self.video_id = videoFormats["id"]
         if not videoFormats["streamingData"]:
-            # Video is age-restricted. Try to retrieve it using ANDROID_EMBED client and override old response.
-            # This works most time.
+            # Video is age-restricted. Try to retrieve it using TV_EMBED client and override old response.
+            # This works most time. With a client selector, the clients, which worked best so far, are tried instead.
             vc = VideoCore(self.video_id, None, ResultMode.dict, None, False, overridedClient="TV_EMBED")
-            vc.sync_create()
+            if self.clientSelector is not None:
+                vc.sync_create(self.clientSelector, "ageRestricted")
+            else:
+                vc.sync_create()
             videoFormats = vc.result
             if not videoFormats["streamingData"]:
                 # Video is:
@@ -1,3 +1,18 @@
+from youtubesearchpython.core.componenthandler import uploadsPlaylistId
+
+
+''' Only the helpers are exported by `from youtubesearchpython.core.utils import *`. '''
+__all__ = ['playlist_from_channel_id']
+
+
 def playlist_from_channel_id(channel_id: str) -> str:
-    list_id = "UU" + channel_id[2:]
-    return f"https://www.youtube.com/playlist?list={list_id}"
+    '''Returns the link of the playlist of all uploads of a channel, newest first.
+
+    Accepts a channel ID starting with "UC" or a youtube.com/channel/ link. Anything else, like a handle or a custom URL,
+    raises an exception instead of building the link of a playlist which does not exist.
+
+    Examples:
+        >>> playlist_from_channel_id("UC_aEa8K-EOJ3D6gOs7HcyNg")
+        'https://www.youtube.com/playlist?list=UU_aEa8K-EOJ3D6gOs7HcyNg'
+    '''
+    return f"https://www.youtube.com/playlist?list={uploadsPlaylistId(channel_id)}"
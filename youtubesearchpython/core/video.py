@@ -1,11 +1,18 @@
+import asyncio
 import copy
 import json
-from typing import Union, List
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Union
+
+import httpx
 from urllib.parse import urlencode
 
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.requests import RequestCore
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
+from youtubesearchpython.core.videocache import VideoCache
 
 
 CLIENTS = {
@@ -51,9 +58,102 @@ CLIENTS = {
     }
 }
 
+''' Parts of the player response used by `getInfo` & for the upload date, requested as a partial response. '''
+infoFields = 'videoDetails,microformat'
+infoKeyPattern = re.compile(r'"(videoDetails|microformat)"\s*:\s*')
+jsonDecoder = json.JSONDecoder()
+''' Parts of the player response needed to notice a live stream starting or ending. '''
+liveStatusFields = 'videoDetails(videoId,isLiveContent,lengthSeconds,viewCount)'
+
+
+def liveStatus(responseSource: dict) -> dict:
+    if getValue(responseSource, ['videoDetails']) is None:
+        raise Exception('ERROR: Video is unavailable.')
+    isLiveContent = getValue(responseSource, ['videoDetails', 'isLiveContent'])
+    lengthSeconds = getValue(responseSource, ['videoDetails', 'lengthSeconds'])
+    viewCount = getValue(responseSource, ['videoDetails', 'viewCount'])
+    return {
+        'isLiveContent': isLiveContent,
+        'isLiveNow': bool(isLiveContent) and lengthSeconds == "0",
+        'lengthSeconds': lengthSeconds,
+        'viewCount': int(viewCount) if viewCount is not None and viewCount.isdigit() else None,
+    }
+
+
+''' Fields of the result returned by `getInfo`, in order. '''
+infoComponentFields = [
+    'id', 'title', 'duration', 'viewCount', 'thumbnails', 'description', 'channel', 'allowRatings', 'averageRating',
+    'keywords', 'isLiveContent', 'publishDate', 'uploadDate', 'isFamilySafe', 'category', 'isLiveNow', 'link',
+]
+
+
+def parseInfoSource(response: str) -> dict:
+    '''Parses only `videoDetails` & `microformat` out of a player response, skipping `streamingData` which is most of it.
+
+    Falls back to parsing the complete response when they cannot be found.
+    '''
+    source = {}
+    for match in infoKeyPattern.finditer(response):
+        key = match.group(1)
+        if key in source:
+            continue
+        try:
+            source[key], _ = jsonDecoder.raw_decode(response, match.end())
+        except ValueError:
+            break
+        if len(source) == 2:
+            break
+    videoDetails = source.get('videoDetails')
+    if not isinstance(videoDetails, dict) or 'videoId' not in videoDetails:
+        try:
+            return json.loads(response)
+        except Exception:
+            raise Exception('ERROR: Could not parse YouTube response.')
+    return source
+
+
+class PlayerClientSelector:
+    '''Chooses which of the `CLIENTS` to request the player endpoint with.
+
+    Tracks how often each client returned usable `streamingData` & tries the most successful one first,
+    separately for every content class e.g. 'music' or 'ageRestricted' given by the caller.
+    With `raceWidth` greater than 1, that many clients are requested at once & the first usable response is kept.
+
+    Args:
+        clients (List[str], optional): Names of `CLIENTS` to use, in the order preferred before anything is learnt. Defaults to ANDROID, TV_EMBED, ANDROID_EMBED.
+        raceWidth (int, optional): Number of clients requested at once. Defaults to 1.
+    '''
+
+    def __init__(self, clients: List[str] = None, raceWidth: int = 1):
+        self.clients = clients if clients else ["ANDROID", "TV_EMBED", "ANDROID_EMBED"]
+        self.raceWidth = max(1, raceWidth)
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def order(self, contentClass: str = None) -> List[str]:
+        with self._lock:
+            stats = self.stats.get(contentClass, {})
+            return sorted(self.clients, key=lambda client: -self.__successRate(stats.get(client, (0, 0))))
+
+    def record(self, client: str, success: bool, contentClass: str = None) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(contentClass, {})
+            attempts, successes = stats.get(client, (0, 0))
+            stats[client] = (attempts + 1, successes + (1 if success else 0))
+
+    def successRates(self, contentClass: str = None) -> Dict[str, float]:
+        with self._lock:
+            stats = self.stats.get(contentClass, {})
+            return {client: self.__successRate(stats.get(client, (0, 0))) for client in self.clients}
+
+    def __successRate(self, stats: Tuple[int, int]) -> float:
+        attempts, successes = stats
+        ''' Smoothed, so clients that were never tried rank between working & failing ones. '''
+        return (successes + 1) / (attempts + 2)
+
 
 class VideoCore(RequestCore):
-    def __init__(self, videoLink: str, componentMode: str, resultMode: int, timeout: int, enableHTML: bool, overridedClient: str = "ANDROID"):
+    def __init__(self, videoLink: str, componentMode: str, resultMode: int, timeout: int, enableHTML: bool, overridedClient: str = "ANDROID", cache: VideoCache = None, freshFields: List[str] = None):
         super().__init__()
         self.timeout = timeout
         self.resultMode = resultMode
@@ -61,27 +161,79 @@ class VideoCore(RequestCore):
         self.videoLink = videoLink
         self.enableHTML = enableHTML
         self.overridedClient = overridedClient
+        self.cache = cache
+        self.freshFields = freshFields
     
     # We call this when we use only HTML
     def post_request_only_html_processing(self):
         self.__getVideoComponent(self.componentMode)
         self.result = self.__videoComponent
+        self.__storeInCache()
 
     def post_request_processing(self):
         self.__parseSource()
         self.__getVideoComponent(self.componentMode)
         self.result = self.__videoComponent
+        self.__storeInCache()
 
-    def prepare_innertube_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/player' + "?" + urlencode({
+    # We call this when the response was already parsed while choosing the client
+    def post_parsed_request_processing(self):
+        self.__getVideoComponent(self.componentMode)
+        self.result = self.__videoComponent
+        self.__storeInCache()
+
+    def __cacheFields(self) -> Tuple[List[str], List[str]]:
+        # Returns the fields of the result & those of them, which this request is the source of.
+        fields = []
+        if self.componentMode in ['getInfo', None]:
+            fields.extend(infoComponentFields)
+        if self.componentMode in ['getFormats', None]:
+            fields.append('streamingData')
+        if self.enableHTML:
+            return fields, fields
+        # Without the MWEB response, the upload date is usually missing.
+        return fields, [field for field in fields if field not in ['publishDate', 'uploadDate']]
+
+    def load_from_cache(self) -> bool:
+        if self.cache is None:
+            return False
+        videoId = getVideoId(self.videoLink)
+        fields, storedFields = self.__cacheFields()
+        freshFields = storedFields if self.freshFields is None else [field for field in self.freshFields if field in fields]
+        component = self.cache.get(videoId, storedFields, freshFields)
+        if component is None:
+            return False
+        self.__videoComponent = {field: component[field] if field in component else self.cache.peek(videoId, field) for field in fields}
+        self.result = self.__videoComponent
+        return True
+
+    def __storeInCache(self) -> None:
+        if self.cache is None:
+            return
+        self.cache.set(getVideoId(self.videoLink), self.__videoComponent, self.__cacheFields()[1])
+
+    def player_url(self, fields: str = None) -> str:
+        query = {
             'key': searchKey,
             'contentCheckOk': True,
             'racyCheckOk': True,
             "videoId": getVideoId(self.videoLink)
-        })
+        }
+        if fields is not None:
+            query['fields'] = fields
+        return 'https://www.youtube.com/youtubei/v1/player' + "?" + urlencode(query)
+
+    def prepare_innertube_request(self):
+        self.url = self.player_url()
         self.data = copy.deepcopy(CLIENTS[self.overridedClient])
 
-    async def async_create(self):
+    async def async_create(self, selector: PlayerClientSelector = None, contentClass: str = None):
+        if self.load_from_cache():
+            return
+        if selector is not None:
+            await self.async_request_with_selector(selector, contentClass)
+            self.post_parsed_request_processing()
+            return
         self.prepare_innertube_request()
         response = await self.asyncPostRequest()
         self.response = response.text
@@ -90,7 +242,13 @@ class VideoCore(RequestCore):
         else:
             raise Exception('ERROR: Invalid status code.')
 
-    def sync_create(self):
+    def sync_create(self, selector: PlayerClientSelector = None, contentClass: str = None):
+        if self.load_from_cache():
+            return
+        if selector is not None:
+            self.sync_request_with_selector(selector, contentClass)
+            self.post_parsed_request_processing()
+            return
         self.prepare_innertube_request()
         response = self.syncPostRequest()
         self.response = response.text
@@ -100,25 +258,179 @@ class VideoCore(RequestCore):
             raise Exception('ERROR: Invalid status code.')
 
     def prepare_html_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/player' + "?" + urlencode({
-            'key': searchKey,
-            'contentCheckOk': True,
-            'racyCheckOk': True,
-            "videoId": getVideoId(self.videoLink)
-        })
+        self.url = self.player_url()
         self.data = CLIENTS["MWEB"]
 
+    def client_request(self, clientName: str) -> RequestCore:
+        # A separate request, so it can be sent while this one is busy with another request.
+        request = RequestCore()
+        request.timeout = self.timeout
+        request.client = self.client
+        request.asyncClient = self.asyncClient
+        request.url = self.player_url()
+        request.data = copy.deepcopy(CLIENTS[clientName])
+        return request
+
+    def sync_partial_response(self, clientName: str, fields: str) -> dict:
+        request = self.client_request(clientName)
+        request.url = self.player_url(fields)
+        response = request.syncPostRequest()
+        if response.status_code != 200:
+            # The partial response was refused, ask for the complete one.
+            request.url = self.player_url()
+            response = request.syncPostRequest()
+        return parseInfoSource(response.text)
+
+    async def async_partial_response(self, clientName: str, fields: str) -> dict:
+        request = self.client_request(clientName)
+        request.url = self.player_url(fields)
+        response = await request.asyncPostRequest()
+        if response.status_code != 200:
+            request.url = self.player_url()
+            response = await request.asyncPostRequest()
+        return parseInfoSource(response.text)
+
+    # Only videoDetails & microformat are read from the MWEB response, so streamingData is not requested.
+    def sync_html_response(self) -> dict:
+        return self.sync_partial_response("MWEB", infoFields)
+
+    async def async_html_response(self) -> dict:
+        return await self.async_partial_response("MWEB", infoFields)
+
+    def sync_live_status(self) -> dict:
+        return liveStatus(self.sync_partial_response("ANDROID", liveStatusFields))
+
+    async def async_live_status(self) -> dict:
+        return liveStatus(await self.async_partial_response("ANDROID", liveStatusFields))
+
+    def __usable(self, responseSource: dict) -> bool:
+        if self.componentMode == "getInfo":
+            return getValue(responseSource, ["videoDetails"]) is not None
+        return getValue(responseSource, ["streamingData"]) is not None
+
+    def __checkResponse(self, clientName: str, response: httpx.Response, selector: PlayerClientSelector, contentClass: str) -> Optional[dict]:
+        responseSource = None
+        if response.status_code == 200:
+            try:
+                responseSource = json.loads(response.text)
+            except:
+                pass
+        usable = responseSource is not None and self.__usable(responseSource)
+        selector.record(clientName, usable, contentClass)
+        return responseSource
+
+    def __acceptResponse(self, clientName: str, response: httpx.Response, responseSource: dict) -> None:
+        self.overridedClient = clientName
+        self.response = response.text
+        self.responseSource = responseSource
+
+    def sync_request_with_selector(self, selector: PlayerClientSelector, contentClass: str = None):
+        # Clients are tried in order of their success rate, `raceWidth` of them at once.
+        # If none of them is usable, the first valid response is kept, like with a single client.
+        fallback = None
+        order = selector.order(contentClass)
+        for start in range(0, len(order), selector.raceWidth):
+            clients = order[start:start + selector.raceWidth]
+            executor = ThreadPoolExecutor(max_workers=len(clients))
+            futures = {executor.submit(self.client_request(clientName).syncPostRequest): clientName for clientName in clients}
+            try:
+                for future in as_completed(futures):
+                    clientName = futures[future]
+                    try:
+                        response = future.result()
+                    except:
+                        selector.record(clientName, False, contentClass)
+                        continue
+                    responseSource = self.__checkResponse(clientName, response, selector, contentClass)
+                    if responseSource is None:
+                        continue
+                    if self.__usable(responseSource):
+                        self.__acceptResponse(clientName, response, responseSource)
+                        return
+                    if fallback is None:
+                        fallback = (clientName, response, responseSource)
+            finally:
+                executor.shutdown(wait=False)
+        if fallback is None:
+            raise Exception('ERROR: Invalid status code.')
+        self.__acceptResponse(*fallback)
+
+    async def async_request_with_selector(self, selector: PlayerClientSelector, contentClass: str = None):
+        fallback = None
+        order = selector.order(contentClass)
+        for start in range(0, len(order), selector.raceWidth):
+            tasks = {asyncio.ensure_future(self.client_request(clientName).asyncPostRequest()): clientName for clientName in order[start:start + selector.raceWidth]}
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        clientName = tasks[task]
+                        if task.exception() is not None:
+                            selector.record(clientName, False, contentClass)
+                            continue
+                        response = task.result()
+                        responseSource = self.__checkResponse(clientName, response, selector, contentClass)
+                        if responseSource is None:
+                            continue
+                        if self.__usable(responseSource):
+                            self.__acceptResponse(clientName, response, responseSource)
+                            return
+                        if fallback is None:
+                            fallback = (clientName, response, responseSource)
+            finally:
+                for task in pending:
+                    task.cancel()
+        if fallback is None:
+            raise Exception('ERROR: Invalid status code.')
+        self.__acceptResponse(*fallback)
+
+    def sync_create_with_html(self, selector: PlayerClientSelector = None, contentClass: str = None):
+        if self.load_from_cache():
+            return
+        # The MWEB request (upload date) & the player request are independent, so they are sent concurrently.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            htmlResponse = executor.submit(self.sync_html_response)
+            if selector is not None:
+                self.sync_request_with_selector(selector, contentClass)
+            else:
+                self.prepare_innertube_request()
+                response = self.syncPostRequest()
+            self.HTMLresponseSource = htmlResponse.result()
+        if selector is not None:
+            self.post_parsed_request_processing()
+            return
+        self.response = response.text
+        if response.status_code == 200:
+            self.post_request_processing()
+        else:
+            raise Exception('ERROR: Invalid status code.')
+
+    async def async_create_with_html(self, selector: PlayerClientSelector = None, contentClass: str = None):
+        if self.load_from_cache():
+            return
+        if selector is not None:
+            self.HTMLresponseSource, _ = await asyncio.gather(self.async_html_response(), self.async_request_with_selector(selector, contentClass))
+            self.post_parsed_request_processing()
+            return
+        self.prepare_innertube_request()
+        self.HTMLresponseSource, response = await asyncio.gather(self.async_html_response(), self.asyncPostRequest())
+        self.response = response.text
+        if response.status_code == 200:
+            self.post_request_processing()
+        else:
+            raise Exception('ERROR: Invalid status code.')
+
     def sync_html_create(self):
-        self.prepare_html_request()
-        response = self.syncPostRequest()
-        self.HTMLresponseSource = response.json()
+        self.HTMLresponseSource = self.sync_html_response()
 
     async def async_html_create(self):
-        self.prepare_html_request()
-        response = await self.asyncPostRequest()
-        self.HTMLresponseSource = response.json()
+        self.HTMLresponseSource = await self.async_html_response()
 
     def __parseSource(self) -> None:
+        if self.componentMode == "getInfo":
+            self.responseSource = parseInfoSource(self.response)
+            return
         try:
             self.responseSource = json.loads(self.response)
         except Exception as e:
@@ -0,0 +1,108 @@
+import collections
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+''' Fields of a video, which almost never change. '''
+stableFields = [
+    'id', 'title', 'thumbnails', 'description', 'channel', 'allowRatings', 'averageRating', 'keywords',
+    'isLiveContent', 'publishDate', 'uploadDate', 'isFamilySafe', 'category', 'link',
+]
+''' Fields of a video, which change often. `duration` is only known once a live stream has ended. '''
+volatileFields = ['duration', 'viewCount', 'isLiveNow', 'streamingData']
+
+
+class VideoCache:
+    '''Caches parsed video results field by field, so repeated requests for the same video don't hit YouTube again.
+
+    Stable fields like title, channel, keywords, publishDate or category are kept fresh for `stableTtl` seconds,
+    volatile fields like viewCount, isLiveNow or streamingData only for `volatileTtl` seconds.
+    A request is only sent when one of the fields that should be fresh is stale or missing.
+
+    Cached values are shared between results & should be treated as read-only.
+
+    Args:
+        stableTtl (int, optional): Seconds for which stable fields are fresh. Defaults to 86400.
+        volatileTtl (int, optional): Seconds for which volatile fields are fresh. Defaults to 60.
+        maxSize (int, optional): Maximum number of cached videos. Least recently used videos are evicted first. Defaults to 4096.
+        fieldTtls (Dict[str, int], optional): Seconds for which the given fields are fresh, overriding the defaults above.
+
+    Examples:
+        Pass the same cache to every request, which should share the results.
+
+        >>> cache = VideoCache(stableTtl = 86400, volatileTtl = 60)
+        >>> video = Video.getInfo('E07s5ZYygMg', cache = cache)
+        >>> video = Video.getInfo('E07s5ZYygMg', cache = cache, fields = ['title', 'channel'])
+    '''
+
+    def __init__(self, stableTtl: int = 86400, volatileTtl: int = 60, maxSize: int = 4096, fieldTtls: Dict[str, int] = None):
+        self.maxSize = maxSize
+        self.ttls = dict.fromkeys(stableFields, stableTtl)
+        self.ttls.update(dict.fromkeys(volatileFields, volatileTtl))
+        if fieldTtls:
+            self.ttls.update(fieldTtls)
+        self.volatileTtl = volatileTtl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, videoId: str, fields: Iterable[str], freshFields: Optional[Iterable[str]] = None) -> Optional[dict]:
+        '''Returns the cached `fields` of the video, or None if one of them is missing or one of `freshFields` is stale.
+
+        `freshFields` defaults to all of `fields`.
+        '''
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(videoId)
+            if entry is None:
+                return None
+            fields = list(fields)
+            for field in fields if freshFields is None else freshFields:
+                if field not in entry or now - entry[field][1] > self.ttls.get(field, self.volatileTtl):
+                    return None
+            component = {}
+            for field in fields:
+                if field not in entry:
+                    return None
+                component[field] = entry[field][0]
+            self._entries.move_to_end(videoId)
+            return component
+
+    def peek(self, videoId: str, field: str) -> Optional[object]:
+        '''Returns the cached value of a single field regardless of its age, or None.
+        '''
+        with self._lock:
+            entry = self._entries.get(videoId)
+            if entry is None or field not in entry:
+                return None
+            return entry[field][0]
+
+    def set(self, videoId: str, component: dict, fields: Iterable[str]) -> None:
+        '''Stores `fields` of the parsed `component`, keeping other cached fields of the video.
+        '''
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.setdefault(videoId, {})
+            for field in fields:
+                if field in component:
+                    entry[field] = (component[field], now)
+            self._entries.move_to_end(videoId)
+            while len(self._entries) > self.maxSize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, videoId: str, fields: List[str] = None) -> None:
+        '''Drops the given fields of the video, or all of them.
+        '''
+        with self._lock:
+            entry = self._entries.get(videoId)
+            if entry is None:
+                return
+            if fields is None:
+                del self._entries[videoId]
+                return
+            for field in fields:
+                entry.pop(field, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -88,6 +88,7 @@ class ComponentHandler:
     
     def _getChannelSearchComponent(self, elements: list) -> list:
         channelsearch = []
+        self.continuationKey = None
         for element in elements:
             responsetype = None
 
@@ -105,8 +106,7 @@ class ComponentHandler:
                 else:
                     raise Exception(f'Unexpected first_content {first_content}')
             elif 'continuationItemRenderer' in element:
-                # for endless scrolling, not needed here
-                # TODO: Implement endless scrolling
+                self.continuationKey = self._getValue(element, ['continuationItemRenderer', 'continuationEndpoint', 'continuationCommand', 'token'])
                 continue
             else:
                 raise Exception(f'Unexpected element {element}')
@@ -1,6 +1,10 @@
+from typing import Iterator, List, Tuple
+
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.core.searchcache import SearchCache
 from youtubesearchpython.core.channelsearch import ChannelSearchCore
+from youtubesearchpython.core.multisearch import MultiSearchCore
 
 
 class Search(SearchCore):
@@ -11,6 +15,7 @@ class Search(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -68,9 +73,9 @@ class Search(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, cache: SearchCache = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, None, timeout)
+        super().__init__(query, limit, language, region, None, timeout, cache)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -85,6 +90,7 @@ class VideosSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -142,9 +148,9 @@ class VideosSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, cache: SearchCache = None):
         self.searchMode = (True, False, False)
-        super().__init__(query, limit, language, region, SearchMode.videos, timeout)
+        super().__init__(query, limit, language, region, SearchMode.videos, timeout, cache)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -160,6 +166,7 @@ class ChannelsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -192,9 +199,9 @@ class ChannelsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, cache: SearchCache = None):
         self.searchMode = (False, True, False)
-        super().__init__(query, limit, language, region, SearchMode.channels, timeout)
+        super().__init__(query, limit, language, region, SearchMode.channels, timeout, cache)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -210,6 +217,7 @@ class PlaylistsSearch(SearchCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
 
     Examples:
         Calling `result` method gives the search result.
@@ -255,9 +263,9 @@ class PlaylistsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, cache: SearchCache = None):
         self.searchMode = (False, False, True)
-        super().__init__(query, limit, language, region, SearchMode.playlists, timeout)
+        super().__init__(query, limit, language, region, SearchMode.playlists, timeout, cache)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -341,6 +349,26 @@ class ChannelSearch(ChannelSearchCore):
         super().__init__(query, language, region, searchPreferences, browseId, timeout)
         self.sync_create()
 
+    @staticmethod
+    def iter(query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: int = None, prefetch: bool = True) -> Iterator[dict]:
+        '''Yields every result of the search in the channel, page by page as the pages are fetched.
+
+        Unlike `result`, which only holds the first page, the pages after it are requested as the results are consumed.
+        Only the current page is kept in memory & with `prefetch`, the next page is requested while the current one is being consumed.
+
+        Args:
+            query (str): Sets the search query.
+            browseId (str): Channel ID
+            prefetch (bool, optional): Requests the next page in the background. Defaults to True.
+
+        Examples:
+            >>> for video in ChannelSearch.iter('Watermelon Sugar', "UCZFWPqqPkFlNwIxcpsLOwew"):
+            >>>     print(video["id"], video["title"])
+        '''
+        search = ChannelSearchCore(query, language, region, searchPreferences, browseId, timeout)
+        for page in search._syncPages(prefetch):
+            yield from page
+
 
 class CustomSearch(SearchCore):
     '''Performs custom search in YouTube with search filters or sorting orders. 
@@ -352,15 +380,17 @@ class CustomSearch(SearchCore):
         4 - VideoSortOrder.viewCount
 
     There are many other to use.
+    Several filters & a sorting order can be combined into one value using `SearchFilter`, which can also be passed as `searchPreferences` directly.
     The value of `sp` parameter in the YouTube search query can be used as a search filter e.g. 
     `EgQIBRAB` from https://www.youtube.com/results?search_query=NoCopyrightSounds&sp=EgQIBRAB can be passed as `searchPreferences`, to get videos, which are uploaded this year.
 
     Args:
         query (str): Sets the search query.
-        searchPreferences (str): Sets the `sp` query parameter in the YouTube search request.
+        searchPreferences (Union[str, SearchFilter]): Sets the `sp` query parameter in the YouTube search request.
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        cache (SearchCache, optional): Shares parsed results between searches with the same query. Defaults to None.
     
     Examples:
         Calling `result` method gives the search result.
@@ -418,11 +448,54 @@ class CustomSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None):
+    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: int = None, cache: SearchCache = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, searchPreferences, timeout)
+        super().__init__(query, limit, language, region, searchPreferences, timeout, cache)
         self.sync_create()
         self._getComponents(*self.searchMode)
     
     def next(self):
         self._next()
+
+
+class MultiSearch(MultiSearchCore):
+    '''Performs the same search in many languages & regions concurrently, over a shared connection pool.
+
+    Results are merged by their ID. Each result appears once, with its position in every language & region in `positions`.
+    Results are ordered by their combined ranking. Languages & regions, which failed, are listed in `errors`.
+
+    Args:
+        query (str): Sets the search query.
+        locales (List[Tuple[str, str]]): Pairs of language & region to search in e.g. [('en', 'US'), ('de', 'DE')].
+        limit (int, optional): Sets limit to the number of results in each language & region. Defaults to 20.
+        searchPreferences (Union[str, SearchFilter], optional): Sets the `sp` query parameter in the YouTube search request. Defaults to None.
+        concurrency (int, optional): Maximum number of simultaneous requests. Defaults to 10.
+
+    Examples:
+        Calling `result` method gives the merged search result.
+
+        >>> search = MultiSearch('Watermelon Sugar', [('en', 'US'), ('en', 'GB'), ('de', 'DE')], limit = 1)
+        >>> print(search.result())
+        {
+            "result": [
+                {
+                    "type": "video",
+                    "id": "E07s5ZYygMg",
+                    "title": "Harry Styles - Watermelon Sugar (Official Video)",
+                    ...
+                    "positions": {
+                        "en-US": 0,
+                        "en-GB": 0,
+                        "de-DE": 0
+                    }
+                }
+            ],
+            "errors": {}
+        }
+    '''
+    def __init__(self, query: str, locales: List[Tuple[str, str]], limit: int = 20, searchPreferences: str = None, concurrency: int = 10, timeout: int = None):
+        super().__init__(query, locales, limit, searchPreferences, (True, True, True), concurrency, timeout)
+        self._next()
+
+    def next(self) -> bool:
+        return self._next()